@@ -0,0 +1,33 @@
+"""Add restaurants crawl_status and crawl_duration_seconds indexes
+
+Revision ID: 4f8b1e6d2a90
+Revises: 7c2e9a4b1d35
+Create Date: 2026-10-16 03:40:00.000000
+
+Backs the Reports page: counts per crawl_status and the crawl statistics
+aggregated over restaurants with a recorded crawl duration.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "4f8b1e6d2a90"
+down_revision = "7c2e9a4b1d35"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_restaurants_crawl_status", "restaurants", ["crawl_status"])
+    op.create_index(
+        "ix_restaurants_crawl_duration_notnull",
+        "restaurants",
+        ["crawl_duration_seconds"],
+        postgresql_where=sa.text("crawl_duration_seconds IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_restaurants_crawl_duration_notnull", table_name="restaurants")
+    op.drop_index("ix_restaurants_crawl_status", table_name="restaurants")
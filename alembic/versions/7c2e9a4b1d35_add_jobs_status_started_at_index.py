@@ -0,0 +1,29 @@
+"""Add jobs (status, started_at DESC) index
+
+Revision ID: 7c2e9a4b1d35
+Revises: 1cff6e8d6528
+Create Date: 2026-10-16 03:10:00.000000
+
+Backs the Jobs page query: filter by status, order by started_at DESC.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "7c2e9a4b1d35"
+down_revision = "1cff6e8d6528"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_jobs_status_started_at",
+        "jobs",
+        ["status", sa.text("started_at DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_status_started_at", table_name="jobs")
@@ -0,0 +1,26 @@
+"""Add restaurants lower(name) index
+
+Revision ID: 9a3d5c7e1b24
+Revises: 4f8b1e6d2a90
+Create Date: 2026-10-16 04:00:00.000000
+
+Backs resolve_restaurant_by_id_or_name's case-insensitive exact match
+(single-restaurant crawls and CLI lookups).
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "9a3d5c7e1b24"
+down_revision = "4f8b1e6d2a90"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_restaurants_lower_name", "restaurants", [sa.text("lower(name)")])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_restaurants_lower_name", table_name="restaurants")
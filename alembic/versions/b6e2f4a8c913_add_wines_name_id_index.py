@@ -0,0 +1,25 @@
+"""Add wines (name, id) index
+
+Revision ID: b6e2f4a8c913
+Revises: 9a3d5c7e1b24
+Create Date: 2026-10-16 05:00:00.000000
+
+Backs keyset pagination on the DB manager Wines page
+(ORDER BY name, id with a (name, id) > (...) seek).
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "b6e2f4a8c913"
+down_revision = "9a3d5c7e1b24"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_wines_name_id", "wines", ["name", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_wines_name_id", table_name="wines")
@@ -0,0 +1,36 @@
+"""Add wines trigram search indexes
+
+Revision ID: d3a7c1e9f520
+Revises: b6e2f4a8c913
+Create Date: 2026-10-16 06:00:00.000000
+
+GIN gin_trgm_ops indexes let PostgreSQL answer the DB manager Wines page's
+ILIKE '%term%' filters without a full table scan.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "d3a7c1e9f520"
+down_revision = "b6e2f4a8c913"
+branch_labels = None
+depends_on = None
+
+_COLUMNS = ("name", "winery", "varietal", "wine_type", "country")
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in _COLUMNS:
+        op.create_index(
+            f"ix_wines_{column}_trgm",
+            "wines",
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    for column in _COLUMNS:
+        op.drop_index(f"ix_wines_{column}_trgm", table_name="wines")
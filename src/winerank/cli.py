@@ -404,8 +404,7 @@ def register_wine_list(
 
     console.print(f"[bold blue]Registering wine list for {name} from {path}[/bold blue]")
 
-    raw = path.read_bytes()
-    file_hash = WineListDownloader._compute_hash(raw)
+    file_hash = WineListDownloader._hash_file(path)
 
     try:
         extractor = WineListTextExtractor()
@@ -4,7 +4,7 @@ from __future__ import annotations
 from contextlib import contextmanager
 from typing import Generator, Optional
 
-from sqlalchemy import create_engine, event
+from sqlalchemy import create_engine, event, func
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, Session
 
@@ -27,6 +27,7 @@ def get_engine() -> Engine:
             pool_pre_ping=True,  # Verify connections before using them
             pool_size=5,
             max_overflow=10,
+            pool_recycle=1800,  # Replace connections idle past server/proxy timeouts
         )
     return _engine
 
@@ -107,11 +108,12 @@ def resolve_restaurant_by_id_or_name(
         return None
     with get_session() as session:
         if value.isdigit():
-            return session.query(Restaurant).filter_by(id=int(value)).first()
+            return session.get(Restaurant, int(value))
         q = session.query(Restaurant)
         if site_of_record_id is not None:
             q = q.filter(Restaurant.site_of_record_id == site_of_record_id)
-        rec = q.filter(Restaurant.name.ilike(value)).first()
+        # lower(name) = ... is served by ix_restaurants_lower_name
+        rec = q.filter(func.lower(Restaurant.name) == value.lower()).first()
         if rec:
             return rec
         q = session.query(Restaurant)
@@ -5,6 +5,7 @@ from enum import Enum as PyEnum
 from typing import Optional
 
 from sqlalchemy import (
+    DDL,
     String,
     Text,
     Integer,
@@ -12,6 +13,8 @@ from sqlalchemy import (
     DateTime,
     ForeignKey,
     Enum,
+    Index,
+    event,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
@@ -143,6 +146,18 @@ class Restaurant(Base):
         back_populates="restaurant", cascade="all, delete-orphan"
     )
 
+    __table_args__ = (
+        # Single-restaurant crawls / CLI lookups: case-insensitive exact name match
+        Index("ix_restaurants_lower_name", func.lower(name)),
+        # Reports page: per-status counts and crawl stats over crawled restaurants
+        Index("ix_restaurants_crawl_status", crawl_status),
+        Index(
+            "ix_restaurants_crawl_duration_notnull",
+            crawl_duration_seconds,
+            postgresql_where=crawl_duration_seconds.isnot(None),
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<Restaurant(id={self.id}, name='{self.name}', status={self.crawl_status})>"
 
@@ -197,6 +212,24 @@ class WineList(Base):
         return f"<WineList(id={self.id}, restaurant_id={self.restaurant_id}, wines={self.wine_count})>"
 
 
+# Trigram GIN indexes serve leading-wildcard ILIKE patterns on PostgreSQL;
+# other backends keep scanning.
+def _trigram_index(column: str) -> Index:
+    return Index(
+        f"ix_wines_{column}_trgm",
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column: "gin_trgm_ops"},
+    ).ddl_if(dialect="postgresql")
+
+
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
 class Wine(Base):
     """Wine entry parsed from a wine list."""
 
@@ -233,6 +266,16 @@ class Wine(Base):
     # Relationships
     wine_list: Mapped["WineList"] = relationship(back_populates="wines")
 
+    __table_args__ = (
+        # Wines page: keyset pagination over (name, id)
+        Index("ix_wines_name_id", name, id),
+        # Wines page: ILIKE '%term%' search
+        *(
+            _trigram_index(column)
+            for column in ("name", "winery", "varietal", "wine_type", "country")
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<Wine(id={self.id}, name='{self.name}', winery='{self.winery}', vintage='{self.vintage}')>"
 
@@ -290,5 +333,10 @@ class Job(Base):
         back_populates="jobs"
     )
 
+    __table_args__ = (
+        # Jobs page: filter by status, newest first
+        Index("ix_jobs_status_started_at", status, started_at.desc()),
+    )
+
     def __repr__(self) -> str:
         return f"<Job(id={self.id}, type='{self.job_type}', status={self.status}, progress={self.restaurants_processed}/{self.restaurants_found})>"
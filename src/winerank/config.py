@@ -1,6 +1,7 @@
 """Configuration management using pydantic-settings."""
 from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -43,6 +44,10 @@ class Settings(BaseSettings):
         default="data/downloads",
         description="Directory for downloaded wine lists",
     )
+    listing_retries: int = Field(
+        default=2,
+        description="Backoff retries for rate-limited/transient listing page errors before counting a failure",
+    )
     use_binwise_search: bool = Field(
         default=True,
         description="Enable BinWise fallback search via Google when no wine list found",
@@ -83,6 +88,18 @@ class Settings(BaseSettings):
         default=30000,
         description="Browser timeout in milliseconds",
     )
+    block_images: bool = Field(
+        default=True,
+        description="Abort image/media/font and ad/tracker requests in the crawler browser",
+    )
+    restaurants_per_context: int = Field(
+        default=20,
+        description="Recycle the browser context after this many restaurants (0 disables)",
+    )
+    cdp_endpoint: Optional[str] = Field(
+        default=None,
+        description="CDP endpoint of a long-lived Chromium to connect to instead of launching one",
+    )
 
     @property
     def download_path(self) -> Path:
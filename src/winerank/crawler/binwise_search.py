@@ -55,7 +55,7 @@ def _validate_binwise_result(url: str, restaurant_name: str) -> bool:
             resp = client.get(url)
             resp.raise_for_status()
             html = resp.text
-    except Exception as e:
+    except httpx.HTTPError as e:
         logger.debug("Could not fetch BinWise URL %s: %s", url, e)
         return False
 
@@ -15,12 +15,38 @@ from winerank.config import get_settings
 logger = logging.getLogger(__name__)
 
 # Patterns that indicate a JS-rendered SPA shell with no real content
-_SPA_SHELL_INDICATORS = [
+_SPA_SHELL_INDICATORS = (
     re.compile(r'<div\s+id=["\']root["\']\s*>\s*</div>', re.IGNORECASE),
     re.compile(r'<div\s+id=["\']app["\']\s*>\s*</div>', re.IGNORECASE),
     re.compile(r'<noscript>.*?enable JavaScript.*?</noscript>', re.IGNORECASE | re.DOTALL),
     re.compile(r'webpackJsonp', re.IGNORECASE),
-]
+)
+
+
+# One client for every WineListDownloader (the crawler builds one per
+# restaurant), so keep-alive connections and DNS lookups carry over.
+_http_client: Optional[httpx.Client] = None
+
+
+def _get_http_client() -> httpx.Client:
+    """Return the shared httpx client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.Client(
+            follow_redirects=True,
+            timeout=30.0,
+            headers=WineListDownloader._BROWSER_HEADERS,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+        )
+    return _http_client
+
+
+def close_http_client() -> None:
+    """Close the shared httpx client (a later download opens a new one)."""
+    global _http_client
+    if _http_client is not None:
+        _http_client.close()
+        _http_client = None
 
 
 class WineListDownloader:
@@ -137,21 +163,23 @@ class WineListDownloader:
         noscript tags asking to enable JavaScript, and very little visible
         text content compared to the overall HTML size.
         """
-        indicator_hits = sum(
-            1 for pattern in _SPA_SHELL_INDICATORS if pattern.search(html_text)
-        )
-        if indicator_hits >= 2:
-            return True
+        indicator_hits = 0
+        for pattern in _SPA_SHELL_INDICATORS:
+            if pattern.search(html_text):
+                indicator_hits += 1
+                if indicator_hits >= 2:
+                    return True
+
+        # Small documents never trip the text heuristic below; skip the parse
+        if len(html_text) <= 500:
+            return False
 
         # Heuristic: extract visible text and check if it's suspiciously short
-        soup = BeautifulSoup(html_text, 'html.parser')
+        soup = BeautifulSoup(html_text, 'lxml')
         for tag in soup(["script", "style", "noscript"]):
             tag.decompose()
         visible_text = soup.get_text(separator=' ', strip=True)
-        if len(html_text) > 500 and len(visible_text) < 100:
-            return True
-
-        return False
+        return len(visible_text) < 100
 
     # Browser-like headers for httpx requests
     _BROWSER_HEADERS = {
@@ -173,14 +201,9 @@ class WineListDownloader:
         with cookies, referrer, and a genuine User-Agent.
         """
         try:
-            with httpx.Client(
-                follow_redirects=True,
-                timeout=30.0,
-                headers=self._BROWSER_HEADERS,
-            ) as client:
-                response = client.get(url)
-                response.raise_for_status()
-                return response.content, response.headers.get("content-type", "").lower()
+            response = _get_http_client().get(url)
+            response.raise_for_status()
+            return response.content, response.headers.get("content-type", "").lower()
         except httpx.HTTPStatusError as exc:
             if exc.response.status_code not in (401, 403):
                 raise
@@ -306,7 +329,7 @@ class WineListDownloader:
 
     # Labels for tabs/buttons that expand a wine-list SPA to full content.
     # Checked in order; first visible match is clicked. English first, then French, then Spanish.
-    _WINE_LIST_TAB_SELECTORS = [
+    _WINE_LIST_TAB_SELECTORS: tuple[str, ...] = (
         'text="Wine List"',
         'text="WINE LIST"',
         'text="Full List"',
@@ -326,7 +349,7 @@ class WineListDownloader:
         'text="Vinos"',
         'text="Carta de bebidas"',
         '.tab-content:has-text("Carta de vinos")',
-    ]
+    )
 
     def _render_spa_with_playwright(self, url: str) -> Optional[str]:
         """Use Playwright to render a JS-heavy SPA and return the DOM HTML.
@@ -386,6 +409,20 @@ class WineListDownloader:
             Hexadecimal hash string
         """
         return hashlib.sha256(content).hexdigest()
+
+    @staticmethod
+    def _hash_file(path: Path) -> str:
+        """
+        Compute SHA-256 hash of a file on disk without reading it into memory.
+
+        Args:
+            path: File to hash
+
+        Returns:
+            Hexadecimal hash string (same as ``_compute_hash`` of its bytes)
+        """
+        with open(path, 'rb') as f:
+            return hashlib.file_digest(f, 'sha256').hexdigest()
     
     def _sanitize_filename(self, filename: str) -> str:
         """
@@ -438,12 +475,7 @@ class WineListDownloader:
                 
                 # Compute hash of existing file
                 try:
-                    if file_path.suffix.lower() == '.pdf':
-                        content = file_path.read_bytes()
-                    else:
-                        content = file_path.read_text(encoding='utf-8').encode('utf-8')
-                    
-                    existing_hash = self._compute_hash(content)
+                    existing_hash = self._hash_file(file_path)
                     if existing_hash == file_hash:
                         return file_path
                 except Exception:
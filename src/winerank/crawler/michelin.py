@@ -13,6 +13,22 @@ from winerank.crawler.restaurant_finder import _get_litellm_completion
 
 logger = logging.getLogger(__name__)
 
+_DIGIT_RE = re.compile(r"\d")
+_RESULT_COUNT_RE = re.compile(r"of\s+([\d,]+)\s+restaurants?", re.I)
+_CITY_ID_SUFFIX_RE = re.compile(r"[_-]\d+$")
+# The "restaurant" path segment, mid-path or at the end of the URL
+_RESTAURANT_SEGMENT_RE = re.compile(r"/restaurant(?:/|$)")
+_PRICE_RE = re.compile(r"\${1,4}")
+# One alternation per tier; group names sort by rank (t0 = strongest)
+_DISTINCTION_RE = re.compile(
+    r"(?P<t0>three michelin stars|3 stars|three stars)"
+    r"|(?P<t1>two michelin stars|2 stars|two stars)"
+    r"|(?P<t2>one michelin star|1 star|one star)"
+    r"|(?P<t3>bib gourmand)",
+    re.IGNORECASE | re.ASCII,
+)
+_DISTINCTION_TIERS = {"t0": "3-stars", "t1": "2-stars", "t2": "1-star", "t3": "bib-gourmand"}
+
 
 def _looks_like_address(text: str) -> bool:
     """True if text looks like an address (contains comma and digits or country-like tokens)."""
@@ -20,7 +36,7 @@ def _looks_like_address(text: str) -> bool:
         return False
     if "," not in text:
         return False
-    if re.search(r"\d", text):
+    if _DIGIT_RE.search(text):
         return True
     # e.g. "Paris, France" or "Copenhagen"
     lower = text.lower()
@@ -107,7 +123,7 @@ class MichelinScraper:
             self.page.wait_for_timeout(2000)
 
             html = self.page.content()
-            soup = BeautifulSoup(html, "html.parser")
+            soup = BeautifulSoup(html, "lxml")
 
             # Find the main results container (not promotional/nearby sections)
             # The actual filtered results are in js-restaurant__list_items
@@ -143,7 +159,7 @@ class MichelinScraper:
             total_restaurants = 0
             total_pages = 1
             text_content = soup.get_text()
-            m = re.search(r"of\s+([\d,]+)\s+restaurants?", text_content, re.I)
+            m = _RESULT_COUNT_RE.search(text_content)
             if m:
                 total_restaurants = int(m.group(1).replace(",", ""))
                 total_pages = max(1, (total_restaurants + 47) // 48)
@@ -179,7 +195,9 @@ class MichelinScraper:
             self.page.wait_for_load_state("networkidle")
 
             html = self.page.content()
-            soup = BeautifulSoup(html, "html.parser")
+            soup = BeautifulSoup(html, "lxml")
+            # Flattened once; distinction and price are keyword scans over it
+            page_text = soup.get_text()
 
             # -- name --
             h1 = soup.find("h1")
@@ -189,7 +207,7 @@ class MichelinScraper:
             website_url = self._extract_website_url(soup)
 
             # -- distinction --
-            distinction = self._extract_distinction(soup)
+            distinction = self._distinction_from_text(page_text)
 
             # -- location from address block on page + LLM parsing --
             address_block = self._extract_address_block(soup)
@@ -218,7 +236,7 @@ class MichelinScraper:
             cuisine = self._extract_cuisine(soup)
 
             # -- price range --
-            price_range = self._extract_price(soup)
+            price_range = self._extract_price(page_text)
 
             return {
                 "name": name,
@@ -245,43 +263,45 @@ class MichelinScraper:
 
     @staticmethod
     def _extract_website_url(soup: BeautifulSoup) -> Optional[str]:
-        """Look for the restaurant's own website link."""
-        # First: explicit "Visit Website" text
-        for a in soup.find_all("a", href=True):
-            text = a.get_text(strip=True)
-            if "Visit Website" in text:
-                href = a["href"]
-                if href.startswith("http") and "guide.michelin.com" not in href:
-                    return href
+        """Look for the restaurant's own website link.
 
-        # Fallback: any external link whose text suggests a website
+        One pass over the external anchors: an explicit "Visit Website" link
+        wins; otherwise the first link whose text suggests a website.
+        """
+        fallback = None
         for a in soup.find_all("a", href=True):
             href = a["href"]
-            if not href.startswith("http"):
+            if not href.startswith("http") or "guide.michelin.com" in href:
                 continue
-            if "guide.michelin.com" in href:
-                continue
-            if href.startswith("tel:") or href.startswith("mailto:"):
-                continue
-            text = a.get_text(strip=True).lower()
-            if any(kw in text for kw in ("website", "visit", "www", "home")):
+            text = a.get_text(strip=True)
+            if "Visit Website" in text:
                 return href
+            if fallback is None and any(
+                kw in text.lower() for kw in ("website", "visit", "www", "home")
+            ):
+                fallback = href
+        return fallback
 
-        return None
+    @classmethod
+    def _extract_distinction(cls, soup: BeautifulSoup) -> str:
+        """Determine Michelin distinction from page text."""
+        return cls._distinction_from_text(soup.get_text())
 
     @staticmethod
-    def _extract_distinction(soup: BeautifulSoup) -> str:
-        """Determine Michelin distinction from page text."""
-        text = soup.get_text().lower()
-        if "three michelin stars" in text or "3 stars" in text or "three stars" in text:
-            return "3-stars"
-        if "two michelin stars" in text or "2 stars" in text or "two stars" in text:
-            return "2-stars"
-        if "one michelin star" in text or "1 star" in text or "one star" in text:
-            return "1-star"
-        if "bib gourmand" in text:
-            return "bib-gourmand"
-        return "selected"
+    def _distinction_from_text(text: str) -> str:
+        """Map page text to a distinction slug by keyword, strongest first.
+
+        A single scan collects every tier mentioned; the highest one wins
+        regardless of where on the page it appears.
+        """
+        best = None
+        for m in _DISTINCTION_RE.finditer(text):
+            tier = m.lastgroup
+            if tier is not None and (best is None or tier < best):
+                best = tier
+                if best == "t0":
+                    break
+        return _DISTINCTION_TIERS[best] if best else "selected"
 
     @staticmethod
     def _extract_address_block(soup: BeautifulSoup) -> Optional[str]:
@@ -320,18 +340,18 @@ class MichelinScraper:
     @classmethod
     def _extract_location_fallback(cls, url: str) -> tuple[Optional[str], Optional[str]]:
         """Derive city/state from the Michelin URL path segments when no address block."""
-        parts = url.rstrip("/").split("/")
-        try:
-            ri = parts.index("restaurant")
-        except ValueError:
+        m = _RESTAURANT_SEGMENT_RE.search(url)
+        if not m:
             return None, None
 
-        city_raw = parts[ri - 1] if ri >= 1 else None
-        state_raw = parts[ri - 2] if ri >= 2 else None
+        # Only the two segments right before "/restaurant" matter
+        parts = url[:m.start()].rsplit("/", 2)
+        city_raw = parts[-1]
+        state_raw = parts[-2] if len(parts) > 1 else None
 
         city = None
         if city_raw:
-            city = re.sub(r"[_-]\d+$", "", city_raw)
+            city = _CITY_ID_SUFFIX_RE.sub("", city_raw)
             city = city.replace("-", " ").replace("_", " ").title()
 
         state = None
@@ -351,10 +371,6 @@ class MichelinScraper:
         return None
 
     @staticmethod
-    def _extract_price(soup: BeautifulSoup) -> Optional[str]:
-        """Find the longest $ string on the page."""
-        text = soup.get_text()
-        m = re.findall(r"\${1,4}", text)
-        if m:
-            return max(m, key=len)
-        return None
+    def _extract_price(text: str) -> Optional[str]:
+        """Find the longest $ string in the page text."""
+        return max(_PRICE_RE.findall(text), key=len, default=None)
@@ -17,7 +17,8 @@ import json
 import logging
 import re
 import unicodedata
-from typing import Optional, Set
+from functools import lru_cache
+from typing import NamedTuple, Optional, Set
 from urllib.parse import unquote, urljoin, urlparse
 
 from bs4 import BeautifulSoup, Tag
@@ -73,6 +74,23 @@ _WINE_PLATFORM_RE = re.compile(
 )
 
 
+class _NormLists(NamedTuple):
+    """Accent-stripped, lowercased keyword lists for one language hint."""
+
+    wine: tuple[str, ...]
+    menu: tuple[str, ...]
+    info: tuple[str, ...]
+    context: tuple[str, ...]
+    pdf: tuple[str, ...]
+
+
+@lru_cache(maxsize=16)
+def _weighted_terms(keywords: tuple[str, ...]) -> tuple[tuple[str, str, int], ...]:
+    """Return ``(keyword, href slug, weight)`` per keyword; earlier ones weigh more."""
+    n = len(keywords)
+    return tuple((kw, kw.replace(" ", "-"), n - rank) for rank, kw in enumerate(keywords))
+
+
 class RestaurantWineListFinder:
     """Find wine lists on restaurant websites using tiered search strategies.
 
@@ -241,17 +259,70 @@ class RestaurantWineListFinder:
         if not s:
             return ""
         s = s.lower().strip()
+        if s.isascii():
+            return s           # most link text and hrefs: nothing to decompose
         nfd = unicodedata.normalize("NFD", s)
         return "".join(c for c in nfd if unicodedata.category(c) != "Mn")
 
-    def _build_norm_lists(self) -> None:
-        """Pre-normalize all effective keyword lists for use in scoring hot paths."""
-        n = self._normalize_text
-        self._norm_wine_keywords:   list[str] = [n(kw) for kw in self._effective_wine_keywords]
-        self._norm_menu_keywords:   list[str] = [n(kw) for kw in self._effective_menu_keywords]
-        self._norm_info_keywords:   list[str] = [n(kw) for kw in self._effective_informational_keywords]
-        self._norm_context_phrases: list[str] = [n(ph) for ph in self._effective_context_phrases]
-        self._norm_pdf_wine_terms:  list[str] = [n(t)  for t  in self._effective_pdf_wine_terms]
+    @classmethod
+    def _keyword_lists_for(
+        cls, lang_hint: str
+    ) -> tuple[list[str], list[str], list[str], list[str], list[str]]:
+        """Return (wine, menu, info, context, pdf) keywords; fr/es are merged with EN."""
+        if lang_hint == "fr":
+            return (
+                cls.WINE_KEYWORDS + cls.WINE_KEYWORDS_FR,
+                cls.MENU_KEYWORDS + cls.MENU_KEYWORDS_FR,
+                cls.INFORMATIONAL_KEYWORDS + cls.INFORMATIONAL_KEYWORDS_FR,
+                cls._CONTEXT_PHRASES + cls._CONTEXT_PHRASES_FR,
+                cls._PDF_WINE_TERMS + cls._PDF_WINE_TERMS_FR,
+            )
+        if lang_hint == "es":
+            return (
+                cls.WINE_KEYWORDS + cls.WINE_KEYWORDS_ES,
+                cls.MENU_KEYWORDS + cls.MENU_KEYWORDS_ES,
+                cls.INFORMATIONAL_KEYWORDS + cls.INFORMATIONAL_KEYWORDS_ES,
+                cls._CONTEXT_PHRASES + cls._CONTEXT_PHRASES_ES,
+                cls._PDF_WINE_TERMS + cls._PDF_WINE_TERMS_ES,
+            )
+        return (
+            cls.WINE_KEYWORDS,
+            cls.MENU_KEYWORDS,
+            cls.INFORMATIONAL_KEYWORDS,
+            cls._CONTEXT_PHRASES,
+            cls._PDF_WINE_TERMS,
+        )
+
+    @classmethod
+    @lru_cache(maxsize=8)
+    def _norm_lists_for(cls, lang_hint: str) -> _NormLists:
+        """Pre-normalized keyword lists for the scoring hot paths, built once per hint."""
+        n = cls._normalize_text
+        return _NormLists(*(
+            tuple(n(kw) for kw in seq) for seq in cls._keyword_lists_for(lang_hint)
+        ))
+
+    def _use_language(self, lang_hint: str) -> None:
+        """Point the effective and normalized keyword lists at *lang_hint*."""
+        if lang_hint not in ("fr", "es"):
+            lang_hint = "en"
+        (
+            self._effective_wine_keywords,
+            self._effective_menu_keywords,
+            self._effective_informational_keywords,
+            self._effective_context_phrases,
+            self._effective_pdf_wine_terms,
+        ) = self._keyword_lists_for(lang_hint)
+        (
+            self._norm_wine_keywords,
+            self._norm_menu_keywords,
+            self._norm_info_keywords,
+            self._norm_context_phrases,
+            self._norm_pdf_wine_terms,
+        ) = self._norm_lists_for(lang_hint)
+        self._wine_terms = _weighted_terms(self._norm_wine_keywords)
+        self._menu_terms = _weighted_terms(self._norm_menu_keywords)
+        self._info_terms = _weighted_terms(self._norm_info_keywords)
 
     def __init__(self, page: Page):
         self.page = page
@@ -260,13 +331,8 @@ class RestaurantWineListFinder:
         self.pages_loaded: int = 0
         self.tokens_used: int = 0
         self._language_hint: str = "en"
-        # Effective keyword lists default to English; overridden in find_wine_list.
-        self._effective_wine_keywords: list[str] = self.WINE_KEYWORDS
-        self._effective_menu_keywords: list[str] = self.MENU_KEYWORDS
-        self._effective_informational_keywords: list[str] = self.INFORMATIONAL_KEYWORDS
-        self._effective_context_phrases: list[str] = self._CONTEXT_PHRASES
-        self._effective_pdf_wine_terms: list[str] = self._PDF_WINE_TERMS
-        self._build_norm_lists()
+        # Keyword lists default to English; overridden in find_wine_list.
+        self._use_language("en")
 
     # ==================================================================
     # Public API
@@ -284,34 +350,10 @@ class RestaurantWineListFinder:
         self.tokens_used = 0
 
         # Set effective keyword lists from language hint (fr/es → merge with EN).
-        # Pre-normalized lists are built once via _build_norm_lists to avoid repeated
-        # normalize calls inside the hot scoring loops.
+        # Normalized lists are cached per hint by _norm_lists_for, so the hot
+        # scoring loops never call normalize and repeat crawls reuse them.
         hint = (language_hint or "").strip().lower()
-        if hint == "fr":
-            raw_wine = self.WINE_KEYWORDS + self.WINE_KEYWORDS_FR
-            raw_menu = self.MENU_KEYWORDS + self.MENU_KEYWORDS_FR
-            raw_info = self.INFORMATIONAL_KEYWORDS + self.INFORMATIONAL_KEYWORDS_FR
-            raw_ctx  = self._CONTEXT_PHRASES + self._CONTEXT_PHRASES_FR
-            raw_pdf  = self._PDF_WINE_TERMS + self._PDF_WINE_TERMS_FR
-        elif hint == "es":
-            raw_wine = self.WINE_KEYWORDS + self.WINE_KEYWORDS_ES
-            raw_menu = self.MENU_KEYWORDS + self.MENU_KEYWORDS_ES
-            raw_info = self.INFORMATIONAL_KEYWORDS + self.INFORMATIONAL_KEYWORDS_ES
-            raw_ctx  = self._CONTEXT_PHRASES + self._CONTEXT_PHRASES_ES
-            raw_pdf  = self._PDF_WINE_TERMS + self._PDF_WINE_TERMS_ES
-        else:
-            raw_wine = self.WINE_KEYWORDS
-            raw_menu = self.MENU_KEYWORDS
-            raw_info = self.INFORMATIONAL_KEYWORDS
-            raw_ctx  = self._CONTEXT_PHRASES
-            raw_pdf  = self._PDF_WINE_TERMS
-
-        self._effective_wine_keywords = raw_wine
-        self._effective_menu_keywords = raw_menu
-        self._effective_informational_keywords = raw_info
-        self._effective_context_phrases = raw_ctx
-        self._effective_pdf_wine_terms = raw_pdf
-        self._build_norm_lists()
+        self._use_language(hint)
 
         self._language_hint = hint or "en"
 
@@ -584,16 +626,12 @@ class RestaurantWineListFinder:
         score = 0
         text_norm = self._normalize_text(text)
         href_norm = self._normalize_text(unquote(href))
-        nwk = self._norm_wine_keywords
-        n = len(nwk)
 
-        for rank, kw_norm in enumerate(nwk):
-            weight = n - rank
+        for kw_norm, slug, weight in self._wine_terms:
             if kw_norm == text_norm:
                 score += weight * 10
             elif kw_norm in text_norm:
                 score += weight * 5
-            slug = kw_norm.replace(" ", "-")
             if slug in href_norm:
                 score += weight * 3
 
@@ -713,45 +751,31 @@ class RestaurantWineListFinder:
         context_norm = self._normalize_text(context)
 
         # --- Wine keywords (high weight) ---
-        nwk = self._norm_wine_keywords
-        n = len(nwk)
-        for rank, kw_norm in enumerate(nwk):
-            weight = n - rank
+        for kw_norm, slug, weight in self._wine_terms:
             if kw_norm == text_norm:
                 score += weight * 10       # exact match on link text
             elif kw_norm in text_norm:
                 score += weight * 5        # partial match on link text
-            slug = kw_norm.replace(" ", "-")
             if slug in href_norm:
                 score += weight * 3        # match in URL path
 
         # --- Menu keywords (lower weight, only if no wine hit yet) ---
         if score == 0:
-            nmk = self._norm_menu_keywords
-            m = len(nmk)
-            for rank, kw_norm in enumerate(nmk):
-                weight = m - rank
+            for kw_norm, slug, weight in self._menu_terms:
                 if kw_norm == text_norm:
                     score += weight * 3
                 elif kw_norm in text_norm:
                     score += weight * 2
-                slug = kw_norm.replace(" ", "-")
                 if slug in href_norm:
                     score += weight * 1
 
         # --- Informational keywords (lowest weight – last resort) ---
         if score == 0:
-            nik = self._norm_info_keywords
-            k = len(nik)
-            for rank, kw_norm in enumerate(nik):
-                weight = k - rank
-                if kw_norm == text_norm:
-                    score += weight * 1
-                elif kw_norm in text_norm:
-                    score += weight * 1
-                slug = kw_norm.replace(" ", "-")
+            for kw_norm, slug, weight in self._info_terms:
+                if kw_norm in text_norm:   # exact or partial, same weight
+                    score += weight
                 if slug in href_norm:
-                    score += weight * 1
+                    score += weight
 
         # --- Context analysis: text surrounding the link ---
         for phrase_norm in self._norm_context_phrases:
@@ -995,7 +1019,9 @@ Rules:
         except Exception:
             return False
 
+    # Pure and hit for every link on every page (nav links repeat site-wide)
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _normalize_url(url: str) -> str:
         parsed = urlparse(url)
         out = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
@@ -1004,5 +1030,6 @@ Rules:
         return out
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _get_domain(url: str) -> str:
         return urlparse(url).netloc.lower()
@@ -103,6 +103,9 @@ class WineListTextExtractor:
                             extracted_text.append(text)
                     
                     extracted_text.append("\n")
+
+                    # Drop this page's parsed objects and text map before the next
+                    page.close()
         
         except Exception as e:
             raise Exception(f"Error extracting text from PDF: {e}")
@@ -176,7 +179,7 @@ class WineListTextExtractor:
         """
         try:
             html_content = path.read_text(encoding='utf-8')
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, 'lxml')
 
             # Remove script, style, and noscript elements
             for tag in soup(["script", "style", "noscript", "svg", "meta", "link"]):
@@ -1,16 +1,28 @@
 """LangGraph workflow for restaurant crawler with PostgreSQL checkpointing."""
+import io
 import logging
+import operator
+import random
+import re
 import time
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Any, TypedDict, Optional, List, cast
+from typing import Annotated, Any, Iterator, TypedDict, Optional, List, cast
+from urllib.parse import urlparse
 
 from langchain_core.runnables import RunnableConfig
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
 from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.postgres import PostgresSaver
-from playwright.sync_api import sync_playwright, Browser, Page
+from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page, Route
 
 from winerank.config import get_settings
-from winerank.common.db import get_session, resolve_restaurant_by_id_or_name
+from winerank.common.db import (
+    get_session,
+    get_session_factory,
+    resolve_restaurant_by_id_or_name,
+)
 from winerank.common.models import (
     Restaurant,
     WineList,
@@ -21,7 +33,7 @@ from winerank.common.models import (
 )
 from winerank.crawler.michelin import MichelinScraper
 from winerank.crawler.restaurant_finder import RestaurantWineListFinder
-from winerank.crawler.downloader import WineListDownloader
+from winerank.crawler.downloader import WineListDownloader, close_http_client
 from winerank.crawler.text_extractor import WineListTextExtractor
 from winerank.crawler.binwise_search import search_binwise
 
@@ -33,7 +45,36 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 _playwright_instance: Optional[object] = None  # Playwright from sync_playwright()
 _browser: Optional[Browser] = None
+_browser_context: Optional[BrowserContext] = None
 _browser_page: Optional[Page] = None
+_restaurants_on_context: int = 0  # restaurants handled since the context was opened
+# Michelin listing/detail scrapes get their own context (see _get_listing_page)
+_listing_context: Optional[BrowserContext] = None
+_listing_page: Optional[Page] = None
+_listing_storage_state: Optional[Any] = None  # carried over when the listing context rotates
+
+# Crawl-wide DB session – opened by run_crawler(), used by the persistence nodes
+_db_session: Optional[Session] = None
+
+
+@contextmanager
+def _session_scope() -> Iterator[Session]:
+    """Yield the crawl-wide session if one is open, else a short-lived one.
+
+    Commits on success and rolls back on error, like ``get_session()``,
+    but reuses the same Session (and its pooled connection checkout) for
+    the whole run instead of building a new one per call.
+    """
+    if _db_session is None:
+        with get_session() as session:
+            yield session
+        return
+    try:
+        yield _db_session
+        _db_session.commit()
+    except Exception:
+        _db_session.rollback()
+        raise
 
 
 def _get_page() -> Page:
@@ -43,14 +84,170 @@ def _get_page() -> Page:
     return _browser_page
 
 
+def _open_browser(pw: Any) -> Browser:
+    """Connect to the shared Chromium over CDP if configured, else launch one."""
+    settings = get_settings()
+    if settings.cdp_endpoint:
+        logger.info("Connecting to Chromium over CDP at %s …", settings.cdp_endpoint)
+        return pw.chromium.connect_over_cdp(settings.cdp_endpoint)
+    logger.info("Launching browser (headless=%s) …", settings.headless)
+    return pw.chromium.launch(headless=settings.headless)
+
+
+# Subresources the crawler never looks at: finding and downloading wine lists
+# only needs documents, scripts (for SPAs) and stylesheets (for visibility).
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+_TRACKER_DOMAINS = frozenset({
+    "googletagmanager.com",
+    "google-analytics.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "facebook.net",
+    "connect.facebook.net",
+    "hotjar.com",
+    "segment.io",
+    "cdn.segment.com",
+    "clarity.ms",
+    "tiktok.com",
+    "analytics.tiktok.com",
+})
+
+
+def _is_tracker_url(url: str) -> bool:
+    """Return True when *url* is served from a known ad/analytics domain."""
+    host = (urlparse(url).hostname or "").lower()
+    return any(host == d or host.endswith("." + d) for d in _TRACKER_DOMAINS)
+
+
+def _block_heavy_resources(route: Route) -> None:
+    """Playwright route handler: abort images/media/fonts and tracker requests."""
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or _is_tracker_url(request.url):
+        route.abort()
+    else:
+        route.continue_()
+
+
+def _open_context(browser: Browser, storage_state: Optional[Any] = None) -> Page:
+    """Open a fresh context + page on *browser* and make them the shared ones.
+
+    *storage_state* (cookies + local storage from a previous context) is
+    carried over so sites keep their session across context rotations.
+    """
+    global _browser_context, _browser_page, _restaurants_on_context
+    _browser_context = browser.new_context(storage_state=storage_state)
+    if get_settings().block_images:
+        _browser_context.route("**/*", _block_heavy_resources)
+    _browser_page = _browser_context.new_page()
+    _restaurants_on_context = 0
+    return _browser_page
+
+
+def _get_listing_page() -> Page:
+    """Return the page used for Michelin listing and detail scrapes.
+
+    It lives in a separate context on the shared browser, opened on first
+    use, so the guide's cookies and JS state stay out of the per-restaurant
+    context.  It is rotated along with that context (see
+    _recycle_listing_context) and reopened here with the guide's cookies.
+    """
+    global _listing_context, _listing_page
+    if _listing_page is None:
+        if _browser is None:
+            raise RuntimeError("Browser page not initialised – call run_crawler()")
+        _listing_context = _browser.new_context(storage_state=_listing_storage_state)
+        if get_settings().block_images:
+            _listing_context.route("**/*", _block_heavy_resources)
+        _listing_page = _listing_context.new_page()
+    return _listing_page
+
+
+def _close_listing_context() -> None:
+    """Close the Michelin listing context, if open; the next scrape reopens it."""
+    global _listing_context, _listing_page
+    try:
+        if _listing_context:
+            _listing_context.close()
+    except Exception:
+        logger.info("Ignoring error closing listing context")
+    _listing_context = None
+    _listing_page = None
+
+
+def _recycle_listing_context() -> None:
+    """Close the Michelin listing context, keeping its cookies for the reopen.
+
+    Listing and detail scrapes share this context, so it accumulates DOM and
+    network state just like the per-restaurant one; the next
+    _get_listing_page() call opens a fresh context with the saved state.
+    """
+    global _listing_storage_state
+    if _listing_context is None:
+        return
+    try:
+        _listing_storage_state = _listing_context.storage_state()
+    except Exception:
+        logger.info("Could not capture listing storage state; reopening clean")
+        _listing_storage_state = None
+    _close_listing_context()
+
+
+def _close_context() -> None:
+    """Close the shared page and its context, ignoring errors from broken ones."""
+    for label, closeable in [("page", _browser_page), ("context", _browser_context)]:
+        try:
+            if closeable:
+                closeable.close()
+        except Exception:
+            logger.info("Ignoring error closing %s", label)
+
+
+def _recycle_browser_context() -> None:
+    """Replace the shared context with a fresh one on the same browser.
+
+    Closing the context is what actually releases the DOM, network and
+    service-worker state accumulated by the page, without paying for a
+    full browser restart.  Cookies and local storage are carried over.
+    """
+    if _browser is None:
+        return
+    storage_state = None
+    try:
+        if _browser_context is not None:
+            storage_state = _browser_context.storage_state()
+    except Exception:
+        logger.info("Could not capture storage state; starting with a clean context")
+    _close_context()
+    try:
+        _open_context(_browser, storage_state=storage_state)
+    except Exception as exc:
+        logger.error("Could not open a new browser context: %s", exc)
+        _recover_browser()
+
+
+def _note_restaurant_done() -> None:
+    """Count a finished restaurant and recycle the context every N of them."""
+    global _restaurants_on_context
+    if _browser is None:
+        return
+    _restaurants_on_context += 1
+    limit = get_settings().restaurants_per_context
+    if limit > 0 and _restaurants_on_context >= limit:
+        logger.info("Recycling browser contexts after %d restaurants", _restaurants_on_context)
+        _recycle_listing_context()
+        _recycle_browser_context()
+
+
 def _recover_browser() -> None:
-    """Restart the entire Chromium browser after a crash.
+    """Restart the browser page (and, if needed, the browser) after a crash.
 
-    Closes the old browser (which may be in a broken state) and launches
-    a fresh one from the existing Playwright instance.  All three
-    module-level refs are updated.
+    Closes the old page, which may be in a broken state.  When connected to
+    a long-lived Chromium over CDP that is still reachable, only a fresh page
+    is opened – the shared browser is never torn down.  Otherwise the old
+    browser is closed and a new one is opened from the existing Playwright
+    instance.  All module-level refs are updated.
     """
-    global _browser_page, _browser
+    global _browser_page, _browser_context, _browser
 
     if not _playwright_instance:
         logger.error("No Playwright instance available -- cannot recover browser")
@@ -58,25 +255,34 @@ def _recover_browser() -> None:
 
     settings = get_settings()
 
-    # 1. Tear down the old browser gracefully
-    for label, closeable in [("page", _browser_page), ("browser", _browser)]:
+    # 1. Tear down the old contexts (and browser, unless it is a shared CDP one)
+    keep_browser = bool(
+        settings.cdp_endpoint and _browser is not None and _browser.is_connected()
+    )
+    _close_listing_context()
+    _close_context()
+    if not keep_browser:
         try:
-            if closeable:
-                closeable.close()
+            if _browser:
+                _browser.close()
         except Exception:
-            logger.info("Ignoring error closing %s during recovery", label)
+            logger.info("Ignoring error closing browser during recovery")
 
-    # 2. Launch a brand-new browser + page
+    # 2. Open a brand-new page, on a fresh browser if the old one was dropped
     try:
-        logger.info("Restarting Chromium browser (headless=%s) ...", settings.headless)
-        pw = cast(Any, _playwright_instance)
-        new_browser = pw.chromium.launch(headless=settings.headless)
+        if keep_browser and _browser is not None:
+            logger.info("Reopening page on shared CDP browser ...")
+            new_browser = _browser
+        else:
+            logger.info("Restarting Chromium browser ...")
+            new_browser = _open_browser(_playwright_instance)
         _browser = new_browser
-        _browser_page = new_browser.new_page()
+        _open_context(new_browser)
         logger.info("Browser restarted successfully")
     except Exception as exc:
         logger.error("Browser restart failed: %s", exc)
         _browser = None
+        _browser_context = None
         _browser_page = None
 
 
@@ -108,12 +314,15 @@ class CrawlerState(TypedDict):
     # Current restaurant context
     current_restaurant: Optional[dict]
 
-    # Counters
+    # Counters.  The per-restaurant counters are additive (nodes return the
+    # increment) so completions from concurrent branches accumulate safely.
     restaurants_found: int
-    restaurants_processed: int
-    wine_lists_downloaded: int
-    wine_list_restaurant_names: List[str]  # names of restaurants with lists downloaded this run
-    errors: List[str]
+    restaurants_processed: Annotated[int, operator.add]
+    wine_lists_downloaded: Annotated[int, operator.add]
+    # Append-only logs: nodes return only the new entries and LangGraph
+    # concatenates them via the operator.add reducer.
+    wine_list_restaurant_names: Annotated[List[str], operator.add]  # names of restaurants with lists downloaded this run
+    errors: Annotated[List[str], operator.add]
 
     # Circuit breaker: consecutive failures on current listing page
     consecutive_fetch_failures: int
@@ -122,6 +331,9 @@ class CrawlerState(TypedDict):
     # BinWise fallback: whether search was already attempted for current restaurant
     binwise_searched: bool
 
+    # Restaurant UPDATE mappings not yet written (see save_result_node)
+    pending_results: List[dict]
+
 
 # ---------------------------------------------------------------------------
 # Graph construction
@@ -215,61 +427,116 @@ def create_crawler_workflow() -> StateGraph:
 # Routing helpers
 # ---------------------------------------------------------------------------
 
-def _route_after_process(state: CrawlerState) -> str:
-    """After process_restaurant – crawl the site if it has a website.
+# Per-restaurant facts the routers branch on, packed into a bitmask so each
+# router is a single tuple lookup into a table precomputed at import time.
+_HAS_WEBSITE = 1 << 0
+_HAS_WINE_LIST_URL = 1 << 1
+_HAS_LOCAL_FILE = 1 << 2
+_DOWNLOAD_FAILED = 1 << 3
+_BINWISE_SEARCHED = 1 << 4
+_SKIP_KNOWN_LIST = 1 << 5  # wine list found in a previous run and no force_recrawl
+_FLAG_COMBINATIONS = 1 << 6
 
-    Restaurants whose wine list was already found in a previous run are
-    skipped unless ``force_recrawl`` is set in the workflow state.
-    """
+
+def _restaurant_flags(state: CrawlerState) -> Optional[int]:
+    """Encode the current restaurant's routing facts, or None if there is none."""
     restaurant = state.get("current_restaurant")
     if not restaurant:
-        return "save_result"
-
-    # Skip restaurants that already have a wine list (but not failed ones)
+        return None
+    flags = 0
+    if restaurant.get("website_url"):
+        flags |= _HAS_WEBSITE
+    if restaurant.get("wine_list_url"):
+        flags |= _HAS_WINE_LIST_URL
+    if restaurant.get("local_file_path"):
+        flags |= _HAS_LOCAL_FILE
+    if restaurant.get("download_failed"):
+        flags |= _DOWNLOAD_FAILED
+    if state.get("binwise_searched"):
+        flags |= _BINWISE_SEARCHED
     if (
         restaurant.get("crawl_status") == CrawlStatus.WINE_LIST_FOUND
         and not state.get("force_recrawl")
     ):
-        logger.info(
-            "Skipping %s – wine list already found", restaurant.get("name")
-        )
-        return "save_result"
+        flags |= _SKIP_KNOWN_LIST
+    return flags
 
-    if restaurant.get("website_url"):
+
+def _build_route_table(rule) -> tuple[str, ...]:
+    """Evaluate *rule* for every flag combination."""
+    return tuple(rule(flags) for flags in range(_FLAG_COMBINATIONS))
+
+
+def _process_rule(flags: int) -> str:
+    # Skip restaurants that already have a wine list (but not failed ones)
+    if flags & _SKIP_KNOWN_LIST:
+        return "save_result"
+    if flags & _HAS_WEBSITE:
         return "crawl_site"
     return "search_binwise"
 
 
+def _crawl_rule(flags: int) -> str:
+    return "download" if flags & _HAS_WINE_LIST_URL else "search_binwise"
+
+
+def _download_rule(flags: int) -> str:
+    if flags & _DOWNLOAD_FAILED:
+        return "save_result" if flags & _BINWISE_SEARCHED else "search_binwise"
+    if flags & _HAS_LOCAL_FILE:
+        return "extract_text"
+    return "save_result"
+
+
+def _binwise_rule(flags: int) -> str:
+    return "download" if flags & _HAS_WINE_LIST_URL else "save_result"
+
+
+_ROUTES_AFTER_PROCESS = _build_route_table(_process_rule)
+_ROUTES_AFTER_CRAWL = _build_route_table(_crawl_rule)
+_ROUTES_AFTER_DOWNLOAD = _build_route_table(_download_rule)
+_ROUTES_AFTER_BINWISE = _build_route_table(_binwise_rule)
+
+
+def _route_after_process(state: CrawlerState) -> str:
+    """After process_restaurant – crawl the site if it has a website.
+
+    Restaurants whose wine list was already found in a previous run are
+    skipped unless ``force_recrawl`` is set in the workflow state.
+    """
+    flags = _restaurant_flags(state)
+    if flags is None:
+        return "save_result"
+    if flags & _SKIP_KNOWN_LIST:
+        logger.info(
+            "Skipping %s – wine list already found",
+            (state.get("current_restaurant") or {}).get("name"),
+        )
+    return _ROUTES_AFTER_PROCESS[flags]
+
+
 def _route_after_crawl(state: CrawlerState) -> str:
     """After crawl_restaurant_site – download if wine list URL was found."""
-    restaurant = state.get("current_restaurant")
-    if not restaurant:
+    flags = _restaurant_flags(state)
+    if flags is None:
         return "save_result"
-    if restaurant.get("wine_list_url"):
-        return "download"
-    return "search_binwise"
+    return _ROUTES_AFTER_CRAWL[flags]
 
 
 def _route_after_download(state: CrawlerState) -> str:
     """After download_wine_list – extract text on success, else try BinWise or save."""
-    restaurant = state.get("current_restaurant")
-    if not restaurant:
+    flags = _restaurant_flags(state)
+    if flags is None:
         return "save_result"
-    if restaurant.get("local_file_path") and not restaurant.get("download_failed"):
-        return "extract_text"
-    if restaurant.get("download_failed"):
-        if state.get("binwise_searched"):
-            return "save_result"
-        return "search_binwise"
-    return "save_result"
+    return _ROUTES_AFTER_DOWNLOAD[flags]
 
 
 def _route_after_binwise(state: CrawlerState) -> str:
     """After search_binwise – download if URL found, else save result."""
-    restaurant = state.get("current_restaurant")
-    if restaurant and restaurant.get("wine_list_url"):
-        return "download"
-    return "save_result"
+    flags = _restaurant_flags(state)
+    if flags is None:
+        return "save_result"
+    return _ROUTES_AFTER_BINWISE[flags]
 
 
 def _route_after_save(state: CrawlerState) -> str:
@@ -356,6 +623,7 @@ def init_job_node(state: CrawlerState) -> dict:
             "consecutive_fetch_failures": 0,
             "max_consecutive_failures": 3,
             "binwise_searched": False,
+            "pending_results": [],
         }
 
 
@@ -370,6 +638,45 @@ def _resolve_restaurant_filter(
     return resolve_restaurant_by_id_or_name(filter_value, site_of_record_id=site_of_record_id)
 
 
+# Error fragments that indicate rate limiting or a flaky connection rather
+# than a broken page; these are retried with backoff before counting as a
+# circuit-breaker failure.  Status codes must stand alone (delimited by
+# whitespace, parentheses, colons or commas), so digits inside URLs and ids
+# such as ".../restaurant/foo-4290" don't count.
+_TRANSIENT_ERROR_RE = re.compile(
+    r"(?<![^\s(:])(?:429|503)(?![^\s):,])|Too Many Requests|Connection reset"
+)
+
+
+def _is_transient_error(exc: Exception) -> bool:
+    """Return True when *exc* looks like a transient rate-limit/network error."""
+    return _TRANSIENT_ERROR_RE.search(str(exc)) is not None
+
+
+def _scrape_listing_with_backoff(scraper: MichelinScraper, url: str) -> dict:
+    """Scrape a listing page, retrying transient errors with exponential backoff.
+
+    Sleeps ``min(60, 2**attempt)`` seconds plus up to one second of jitter
+    between attempts, for at most ``settings.listing_retries`` retries.
+    Non-transient errors (and the last transient one) are re-raised.
+    """
+    retries = get_settings().listing_retries
+    attempt = 0
+    while True:
+        try:
+            return scraper.scrape_listing_page(url)
+        except Exception as e:
+            if attempt >= retries or not _is_transient_error(e):
+                raise
+            attempt += 1
+            delay = min(60, 2 ** attempt) + random.uniform(0, 1)
+            logger.warning(
+                "Transient error on %s (%s) -- retry %d/%d in %.1fs",
+                url, e, attempt, retries, delay,
+            )
+            time.sleep(delay)
+
+
 def fetch_listing_page_node(state: CrawlerState) -> dict:
     """Fetch a Michelin listing page and extract restaurant URLs.
 
@@ -391,7 +698,7 @@ def fetch_listing_page_node(state: CrawlerState) -> dict:
                 "current_restaurant_idx": 0,
                 "restaurants_found": 0,
                 "total_pages": 1,
-                "errors": state.get("errors", []) + [msg],
+                "errors": [msg],
             }
 
         # Always load from DB in single-restaurant mode (skip Michelin scrape)
@@ -416,7 +723,7 @@ def fetch_listing_page_node(state: CrawlerState) -> dict:
                 f"Site of record id={state['site_of_record_id']} not found."
             )
         base_url = site.site_url
-    page = _get_page()
+    page = _get_listing_page()
     scraper = MichelinScraper(page, base_url=base_url)
 
     # Determine which page to fetch
@@ -432,7 +739,7 @@ def fetch_listing_page_node(state: CrawlerState) -> dict:
     try:
         url = scraper.get_listing_url(state["michelin_level"], cur_page)
         logger.info("Fetching listing page %d: %s", cur_page, url)
-        result = scraper.scrape_listing_page(url)
+        result = _scrape_listing_with_backoff(scraper, url)
 
         updates: dict = {
             "current_page": cur_page,  # Persist the page we actually fetched
@@ -448,11 +755,15 @@ def fetch_listing_page_node(state: CrawlerState) -> dict:
 
         # Persist progress
         with get_session() as session:
-            job = session.query(Job).filter_by(id=state["job_id"]).first()
-            if job:
-                job.total_pages = updates.get("total_pages", state.get("total_pages", 0))
-                job.current_page = cur_page
-                job.restaurants_found = updates["restaurants_found"]
+            session.execute(
+                update(Job)
+                .where(Job.id == state["job_id"])
+                .values(
+                    total_pages=updates.get("total_pages", state.get("total_pages", 0)),
+                    current_page=cur_page,
+                    restaurants_found=updates["restaurants_found"],
+                )
+            )
 
         logger.info(
             "Found %d restaurant URLs on page %d (total so far: %d)",
@@ -473,7 +784,6 @@ def fetch_listing_page_node(state: CrawlerState) -> dict:
         failures = base + 1
 
         error_msg = f"Page {cur_page} attempt {failures}: {e}"
-        errors = state.get("errors", []) + [error_msg]
 
         # Attempt browser recovery on crash-class errors
         error_str = str(e)
@@ -489,7 +799,7 @@ def fetch_listing_page_node(state: CrawlerState) -> dict:
             # Keep consecutive_fetch_failures so _route_after_save can detect skip; advance page
             return {
                 "consecutive_fetch_failures": failures,
-                "errors": errors,
+                "errors": [error_msg],
                 "restaurant_urls": [],
                 "current_restaurant_idx": 0,
                 "current_page": cur_page + 1,
@@ -497,7 +807,7 @@ def fetch_listing_page_node(state: CrawlerState) -> dict:
 
         return {
             "consecutive_fetch_failures": failures,
-            "errors": errors,
+            "errors": [error_msg],
         }
 
 
@@ -555,8 +865,7 @@ def process_restaurant_node(state: CrawlerState) -> dict:
         logger.error("Restaurant id=%d not found in DB", rest_id)
         return {
             "current_restaurant": None,
-            "errors": state.get("errors", [])
-                     + [f"Restaurant id={rest_id} not found"],
+            "errors": [f"Restaurant id={rest_id} not found"],
         }
 
     # --- Normal Michelin scrape path ---
@@ -571,7 +880,7 @@ def process_restaurant_node(state: CrawlerState) -> dict:
         base_url = site.site_url
         # Derive country from site name, e.g. "Michelin Guide USA" -> "USA"
         site_country = site.site_name.replace("Michelin Guide ", "", 1)
-    page = _get_page()
+    page = _get_listing_page()
     scraper = MichelinScraper(page, base_url=base_url)
 
     try:
@@ -580,22 +889,32 @@ def process_restaurant_node(state: CrawlerState) -> dict:
         data = scraper.scrape_restaurant_detail(restaurant_url)
         data["country"] = data.get("country") or site_country
 
-        # Upsert restaurant in database
+        # Upsert restaurant in database: refresh the address fields of a
+        # known restaurant in one UPDATE (empty scraped values keep the
+        # stored ones), insert only when no row matched.
         with get_session() as session:
-            existing = session.query(Restaurant).filter_by(
-                michelin_url=restaurant_url
+            existing = session.execute(
+                update(Restaurant)
+                .where(Restaurant.michelin_url == restaurant_url)
+                .values({
+                    col: func.coalesce(data.get(col.key) or None, col)
+                    for col in (
+                        Restaurant.address,
+                        Restaurant.city,
+                        Restaurant.state,
+                        Restaurant.zip_code,
+                        Restaurant.country,
+                    )
+                })
+                .returning(
+                    Restaurant.id, Restaurant.crawl_status, Restaurant.wine_list_url,
+                )
             ).first()
 
             if existing:
                 data["id"] = existing.id
                 data["crawl_status"] = existing.crawl_status
                 data["wine_list_url"] = existing.wine_list_url
-                # Refresh address fields from the latest scrape
-                existing.address = data.get("address") or existing.address
-                existing.city = data.get("city") or existing.city
-                existing.state = data.get("state") or existing.state
-                existing.zip_code = data.get("zip_code") or existing.zip_code
-                existing.country = data.get("country") or existing.country
                 session.commit()
             else:
                 restaurant = Restaurant(
@@ -632,7 +951,7 @@ def process_restaurant_node(state: CrawlerState) -> dict:
         logger.error("Error processing %s: %s", restaurant_url, e)
         return {
             "current_restaurant": None,
-            "errors": state.get("errors", []) + [str(e)],
+            "errors": [str(e)],
         }
 
 
@@ -662,14 +981,9 @@ def crawl_restaurant_site_node(state: CrawlerState) -> dict:
     start_time = time.time()
     
     try:
-        # Check for cached wine list URL
-        cached_url = None
-        with get_session() as session:
-            rec = session.query(Restaurant).filter_by(
-                id=restaurant["id"]
-            ).first()
-            if rec:
-                cached_url = rec.wine_list_url
+        # Cached wine list URL: process_restaurant already carried the DB
+        # value over into state, so no need to re-read the row.
+        cached_url = restaurant.get("wine_list_url")
 
         logger.info("Crawling %s website: %s",
                      restaurant["name"], restaurant["website_url"])
@@ -720,7 +1034,7 @@ def crawl_restaurant_site_node(state: CrawlerState) -> dict:
                 "llm_tokens_used": getattr(finder, "tokens_used", 0),
                 "pages_visited": getattr(finder, "pages_loaded", 0),
             },
-            "errors": state.get("errors", []) + [str(e)],
+            "errors": [str(e)],
         }
 
 
@@ -790,11 +1104,10 @@ def download_wine_list_node(state: CrawlerState) -> dict:
 
         merged = dict(restaurant)
         merged.update(result)
-        names = (state.get("wine_list_restaurant_names") or []) + [restaurant["name"]]
         return {
             "current_restaurant": merged,
-            "wine_lists_downloaded": (state.get("wine_lists_downloaded") or 0) + 1,
-            "wine_list_restaurant_names": names,
+            "wine_lists_downloaded": 1,
+            "wine_list_restaurant_names": [restaurant["name"]],
         }
 
     except Exception as e:
@@ -803,7 +1116,7 @@ def download_wine_list_node(state: CrawlerState) -> dict:
         merged["download_failed"] = True
         return {
             "current_restaurant": merged,
-            "errors": (state.get("errors") or []) + [str(e)],
+            "errors": [str(e)],
         }
 
 
@@ -820,12 +1133,14 @@ def extract_text_node(state: CrawlerState) -> dict:
         extractor = WineListTextExtractor()
         text_path = extractor.extract_and_save(path)
 
-        with get_session() as session:
-            wl_id = restaurant.get("wine_list_id")
-            if wl_id:
-                wl = session.query(WineList).filter_by(id=wl_id).first()
-                if wl:
-                    wl.text_file_path = text_path
+        wl_id = restaurant.get("wine_list_id")
+        if wl_id:
+            with get_session() as session:
+                session.execute(
+                    update(WineList)
+                    .where(WineList.id == wl_id)
+                    .values(text_file_path=text_path)
+                )
 
         merged = dict(restaurant)
         merged["text_file_path"] = text_path
@@ -833,12 +1148,60 @@ def extract_text_node(state: CrawlerState) -> dict:
 
     except Exception as e:
         logger.error("Error extracting text from %s: %s", path, e)
-        return {"errors": (state.get("errors") or []) + [str(e)]}
+        return {"errors": [str(e)]}
+
+
+# Restaurant outcomes are buffered in state and written in one bulk UPDATE
+# every this many restaurants (and when the job completes).
+_RESULT_BATCH_SIZE = 25
+
+
+def _restaurant_result_mapping(restaurant: dict) -> dict:
+    """Build the Restaurant UPDATE mapping (keyed by primary key) for a crawl outcome."""
+    mapping: dict = {"id": restaurant["id"]}
+    if restaurant.get("download_failed"):
+        mapping["crawl_status"] = CrawlStatus.DOWNLOAD_LIST_FAILED
+        mapping["wine_list_url"] = restaurant.get("wine_list_url")
+    elif restaurant.get("wine_list_url") and restaurant.get("local_file_path"):
+        mapping["crawl_status"] = CrawlStatus.WINE_LIST_FOUND
+        mapping["wine_list_url"] = restaurant["wine_list_url"]
+    elif restaurant.get("wine_list_url"):
+        mapping["crawl_status"] = CrawlStatus.DOWNLOAD_LIST_FAILED
+        mapping["wine_list_url"] = restaurant["wine_list_url"]
+    elif restaurant.get("website_url"):
+        mapping["crawl_status"] = CrawlStatus.NO_WINE_LIST
+    else:
+        mapping["crawl_status"] = CrawlStatus.NO_WEBSITE
+
+    # Persist crawl metrics
+    for key in ("crawl_duration_seconds", "llm_tokens_used", "pages_visited"):
+        if restaurant.get(key) is not None:
+            mapping[key] = restaurant[key]
+    return mapping
+
+
+def _flush_restaurant_results(session: Any, pending: List[dict]) -> None:
+    """Write buffered restaurant outcomes with a single executemany UPDATE.
+
+    Mappings are grouped by key set so rows that touch the same columns
+    share one batched statement.  ``last_crawled_at`` is stamped by the
+    database.
+    """
+    if not pending:
+        return
+    mappings = sorted(pending, key=lambda m: tuple(sorted(m)))
+    session.execute(update(Restaurant).values(last_crawled_at=func.now()), mappings)
 
 
 def save_result_node(state: CrawlerState) -> dict:
-    """Persist the crawl outcome and advance the restaurant index."""
+    """Record the crawl outcome and advance the restaurant index.
+
+    Outcomes are buffered in ``pending_results`` and flushed to the DB,
+    together with job progress, every ``_RESULT_BATCH_SIZE`` restaurants.
+    """
     restaurant = state.get("current_restaurant")
+    pending = list(state.get("pending_results") or [])
+    processed = (state.get("restaurants_processed") or 0) + 1
 
     # Detect skipped restaurants: crawl_status already set from DB and no
     # new crawl was performed (no crawl_duration_seconds).  Don't touch
@@ -849,70 +1212,79 @@ def save_result_node(state: CrawlerState) -> dict:
         and restaurant.get("crawl_duration_seconds") is None
     )
 
-    if restaurant and restaurant.get("id"):
-        try:
-            with get_session() as session:
-                if not skipped:
-                    rec = session.query(Restaurant).filter_by(
-                        id=restaurant["id"]
-                    ).first()
-                    if rec:
-                        if restaurant.get("download_failed"):
-                            rec.crawl_status = CrawlStatus.DOWNLOAD_LIST_FAILED
-                            rec.wine_list_url = restaurant.get("wine_list_url")
-                        elif restaurant.get("wine_list_url") and restaurant.get("local_file_path"):
-                            rec.crawl_status = CrawlStatus.WINE_LIST_FOUND
-                            rec.wine_list_url = restaurant["wine_list_url"]
-                        elif restaurant.get("wine_list_url"):
-                            rec.crawl_status = CrawlStatus.DOWNLOAD_LIST_FAILED
-                            rec.wine_list_url = restaurant["wine_list_url"]
-                        elif restaurant.get("website_url"):
-                            rec.crawl_status = CrawlStatus.NO_WINE_LIST
-                        else:
-                            rec.crawl_status = CrawlStatus.NO_WEBSITE
-                        rec.last_crawled_at = datetime.now(timezone.utc)
-
-                        # Persist crawl metrics
-                        if restaurant.get("crawl_duration_seconds") is not None:
-                            rec.crawl_duration_seconds = restaurant["crawl_duration_seconds"]
-                        if restaurant.get("llm_tokens_used") is not None:
-                            rec.llm_tokens_used = restaurant["llm_tokens_used"]
-                        if restaurant.get("pages_visited") is not None:
-                            rec.pages_visited = restaurant["pages_visited"]
-
-                # Always update job progress (including skipped restaurants)
-                job = session.query(Job).filter_by(
-                    id=state["job_id"]
-                ).first()
-                if job:
-                    job.restaurants_processed = state["restaurants_processed"] + 1
-                    job.wine_lists_downloaded = state["wine_lists_downloaded"]
+    if restaurant and restaurant.get("id") and not skipped:
+        pending.append(_restaurant_result_mapping(restaurant))
 
+    if len(pending) >= _RESULT_BATCH_SIZE:
+        try:
+            with _session_scope() as session:
+                _flush_restaurant_results(session, pending)
+                session.execute(
+                    update(Job)
+                    .where(Job.id == state["job_id"])
+                    .values(
+                        restaurants_processed=processed,
+                        wine_lists_downloaded=state.get("wine_lists_downloaded") or 0,
+                    )
+                )
         except Exception as e:
-            logger.error("Error saving result: %s", e)
+            # Keep the batch: the next flush (or the crash path) retries it
+            logger.error("Error saving %d buffered results: %s", len(pending), e)
+        else:
+            pending = []
+
+    _note_restaurant_done()
 
     # Always advance the index and bump the processed counter
     return {
         "current_restaurant_idx": (state.get("current_restaurant_idx") or 0) + 1,
-        "restaurants_processed": (state.get("restaurants_processed") or 0) + 1,
+        "restaurants_processed": 1,
+        "pending_results": pending,
     }
 
 
+# Cap on Job.error_message, for both completed and failed jobs
+_ERROR_MESSAGE_LIMIT = 2000
+
+
+def _bounded_error_message(errors: List[Any], limit: int = _ERROR_MESSAGE_LIMIT) -> str:
+    """Join *errors* one per line, stopping once *limit* characters are written."""
+    buf = io.StringIO()
+    remaining = limit
+    for error in errors:
+        if buf.tell():
+            if remaining <= 1:
+                break
+            buf.write("\n")
+            remaining -= 1
+        text = str(error)[:remaining]
+        buf.write(text)
+        remaining -= len(text)
+    return buf.getvalue()
+
+
+def _job_duration_since_start() -> Any:
+    """SQL expression for a job's duration in seconds up to now(), computed server-side."""
+    return func.extract("epoch", func.now() - Job.started_at)
+
+
 def complete_job_node(state: CrawlerState) -> dict:
-    """Finalise the job record."""
-    with get_session() as session:
-        job = session.query(Job).filter_by(id=state["job_id"]).first()
-        if job:
-            job.status = JobStatus.COMPLETED
-            completed_at = datetime.now(timezone.utc)
-            job.completed_at = completed_at
-            if job.started_at is not None:
-                job.duration_seconds = (
-                    completed_at - job.started_at
-                ).total_seconds()
-            errors = state.get("errors")
-            if errors:
-                job.error_message = "\n".join(str(e) for e in errors[:20])
+    """Flush any buffered restaurant results and finalise the job record."""
+    with _session_scope() as session:
+        _flush_restaurant_results(session, state.get("pending_results") or [])
+        values: dict = {
+            "restaurants_processed": state.get("restaurants_processed") or 0,
+            "wine_lists_downloaded": state.get("wine_lists_downloaded") or 0,
+            "status": JobStatus.COMPLETED,
+            "completed_at": func.now(),
+            "duration_seconds": _job_duration_since_start(),
+        }
+        errors = state.get("errors")
+        if errors:
+            values["error_message"] = _bounded_error_message(errors[:20])
+        session.execute(
+            update(Job).where(Job.id == state["job_id"]).values(**values)
+        )
 
     downloaded = state.get("wine_lists_downloaded") or 0
     summary = (
@@ -927,27 +1299,41 @@ def complete_job_node(state: CrawlerState) -> dict:
             summary += f": {', '.join(sorted(names))}"
 
     logger.info(summary)
-    return {}
+    # Drop the per-page queue so the final checkpoint doesn't carry it
+    return {"restaurant_urls": [], "current_restaurant": None, "pending_results": []}
 
 
 # ---------------------------------------------------------------------------
 # Public entry-point
 # ---------------------------------------------------------------------------
 
+def _save_pending_results(pending: List[dict]) -> None:
+    """Write restaurant results still buffered when a run aborts."""
+    if not pending:
+        return
+    try:
+        with _session_scope() as session:
+            _flush_restaurant_results(session, pending)
+    except Exception:
+        logger.exception("Could not save %d buffered restaurant results", len(pending))
+
+
 def fail_job(job_id: int, error_msg: str) -> None:
     """Mark a job as FAILED in the database."""
     try:
-        with get_session() as session:
-            job = session.query(Job).filter_by(id=job_id).first()
-            if job and job.status == JobStatus.RUNNING:
-                job.status = JobStatus.FAILED
-                completed_at = datetime.now(timezone.utc)
-                job.completed_at = completed_at
-                job.error_message = error_msg[:2000]
-                if job.started_at is not None:
-                    job.duration_seconds = (
-                        completed_at - job.started_at
-                    ).total_seconds()
+        # Status guard in the WHERE clause: one atomic round-trip, and a job
+        # that already finished (or was failed concurrently) is left alone.
+        with _session_scope() as session:
+            session.execute(
+                update(Job)
+                .where(Job.id == job_id, Job.status == JobStatus.RUNNING)
+                .values(
+                    status=JobStatus.FAILED,
+                    completed_at=func.now(),
+                    error_message=error_msg[:_ERROR_MESSAGE_LIMIT],
+                    duration_seconds=_job_duration_since_start(),
+                )
+            )
     except Exception:
         logger.exception("Could not mark job %d as failed", job_id)
 
@@ -962,8 +1348,10 @@ def run_crawler(
     """
     Run the crawler workflow.
 
-    A single Playwright browser is created here and shared across all nodes
-    via the module-level ``_browser_page``.
+    A single Playwright browser is created here (or, when
+    ``WINERANK_CDP_ENDPOINT`` is set, connected to over CDP) and shared
+    across all nodes: restaurant sites use the rotating ``_browser_page``,
+    Michelin scrapes use a separate ``_listing_page`` context.
 
     Parameters
     ----------
@@ -977,9 +1365,11 @@ def run_crawler(
     site_of_record_id:
         Required for new jobs (not resume). ID of the site of record to crawl.
     """
-    global _browser_page, _browser, _playwright_instance
+    global _browser_page, _browser_context, _browser, _playwright_instance, _db_session
+    global _listing_storage_state
     settings = get_settings()
     job_id: Optional[int] = None
+    pending_results: List[dict] = []
 
     # Build the workflow graph
     workflow = create_crawler_workflow()
@@ -996,12 +1386,12 @@ def run_crawler(
         checkpointer.setup()
         app = workflow.compile(checkpointer=checkpointer)
 
-        # Launch ONE browser for the whole run
-        logger.info("Launching browser (headless=%s) …", settings.headless)
+        # Launch (or connect to) ONE browser for the whole run
         _playwright_instance = pw
-        browser = pw.chromium.launch(headless=settings.headless)
+        browser = _open_browser(pw)
         _browser = browser
-        _browser_page = browser.new_page()
+        _open_context(browser)
+        _db_session = get_session_factory()()
 
         try:
             # Initial state
@@ -1023,17 +1413,32 @@ def run_crawler(
             thread_id = f"crawler_{resume_job_id or 'new'}_{datetime.now(timezone.utc).isoformat()}"
             config: RunnableConfig = {"configurable": {"thread_id": thread_id}}
 
-            final = None
-            for output in app.stream(initial_state, config):
-                final = output
-                # Grab the job_id as soon as init_job produces it
-                if job_id is None and isinstance(output, dict):
-                    for v in output.values():
-                        if isinstance(v, dict) and "job_id" in v:
-                            job_id = v["job_id"]
-                            break
-
-            return final or {}
+            # "updates" yields each node's partial output (used to track the
+            # job id and buffered results); "values" yields the full state
+            # after each step, of which only the latest is kept and returned.
+            #
+            # Progress is persisted by the nodes themselves (Job/Restaurant
+            # rows, batched in save_result_node) and resume starts from the
+            # job record on a fresh thread_id, so per-step checkpoints are
+            # never read back.  durability="exit" writes a single checkpoint
+            # when the run ends instead of one Postgres write per node.
+            final: dict = {}
+            for mode, data in app.stream(
+                initial_state, config,
+                stream_mode=["updates", "values"], durability="exit",
+            ):
+                chunk = cast(dict, data)
+                if mode == "values":
+                    final = chunk
+                    continue
+                if job_id is None:
+                    job_id = (chunk.get("init_job") or {}).get("job_id")
+                for node_update in chunk.values():
+                    # Track buffered results so a crash can still save them
+                    if isinstance(node_update, dict) and "pending_results" in node_update:
+                        pending_results = node_update["pending_results"]
+
+            return final
 
         except Exception as exc:
             if job_id:
@@ -1041,7 +1446,17 @@ def run_crawler(
             raise
 
         finally:
+            # Also on KeyboardInterrupt/SystemExit: save finished restaurants
+            # still buffered (a no-op after complete_job_node flushed them)
+            _save_pending_results(pending_results)
+            if _db_session is not None:
+                _db_session.close()
+                _db_session = None
+            _close_listing_context()
+            _listing_storage_state = None
+            close_http_client()
             _browser_page = None
+            _browser_context = None
             _browser = None
             _playwright_instance = None
             browser.close()
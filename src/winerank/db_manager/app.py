@@ -25,6 +25,16 @@ def get_cached_session_factory():
     return get_session_factory()
 
 
+@st.cache_data(ttl=30)
+def check_connection() -> str | None:
+    """Probe the database; return the error message, or None if reachable."""
+    try:
+        with get_cached_engine().connect():
+            return None
+    except Exception as e:
+        return str(e)
+
+
 # Initialize engine
 engine = get_cached_engine()
 SessionLocal = get_cached_session_factory()
@@ -59,11 +69,11 @@ pg = st.navigation(
 # Sidebar extras below the navigation links
 st.sidebar.markdown("---")
 st.sidebar.markdown("### Database")
-try:
-    with engine.connect() as conn:
-        st.sidebar.success("\u2713 Connected")
-except Exception as e:
-    st.sidebar.error(f"\u2717 Connection failed: {e}")
+connection_error = check_connection()
+if connection_error is None:
+    st.sidebar.success("\u2713 Connected")
+else:
+    st.sidebar.error(f"\u2717 Connection failed: {connection_error}")
 
 # Run the selected page
 pg.run()
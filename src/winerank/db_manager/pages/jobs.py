@@ -1,6 +1,10 @@
 """Jobs page - view crawler job status and history."""
+import math
+from typing import cast
+
+import pandas as pd
 import streamlit as st
-from sqlalchemy.orm import joinedload
+from sqlalchemy import func, select
 
 from winerank.common.db import get_session
 from winerank.common.models import Job, JobStatus, SiteOfRecord
@@ -13,14 +17,66 @@ _STATUS_ICONS = {
     JobStatus.CANCELLED: "\u26ab",
 }
 
-
-def _fmt_duration(seconds) -> str:
-    """Format duration in seconds to a human-readable string."""
-    if seconds is None:
-        return ""
-    total = int(seconds)
-    mins, secs = divmod(total, 60)
-    return f"{mins}m {secs}s" if mins else f"{secs}s"
+PAGE_SIZE = 25
+
+# Columns shown per job; fetched as plain rows, no ORM objects
+_JOB_ROW = select(
+    Job.id,
+    Job.job_type,
+    Job.status,
+    Job.michelin_level,
+    Job.started_at,
+    Job.completed_at,
+    Job.duration_seconds,
+    Job.total_pages,
+    Job.current_page,
+    Job.restaurants_found,
+    Job.restaurants_processed,
+    Job.wine_lists_downloaded,
+    Job.error_message,
+    SiteOfRecord.site_name,
+).outerjoin(SiteOfRecord, Job.site_of_record_id == SiteOfRecord.id)
+
+
+def _fmt_durations(seconds: pd.Series) -> pd.Series:
+    """Format durations in seconds as "Xm Ys" ("Ys" under a minute, "" if unknown)."""
+    numeric = cast(pd.Series, pd.to_numeric(seconds, errors="coerce"))
+    total = numeric.astype("Float64").floordiv(1).astype("Int64")
+    mins = total.floordiv(60)
+    secs = (total % 60).astype("string") + "s"
+    formatted = secs.where(mins == 0, mins.astype("string") + "m " + secs)
+    return formatted.fillna("")
+
+
+def _job_label(job) -> str:
+    """Expander label for a job row."""
+    icon = _STATUS_ICONS.get(job.status, "\u26aa")
+    return (
+        f"{icon} Job #{job.id} \u2014 {job.job_type} ({job.status.value}) "
+        f"\u2014 {job.started_at:%Y-%m-%d %H:%M}"
+    )
+
+
+def _job_conditions(filter_status: list[str], site_id: int | None) -> list:
+    """WHERE clauses for the selected status / site filters."""
+    conditions = []
+    if filter_status:
+        conditions.append(Job.status.in_(filter_status))
+    if site_id is not None:
+        conditions.append(Job.site_of_record_id == site_id)
+    return conditions
+
+
+@st.cache_data(ttl=30)
+def _job_status_counts(filter_status: list[str], site_id: int | None) -> dict[JobStatus, int]:
+    """Job counts per status for the current filters (one GROUP BY, cached 30s)."""
+    with get_session() as session:
+        rows = session.execute(
+            select(Job.status, func.count().label("n"))
+            .where(*_job_conditions(filter_status, site_id))
+            .group_by(Job.status)
+        ).all()
+        return {row.status: row.n for row in rows}
 
 
 def render():
@@ -35,8 +91,11 @@ def render():
             default=[],
         )
     with get_session() as session:
-        sites = session.query(SiteOfRecord).order_by(SiteOfRecord.site_name).all()
-        site_options = ["All"] + [s.site_name for s in sites]
+        site_rows = session.execute(
+            select(SiteOfRecord.site_name, SiteOfRecord.id).order_by(SiteOfRecord.site_name)
+        ).all()
+        site_ids: dict[str, int] = {row.site_name: row.id for row in site_rows}
+        site_options = ["All", *site_ids]
     with col2:
         filter_site = st.selectbox(
             "Filter by Site of Record",
@@ -47,41 +106,49 @@ def render():
     st.markdown("---")
 
     with get_session() as session:
-        query = (
-            session.query(Job)
-            .options(joinedload(Job.site_of_record))
-            .order_by(Job.started_at.desc())
-        )
-        if filter_status:
-            query = query.filter(Job.status.in_(filter_status))
-        if filter_site and filter_site != "All":
-            site = session.query(SiteOfRecord).filter_by(site_name=filter_site).first()
-            if site:
-                query = query.filter(Job.site_of_record_id == site.id)
+        site_id = site_ids.get(filter_site)
+        conditions = _job_conditions(filter_status, site_id)
 
-        jobs = query.all()
+        # Live count for the empty state and pager, so new jobs show at once
+        total_jobs = session.execute(
+            select(func.count()).select_from(Job).where(*conditions)
+        ).scalar_one()
 
-        if not jobs:
+        if not total_jobs:
             st.info("No jobs found. Run the crawler to create jobs.")
             return
 
-        # Summary metrics
+        # Per-status tiles from one GROUP BY instead of loading every job
+        status_counts = _job_status_counts(filter_status, site_id)
+
         col1, col2, col3, col4 = st.columns(4)
-        col1.metric("Total Jobs", len(jobs))
-        col2.metric("Completed", sum(1 for j in jobs if j.status == JobStatus.COMPLETED))
-        col3.metric("Running", sum(1 for j in jobs if j.status == JobStatus.RUNNING))
-        col4.metric("Failed", sum(1 for j in jobs if j.status == JobStatus.FAILED))
+        col1.metric("Total Jobs", total_jobs)
+        col2.metric("Completed", status_counts.get(JobStatus.COMPLETED, 0))
+        col3.metric("Running", status_counts.get(JobStatus.RUNNING, 0))
+        col4.metric("Failed", status_counts.get(JobStatus.FAILED, 0))
 
         st.markdown("---")
 
-        for job in jobs:
-            icon = _STATUS_ICONS.get(job.status, "\u26aa")
-            label = (
-                f"{icon} Job #{job.id} \u2014 {job.job_type} ({job.status.value}) "
-                f"\u2014 {job.started_at.strftime('%Y-%m-%d %H:%M')}"
+        page_count = math.ceil(total_jobs / PAGE_SIZE)
+        page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1)
+        st.caption(f"Page {page} of {page_count}")
+
+        jobs = session.execute(
+            _JOB_ROW.where(*conditions)
+            .order_by(Job.started_at.desc())
+            .limit(PAGE_SIZE)
+            .offset((page - 1) * PAGE_SIZE)
+        ).all()
+
+        durations = dict(
+            zip(
+                (job.id for job in jobs),
+                _fmt_durations(pd.Series([job.duration_seconds for job in jobs], dtype=object)),
             )
+        )
 
-            with st.expander(label, expanded=(job.status == JobStatus.RUNNING)):
+        for job in jobs:
+            with st.expander(_job_label(job), expanded=(job.status == JobStatus.RUNNING)):
                 col1, col2, col3 = st.columns(3)
 
                 with col1:
@@ -91,7 +158,7 @@ def render():
                     st.write(f"**Started:** {job.started_at.strftime('%Y-%m-%d %H:%M:%S')}")
                     if job.completed_at:
                         st.write(f"**Completed:** {job.completed_at.strftime('%Y-%m-%d %H:%M:%S')}")
-                    duration = _fmt_duration(job.duration_seconds)
+                    duration = durations[job.id]
                     if duration:
                         st.write(f"**Duration:** {duration}")
 
@@ -109,8 +176,8 @@ def render():
                 with col3:
                     st.write(f"**Wine Lists Downloaded:** {job.wine_lists_downloaded}")
 
-                    if job.site_of_record:
-                        st.write(f"**Site of Record:** {job.site_of_record.site_name}")
+                    if job.site_name:
+                        st.write(f"**Site of Record:** {job.site_name}")
 
                     if job.error_message:
                         st.error(f"**Error:** {job.error_message}")
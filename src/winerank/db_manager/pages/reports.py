@@ -1,8 +1,11 @@
 """Reports page - summary metrics and dashboards."""
+from collections import Counter
+from typing import NamedTuple
+
+import pandas as pd
 import streamlit as st
 import plotly.graph_objects as go
-from sqlalchemy import func
-from sqlalchemy.orm import joinedload
+from sqlalchemy import func, select
 
 from winerank.common.db import get_session
 from winerank.common.models import (
@@ -17,280 +20,327 @@ from winerank.common.models import (
 )
 
 
-def render():
-    """Render the Reports page."""
-    st.title("Reports Dashboard")
+# Heatmap rows, top to bottom: 3★ .. Bib Gourmand
+_HEATMAP_DISTINCTIONS = [
+    MichelinDistinction.THREE_STARS,
+    MichelinDistinction.TWO_STARS,
+    MichelinDistinction.ONE_STAR,
+    MichelinDistinction.BIB_GOURMAND,
+]
+
+# Top-level counts and crawl statistics in one round-trip: conditional
+# aggregates over restaurants plus scalar subqueries for the wine list / wine
+# tables.  Plain COUNT(*) throughout, so the planner may answer from whichever
+# index is smallest.
+_SUMMARY_COUNTS = select(
+    func.count().label("total_restaurants"),
+    func.count()
+    .filter(Restaurant.crawl_status == CrawlStatus.WINE_LIST_FOUND)
+    .label("wine_list_found"),
+    func.count()
+    .filter(Restaurant.crawl_status == CrawlStatus.DOWNLOAD_LIST_FAILED)
+    .label("download_failed"),
+    select(func.count()).select_from(WineList).scalar_subquery().label("total_wine_lists"),
+    select(func.count()).select_from(Wine).scalar_subquery().label("total_wines"),
+    # Crawl statistics over restaurants that have actually been crawled
+    func.sum(Restaurant.llm_tokens_used)
+    .filter(Restaurant.crawl_duration_seconds.isnot(None))
+    .label("total_tokens"),
+    func.sum(Restaurant.crawl_duration_seconds).label("total_time"),
+    func.sum(Restaurant.pages_visited)
+    .filter(Restaurant.crawl_duration_seconds.isnot(None))
+    .label("total_pages"),
+    func.avg(Restaurant.crawl_duration_seconds).label("avg_time"),
+).select_from(Restaurant)
+
+# One GROUP BY feeds the restaurants heatmap and the distinction / crawl
+# status breakdowns, which are re-aggregated in Python.
+_RESTAURANT_BREAKDOWN = select(
+    Restaurant.country,
+    Restaurant.michelin_distinction,
+    Restaurant.crawl_status,
+    func.count().label("count"),
+).group_by(
+    Restaurant.country,
+    Restaurant.michelin_distinction,
+    Restaurant.crawl_status,
+)
 
-    with get_session() as session:
-        # ── Top-level metrics ──────────────────────────────────────
-        col1, col2, col3, col4, col5 = st.columns(5)
+_WINE_LIST_HEATMAP = (
+    select(
+        Restaurant.country,
+        Restaurant.michelin_distinction,
+        func.count().label("count"),
+    )
+    .join(WineList, WineList.restaurant_id == Restaurant.id)
+    .where(Restaurant.michelin_distinction.in_(_HEATMAP_DISTINCTIONS))
+    .group_by(Restaurant.country, Restaurant.michelin_distinction)
+)
 
-        total_restaurants = session.query(func.count(Restaurant.id)).scalar()
-        col1.metric("Restaurants", total_restaurants)
+_SITE_COUNTS = (
+    select(SiteOfRecord.site_name, func.count(Restaurant.id).label("count"))
+    .outerjoin(Restaurant, Restaurant.site_of_record_id == SiteOfRecord.id)
+    .group_by(SiteOfRecord.id, SiteOfRecord.site_name)
+    .order_by(SiteOfRecord.site_name)
+)
 
-        wine_list_found = (
-            session.query(func.count(Restaurant.id))
-            .filter(Restaurant.crawl_status == CrawlStatus.WINE_LIST_FOUND)
-            .scalar()
-        )
-        col2.metric("Wine Lists Found", wine_list_found)
+_RECENT_JOBS = (
+    select(
+        Job.id,
+        SiteOfRecord.site_name,
+        Job.job_type,
+        Job.michelin_level,
+        Job.status,
+        Job.restaurants_processed,
+        Job.restaurants_found,
+        Job.wine_lists_downloaded,
+        Job.duration_seconds,
+        Job.started_at,
+    )
+    .outerjoin(SiteOfRecord, Job.site_of_record_id == SiteOfRecord.id)
+    .order_by(Job.started_at.desc())
+    .limit(10)
+)
 
-        download_failed = (
-            session.query(func.count(Restaurant.id))
-            .filter(Restaurant.crawl_status == CrawlStatus.DOWNLOAD_LIST_FAILED)
-            .scalar()
-        )
-        col3.metric("Download Failed", download_failed)
-
-        total_wine_lists = session.query(func.count(WineList.id)).scalar()
-        col4.metric("Downloaded Lists", total_wine_lists)
-
-        total_wines = session.query(func.count(Wine.id)).scalar()
-        col5.metric("Total Wines", total_wines)
-
-        # ── Heatmap: restaurants by country and distinction ─────────
-        st.markdown("---")
-        st.subheader("Restaurants by Country and Michelin Distinction")
-
-        _HEATMAP_DISTINCTIONS = [
-            MichelinDistinction.THREE_STARS,
-            MichelinDistinction.TWO_STARS,
-            MichelinDistinction.ONE_STAR,
-            MichelinDistinction.BIB_GOURMAND,
-        ]
-        heatmap_counts = (
-            session.query(
-                Restaurant.country,
-                Restaurant.michelin_distinction,
-                func.count(Restaurant.id).label("count"),
-            )
-            .filter(Restaurant.michelin_distinction.in_(_HEATMAP_DISTINCTIONS))
-            .group_by(Restaurant.country, Restaurant.michelin_distinction)
-            .all()
+
+class _ReportMetrics(NamedTuple):
+    summary: dict  # _SUMMARY_COUNTS labels -> values
+    breakdown: list[tuple]  # (country, distinction, crawl_status, count)
+    wine_list_heatmap: list[tuple]  # (country, distinction, count)
+    site_counts: list[tuple]  # (site_name, count)
+    recent_jobs: pd.DataFrame
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_report_metrics() -> _ReportMetrics:
+    """Run every dashboard query in one session (cached across reruns for 60s)."""
+    with get_session() as session:
+        return _ReportMetrics(
+            summary=dict(session.execute(_SUMMARY_COUNTS).mappings().one()),
+            breakdown=[tuple(row) for row in session.execute(_RESTAURANT_BREAKDOWN)],
+            wine_list_heatmap=[tuple(row) for row in session.execute(_WINE_LIST_HEATMAP)],
+            site_counts=[tuple(row) for row in session.execute(_SITE_COUNTS)],
+            recent_jobs=pd.read_sql_query(_RECENT_JOBS, session.connection()),
         )
 
-        if heatmap_counts:
-            # Distinct sorted countries and fixed distinction order (Y: top = 3★, bottom = Bib)
-            distinction_labels = ["3 Stars", "2 Stars", "1 Star", "Bib Gourmand"]
-            countries = sorted({row.country for row in heatmap_counts})
-            count_by_key = {(row.country, row.michelin_distinction): row.count for row in heatmap_counts}
 
-            # Build matrix: rows = distinction (3★..Bib), cols = country
-            z_matrix = []
-            for distinction in _HEATMAP_DISTINCTIONS:
-                z_matrix.append(
-                    [
-                        count_by_key.get((country, distinction), 0)
-                        for country in countries
-                    ]
-                )
-
-            fig = go.Figure(
-                data=go.Heatmap(
-                    z=z_matrix,
-                    x=countries,
-                    y=distinction_labels,
-                    colorscale="YlOrRd",
-                    text=[[str(c) for c in row] for row in z_matrix],
-                    texttemplate="%{text}",
-                    textfont={"size": 12},
-                    hoverongaps=False,
-                )
-            )
-            fig.update_layout(
-                xaxis_title="Country (Michelin site)",
-                yaxis_title="Michelin designation",
-                xaxis={"side": "bottom"},
-                yaxis={"autorange": "reversed"},
-                height=320,
-                margin=dict(t=40, b=50, l=120, r=30),
+def render():
+    """Render the Reports page."""
+    st.title("Reports Dashboard")
+
+    metrics = _fetch_report_metrics()
+    summary = metrics.summary
+    total_restaurants = summary["total_restaurants"]
+    wine_list_found = summary["wine_list_found"]
+
+    # ── Top-level metrics ──────────────────────────────────────
+    col1, col2, col3, col4, col5 = st.columns(5)
+    col1.metric("Restaurants", total_restaurants)
+    col2.metric("Wine Lists Found", wine_list_found)
+    col3.metric("Download Failed", summary["download_failed"])
+    col4.metric("Downloaded Lists", summary["total_wine_lists"])
+    col5.metric("Total Wines", summary["total_wines"])
+
+    # ── Heatmap: restaurants by country and distinction ─────────
+    st.markdown("---")
+    st.subheader("Restaurants by Country and Michelin Distinction")
+
+    count_by_key: Counter = Counter()
+    distinction_counts: Counter = Counter()
+    status_counts: Counter = Counter()
+    for country, distinction, status, count in metrics.breakdown:
+        if distinction in _HEATMAP_DISTINCTIONS:
+            count_by_key[(country, distinction)] += count
+        distinction_counts[distinction] += count
+        status_counts[status] += count
+
+    if count_by_key:
+        # Distinct sorted countries and fixed distinction order (Y: top = 3★, bottom = Bib)
+        distinction_labels = ["3 Stars", "2 Stars", "1 Star", "Bib Gourmand"]
+        countries = sorted({country for country, _ in count_by_key})
+
+        # Build matrix: rows = distinction (3★..Bib), cols = country
+        z_matrix = []
+        for distinction in _HEATMAP_DISTINCTIONS:
+            z_matrix.append(
+                [
+                    count_by_key.get((country, distinction), 0)
+                    for country in countries
+                ]
             )
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.info("No restaurant data for Bib Gourmand / 1–3 stars yet")
 
-        # ── Heatmap: downloaded wine lists by country and distinction ─
-        st.subheader("Downloaded Wine Lists by Country and Michelin Distinction")
+        fig = go.Figure(
+            data=go.Heatmap(
+                z=z_matrix,
+                x=countries,
+                y=distinction_labels,
+                colorscale="YlOrRd",
+                text=[[str(c) for c in row] for row in z_matrix],
+                texttemplate="%{text}",
+                textfont={"size": 12},
+                hoverongaps=False,
+            )
+        )
+        fig.update_layout(
+            xaxis_title="Country (Michelin site)",
+            yaxis_title="Michelin designation",
+            xaxis={"side": "bottom"},
+            yaxis={"autorange": "reversed"},
+            height=320,
+            margin=dict(t=40, b=50, l=120, r=30),
+        )
+        st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.info("No restaurant data for Bib Gourmand / 1–3 stars yet")
+
+    # ── Heatmap: downloaded wine lists by country and distinction ─
+    st.subheader("Downloaded Wine Lists by Country and Michelin Distinction")
+
+    wine_list_heatmap = metrics.wine_list_heatmap
+
+    if wine_list_heatmap:
+        distinction_labels_wl = ["3 Stars", "2 Stars", "1 Star", "Bib Gourmand"]
+        countries_wl = sorted({country for country, _, _ in wine_list_heatmap})
+        count_by_key_wl = {
+            (country, distinction): count
+            for country, distinction, count in wine_list_heatmap
+        }
+
+        z_matrix_wl = []
+        for distinction in _HEATMAP_DISTINCTIONS:
+            z_matrix_wl.append(
+                [
+                    count_by_key_wl.get((country, distinction), 0)
+                    for country in countries_wl
+                ]
+            )
 
-        wine_list_heatmap = (
-            session.query(
-                Restaurant.country,
-                Restaurant.michelin_distinction,
-                func.count(WineList.id).label("count"),
+        fig_wl = go.Figure(
+            data=go.Heatmap(
+                z=z_matrix_wl,
+                x=countries_wl,
+                y=distinction_labels_wl,
+                colorscale="YlOrRd",
+                text=[[str(c) for c in row] for row in z_matrix_wl],
+                texttemplate="%{text}",
+                textfont={"size": 12},
+                hoverongaps=False,
             )
-            .join(WineList, WineList.restaurant_id == Restaurant.id)
-            .filter(Restaurant.michelin_distinction.in_(_HEATMAP_DISTINCTIONS))
-            .group_by(Restaurant.country, Restaurant.michelin_distinction)
-            .all()
         )
+        fig_wl.update_layout(
+            xaxis_title="Country (Michelin site)",
+            yaxis_title="Michelin designation",
+            xaxis={"side": "bottom"},
+            yaxis={"autorange": "reversed"},
+            height=320,
+            margin=dict(t=40, b=50, l=120, r=30),
+        )
+        st.plotly_chart(fig_wl, use_container_width=True)
+    else:
+        st.info("No downloaded wine lists for Bib Gourmand / 1–3 stars yet")
+
+    # ── Crawl coverage ─────────────────────────────────────────
+    st.markdown("---")
+    st.subheader("Crawl Coverage")
+    if total_restaurants > 0:
+        coverage_pct = (wine_list_found / total_restaurants) * 100
+        st.progress(wine_list_found / total_restaurants)
+        st.write(
+            f"**{coverage_pct:.1f}%** of restaurants have wine lists found "
+            f"({wine_list_found}/{total_restaurants})"
+        )
+    else:
+        st.info("No restaurants in database yet")
+
+    # ── Breakdowns by site, distinction and crawl status ──────
+    st.markdown("---")
+    st.subheader("By Site of Record")
+    site_counts = metrics.site_counts
+    if site_counts:
+        st.dataframe(
+            pd.DataFrame(site_counts, columns=["Site", "Restaurants"]),
+            use_container_width=True,
+            hide_index=True,
+        )
+    else:
+        st.info("No sites of record yet (run `winerank db init`)")
 
-        if wine_list_heatmap:
-            distinction_labels_wl = ["3 Stars", "2 Stars", "1 Star", "Bib Gourmand"]
-            countries_wl = sorted({row.country for row in wine_list_heatmap})
-            count_by_key_wl = {(row.country, row.michelin_distinction): row.count for row in wine_list_heatmap}
+    st.markdown("---")
+    col1, col2 = st.columns(2)
 
-            z_matrix_wl = []
-            for distinction in _HEATMAP_DISTINCTIONS:
-                z_matrix_wl.append(
+    with col1:
+        st.subheader("By Distinction")
+        if distinction_counts:
+            st.dataframe(
+                pd.DataFrame(
                     [
-                        count_by_key_wl.get((country, distinction), 0)
-                        for country in countries_wl
-                    ]
-                )
-
-            fig_wl = go.Figure(
-                data=go.Heatmap(
-                    z=z_matrix_wl,
-                    x=countries_wl,
-                    y=distinction_labels_wl,
-                    colorscale="YlOrRd",
-                    text=[[str(c) for c in row] for row in z_matrix_wl],
-                    texttemplate="%{text}",
-                    textfont={"size": 12},
-                    hoverongaps=False,
-                )
-            )
-            fig_wl.update_layout(
-                xaxis_title="Country (Michelin site)",
-                yaxis_title="Michelin designation",
-                xaxis={"side": "bottom"},
-                yaxis={"autorange": "reversed"},
-                height=320,
-                margin=dict(t=40, b=50, l=120, r=30),
+                        (distinction.value if distinction else "Unknown", count)
+                        for distinction, count in distinction_counts.items()
+                    ],
+                    columns=["Distinction", "Count"],
+                ),
+                use_container_width=True,
+                hide_index=True,
             )
-            st.plotly_chart(fig_wl, use_container_width=True)
         else:
-            st.info("No downloaded wine lists for Bib Gourmand / 1–3 stars yet")
-
-        # ── Crawl coverage ─────────────────────────────────────────
-        st.markdown("---")
-        st.subheader("Crawl Coverage")
-        if total_restaurants > 0:
-            coverage_pct = (wine_list_found / total_restaurants) * 100
-            st.progress(wine_list_found / total_restaurants)
-            st.write(
-                f"**{coverage_pct:.1f}%** of restaurants have wine lists found "
-                f"({wine_list_found}/{total_restaurants})"
+            st.info("No data yet")
+
+    with col2:
+        st.subheader("By Crawl Status")
+        if status_counts:
+            st.dataframe(
+                pd.DataFrame(
+                    [(status.value, count) for status, count in status_counts.items()],
+                    columns=["Crawl Status", "Count"],
+                ),
+                use_container_width=True,
+                hide_index=True,
             )
         else:
-            st.info("No restaurants in database yet")
-
-        # ── Breakdowns by site, distinction and crawl status ──────
-        st.markdown("---")
-        st.subheader("By Site of Record")
-        site_counts = (
-            session.query(
-                SiteOfRecord.site_name,
-                func.count(Restaurant.id).label("count"),
-            )
-            .outerjoin(Restaurant, Restaurant.site_of_record_id == SiteOfRecord.id)
-            .group_by(SiteOfRecord.id, SiteOfRecord.site_name)
-            .order_by(SiteOfRecord.site_name)
-            .all()
-        )
-        if site_counts:
-            for site_name, count in site_counts:
-                st.write(f"**{site_name}:** {count}")
-        else:
-            st.info("No sites of record yet (run `winerank db init`)")
-
-        st.markdown("---")
-        col1, col2 = st.columns(2)
-
-        with col1:
-            st.subheader("By Distinction")
-            distinction_counts = (
-                session.query(
-                    Restaurant.michelin_distinction,
-                    func.count(Restaurant.id).label("count"),
-                )
-                .group_by(Restaurant.michelin_distinction)
-                .all()
-            )
-            if distinction_counts:
-                for distinction, count in distinction_counts:
-                    label = distinction.value if distinction else "Unknown"
-                    st.write(f"**{label}:** {count}")
-            else:
-                st.info("No data yet")
-
-        with col2:
-            st.subheader("By Crawl Status")
-            status_counts = (
-                session.query(
-                    Restaurant.crawl_status,
-                    func.count(Restaurant.id).label("count"),
-                )
-                .group_by(Restaurant.crawl_status)
-                .all()
-            )
-            if status_counts:
-                for status, count in status_counts:
-                    st.write(f"**{status.value}:** {count}")
-            else:
-                st.info("No data yet")
-
-        # ── Crawl statistics ───────────────────────────────────────
-        st.markdown("---")
-        st.subheader("Crawl Statistics")
-
-        stats = (
-            session.query(
-                func.sum(Restaurant.llm_tokens_used).label("total_tokens"),
-                func.sum(Restaurant.crawl_duration_seconds).label("total_time"),
-                func.sum(Restaurant.pages_visited).label("total_pages"),
-                func.avg(Restaurant.crawl_duration_seconds).label("avg_time"),
-            )
-            .filter(Restaurant.crawl_duration_seconds.isnot(None))
-            .first()
+            st.info("No data yet")
+
+    # ── Crawl statistics ───────────────────────────────────────
+    st.markdown("---")
+    st.subheader("Crawl Statistics")
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Total LLM Tokens", f"{int(summary['total_tokens'] or 0):,}")
+
+    total_time = float(summary["total_time"] or 0)
+    mins = int(total_time // 60)
+    secs = int(total_time % 60)
+    col2.metric("Total Crawl Time", f"{mins}m {secs}s")
+
+    col3.metric("Total Pages Visited", int(summary["total_pages"] or 0))
+
+    avg_time = float(summary["avg_time"] or 0)
+    col4.metric("Avg Crawl Time / Restaurant", f"{avg_time:.1f}s")
+
+    # ── Recent jobs ────────────────────────────────────────────
+    st.markdown("---")
+    st.subheader("Recent Jobs")
+    jobs_df = metrics.recent_jobs
+
+    if not jobs_df.empty:
+        secs = jobs_df["duration_seconds"].fillna(0)
+        duration = (
+            (secs // 60).astype(int).astype(str) + "m "
+            + (secs % 60).astype(int).astype(str) + "s"
+        ).where(secs > 0, "")
+        job_table = pd.DataFrame(
+            {
+                "ID": jobs_df["id"],
+                "Site": jobs_df["site_name"].fillna("N/A"),
+                "Type": jobs_df["job_type"],
+                "Level": jobs_df["michelin_level"].fillna("N/A"),
+                "Status": jobs_df["status"].map(lambda status: JobStatus(status).value),
+                "Progress": jobs_df["restaurants_processed"].astype(str)
+                + "/" + jobs_df["restaurants_found"].astype(str),
+                "Wine Lists": jobs_df["wine_lists_downloaded"],
+                "Duration": duration,
+                "Started": pd.to_datetime(jobs_df["started_at"]).dt.strftime("%Y-%m-%d %H:%M"),
+            }
         )
-
-        col1, col2, col3, col4 = st.columns(4)
-        col1.metric("Total LLM Tokens", f"{int(stats.total_tokens or 0):,}")
-
-        total_time = float(stats.total_time or 0)
-        mins = int(total_time // 60)
-        secs = int(total_time % 60)
-        col2.metric("Total Crawl Time", f"{mins}m {secs}s")
-
-        col3.metric("Total Pages Visited", int(stats.total_pages or 0))
-
-        avg_time = float(stats.avg_time or 0)
-        col4.metric("Avg Crawl Time / Restaurant", f"{avg_time:.1f}s")
-
-        # ── Recent jobs ────────────────────────────────────────────
-        st.markdown("---")
-        st.subheader("Recent Jobs")
-        recent_jobs = (
-            session.query(Job)
-            .options(joinedload(Job.site_of_record))
-            .order_by(Job.started_at.desc())
-            .limit(10)
-            .all()
-        )
-
-        if recent_jobs:
-            job_data = []
-            for job in recent_jobs:
-                duration = ""
-                if job.duration_seconds:
-                    m = int(job.duration_seconds // 60)
-                    s = int(job.duration_seconds % 60)
-                    duration = f"{m}m {s}s"
-                site_name = job.site_of_record.site_name if job.site_of_record else "N/A"
-                job_data.append(
-                    {
-                        "ID": job.id,
-                        "Site": site_name,
-                        "Type": job.job_type,
-                        "Level": job.michelin_level or "N/A",
-                        "Status": job.status.value,
-                        "Progress": f"{job.restaurants_processed}/{job.restaurants_found}",
-                        "Wine Lists": job.wine_lists_downloaded,
-                        "Duration": duration,
-                        "Started": job.started_at.strftime("%Y-%m-%d %H:%M"),
-                    }
-                )
-            st.dataframe(job_data, use_container_width=True)
-        else:
-            st.info("No jobs run yet")
+        st.dataframe(job_table, use_container_width=True, hide_index=True)
+    else:
+        st.info("No jobs run yet")
@@ -1,19 +1,186 @@
 """Restaurants page - view and manage restaurants."""
+import math
+from typing import cast
+
 import streamlit as st
 import pandas as pd
-from sqlalchemy.orm import joinedload
+from sqlalchemy import func, select
+from sqlalchemy.orm import joinedload, selectinload
 
 from winerank.common.db import get_session
 from winerank.common.models import Restaurant, SiteOfRecord, MichelinDistinction, CrawlStatus
 
 
+_RESTAURANT_ROWS = (
+    select(
+        SiteOfRecord.site_name,
+        Restaurant.id,
+        Restaurant.name,
+        Restaurant.michelin_distinction,
+        Restaurant.address,
+        Restaurant.city,
+        Restaurant.state,
+        Restaurant.zip_code,
+        Restaurant.country,
+        Restaurant.cuisine,
+        Restaurant.price_range,
+        Restaurant.crawl_status,
+        Restaurant.wine_list_url,
+        Restaurant.crawl_duration_seconds,
+        Restaurant.llm_tokens_used,
+        Restaurant.pages_visited,
+        Restaurant.last_crawled_at,
+    )
+    .outerjoin(SiteOfRecord, Restaurant.site_of_record_id == SiteOfRecord.id)
+    .order_by(Restaurant.name, Restaurant.id)
+)
+
+# Row count and highest ID for the current filters (pagination / detail bounds)
+_RESTAURANT_TOTALS = (
+    select(func.count().label("total"), func.max(Restaurant.id).label("max_id"))
+    .select_from(Restaurant)
+    .outerjoin(SiteOfRecord, Restaurant.site_of_record_id == SiteOfRecord.id)
+)
+
+PAGE_SIZES = [50, 100, 250, 500]
+
+
+def _fmt_crawl_times(seconds: pd.Series) -> pd.Series:
+    """Format crawl durations as "12.3s" under a minute, else "1.5m"; "" if unknown."""
+    secs = cast(pd.Series, pd.to_numeric(seconds, errors="coerce")).astype(float)
+    # str.format rounds like the detail pane's f"{secs:.1f}s", without float artifacts
+    under_minute = secs.map("{:.1f}s".format)
+    over_minute = (secs / 60).map("{:.1f}m".format)
+    return under_minute.where(secs < 60, over_minute).where(secs > 0, "")
+
+
+def _restaurant_conditions(
+    filter_name: str,
+    filter_site: str,
+    filter_distinction: list[str],
+    filter_status: list[str],
+    filter_has_wine_list: str,
+) -> list:
+    """WHERE clauses for the page's filter widgets."""
+    conditions = []
+    if filter_name:
+        conditions.append(Restaurant.name.ilike(f"%{filter_name}%"))
+    if filter_site and filter_site != "All":
+        conditions.append(SiteOfRecord.site_name == filter_site)
+    if filter_distinction:
+        conditions.append(Restaurant.michelin_distinction.in_(filter_distinction))
+    if filter_status:
+        conditions.append(Restaurant.crawl_status.in_(filter_status))
+    if filter_has_wine_list == "Yes":
+        conditions.append(Restaurant.wine_list_url.isnot(None))
+    elif filter_has_wine_list == "No":
+        conditions.append(Restaurant.wine_list_url.is_(None))
+    return conditions
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _count_restaurants(*filters) -> tuple[int, int | None]:
+    """(matching rows, highest matching ID) for the given filters."""
+    with get_session() as session:
+        row = session.execute(
+            _RESTAURANT_TOTALS.where(*_restaurant_conditions(*filters))
+        ).one()
+    return row.total, row.max_id
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_restaurants(filters: tuple, page: int, page_size: int) -> pd.DataFrame:
+    """Build one page of the restaurants table (cached per filter set and page).
+
+    Rows are read straight into pandas from a Core select; no ORM objects.
+    """
+    query = (
+        _RESTAURANT_ROWS.where(*_restaurant_conditions(*filters))
+        .limit(page_size)
+        .offset((page - 1) * page_size)
+    )
+
+    with get_session() as session:
+        rows = pd.read_sql_query(query, session.connection())
+
+    last_crawled = pd.to_datetime(rows["last_crawled_at"])
+    has_wine_list = cast(pd.Series, rows["wine_list_url"]).fillna("").astype(bool)
+    crawl_seconds = cast(pd.Series, rows["crawl_duration_seconds"])
+    return pd.DataFrame(
+        {
+            "Site": rows["site_name"].fillna("\u2014"),
+            "ID": rows["id"],
+            "Name": rows["name"],
+            "Distinction": rows["michelin_distinction"].map(
+                lambda d: MichelinDistinction(d).value, na_action="ignore"
+            ).fillna(""),
+            "Address": rows["address"].fillna(""),
+            "City": rows["city"].fillna(""),
+            "State": rows["state"].fillna(""),
+            "ZIP": rows["zip_code"].fillna(""),
+            "Country": rows["country"].fillna(""),
+            "Cuisine": rows["cuisine"].fillna(""),
+            "Price": rows["price_range"].fillna(""),
+            "Status": rows["crawl_status"].map(lambda c: CrawlStatus(c).value),
+            "Wine List": has_wine_list.map({True: "\u2713", False: "\u2717"}),
+            "Crawl Time": _fmt_crawl_times(crawl_seconds),
+            "LLM Tokens": rows["llm_tokens_used"].fillna(0).astype(int),
+            "Pages": rows["pages_visited"].fillna(0).astype(int),
+            "Last Crawled": last_crawled.dt.strftime("%Y-%m-%d").fillna("Never"),
+        }
+    )
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _get_restaurant(restaurant_id: int) -> dict | None:
+    """Detail fields for one restaurant, plus its wine lists (cached per id)."""
+    with get_session() as session:
+        r = (
+            session.query(Restaurant)
+            .options(
+                joinedload(Restaurant.site_of_record),
+                selectinload(Restaurant.wine_lists),
+            )
+            .filter_by(id=restaurant_id)
+            .first()
+        )
+        if not r:
+            return None
+        return {
+            "name": r.name,
+            "site_name": r.site_of_record.site_name if r.site_of_record else None,
+            "distinction": r.michelin_distinction.value if r.michelin_distinction else None,
+            "address": r.address,
+            "city": r.city,
+            "state": r.state,
+            "zip_code": r.zip_code,
+            "country": r.country,
+            "cuisine": r.cuisine,
+            "price_range": r.price_range,
+            "crawl_status": r.crawl_status.value,
+            "website_url": r.website_url,
+            "wine_list_url": r.wine_list_url,
+            "michelin_url": r.michelin_url,
+            "last_crawled_at": r.last_crawled_at,
+            "crawl_duration_seconds": r.crawl_duration_seconds,
+            "llm_tokens_used": r.llm_tokens_used,
+            "pages_visited": r.pages_visited,
+            "comment": r.comment,
+            "wine_lists": [
+                (wl.list_name, wl.wine_count, wl.downloaded_at) for wl in r.wine_lists
+            ],
+        }
+
+
 def render():
     """Render the Restaurants page."""
     st.title("Restaurants")
 
     with get_session() as session:
-        sites = session.query(SiteOfRecord).order_by(SiteOfRecord.site_name).all()
-        site_options = ["All"] + [s.site_name for s in sites]
+        site_names = session.scalars(
+            select(SiteOfRecord.site_name).order_by(SiteOfRecord.site_name)
+        ).all()
+        site_options = ["All", *site_names]
 
     filter_name = st.text_input("Search by Name", placeholder="Type to filter…")
 
@@ -49,141 +216,92 @@ def render():
 
     st.markdown("---")
 
-    with get_session() as session:
-        query = (
-            session.query(Restaurant)
-            .options(joinedload(Restaurant.site_of_record))
-        )
+    filters = (filter_name, filter_site, filter_distinction, filter_status, filter_has_wine_list)
+    total, max_id = _count_restaurants(*filters)
 
-        if filter_name:
-            query = query.filter(Restaurant.name.ilike(f"%{filter_name}%"))
-        if filter_site and filter_site != "All":
-            site = session.query(SiteOfRecord).filter_by(site_name=filter_site).first()
-            if site:
-                query = query.filter(Restaurant.site_of_record_id == site.id)
-        if filter_distinction:
-            query = query.filter(Restaurant.michelin_distinction.in_(filter_distinction))
-        if filter_status:
-            query = query.filter(Restaurant.crawl_status.in_(filter_status))
-        if filter_has_wine_list == "Yes":
-            query = query.filter(Restaurant.wine_list_url.isnot(None))
-        elif filter_has_wine_list == "No":
-            query = query.filter(Restaurant.wine_list_url.is_(None))
-
-        restaurants = query.order_by(Restaurant.name).all()
-
-        st.write(f"**Total: {len(restaurants)} restaurants**")
-
-        if not restaurants:
-            st.info("No restaurants match the selected filters")
-            return
-
-        # Build table data with new columns
-        data = []
-        for r in restaurants:
-            duration = ""
-            if r.crawl_duration_seconds:
-                secs = float(r.crawl_duration_seconds)
-                duration = f"{secs:.1f}s" if secs < 60 else f"{secs / 60:.1f}m"
-
-            site_name = r.site_of_record.site_name if r.site_of_record else "\u2014"
-            data.append(
-                {
-                    "Site": site_name,
-                    "ID": r.id,
-                    "Name": r.name,
-                    "Distinction": r.michelin_distinction.value if r.michelin_distinction else "",
-                    "Address": r.address or "",
-                    "City": r.city or "",
-                    "State": r.state or "",
-                    "ZIP": r.zip_code or "",
-                    "Country": r.country or "",
-                    "Cuisine": r.cuisine or "",
-                    "Price": r.price_range or "",
-                    "Status": r.crawl_status.value,
-                    "Wine List": "\u2713" if r.wine_list_url else "\u2717",
-                    "Crawl Time": duration,
-                    "LLM Tokens": r.llm_tokens_used or 0,
-                    "Pages": r.pages_visited or 0,
-                    "Last Crawled": r.last_crawled_at.strftime("%Y-%m-%d") if r.last_crawled_at else "Never",
-                }
-            )
+    st.write(f"**Total: {total} restaurants**")
 
-        df = pd.DataFrame(data)
-        st.dataframe(df, use_container_width=True, hide_index=True)
+    # max_id is None only when nothing matches (MAX over an empty set)
+    if not total or max_id is None:
+        st.info("No restaurants match the selected filters")
+        return
 
-        # Detail view
-        st.markdown("---")
-        st.subheader("Restaurant Details")
-
-        selected_id = st.number_input(
-            "Select Restaurant ID to view details",
-            min_value=1,
-            max_value=max(r.id for r in restaurants),
-            value=restaurants[0].id,
-            step=1,
-        )
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        page_size = st.selectbox("Page size", options=PAGE_SIZES, index=1)
+    page_count = math.ceil(total / page_size)
+    with col2:
+        page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1)
+    st.caption(f"Page {page} of {page_count}")
 
-        selected = (
-            session.query(Restaurant)
-            .options(joinedload(Restaurant.site_of_record))
-            .filter_by(id=selected_id)
-            .first()
-        )
+    df = _load_restaurants(filters, int(page), page_size)
+    st.dataframe(df, use_container_width=True, hide_index=True)
 
-        if not selected:
-            st.warning(f"Restaurant with ID {selected_id} not found")
-            return
+    # Detail view
+    st.markdown("---")
+    st.subheader("Restaurant Details")
 
-        col1, col2, col3 = st.columns(3)
+    selected_id = st.number_input(
+        "Select Restaurant ID to view details",
+        min_value=1,
+        max_value=int(max_id),
+        value=int(df["ID"].iloc[0]),
+        step=1,
+    )
 
-        with col1:
-            st.write(f"**Name:** {selected.name}")
-            st.write(
-                f"**Site:** {selected.site_of_record.site_name if selected.site_of_record else 'N/A'}"
-            )
+    selected = _get_restaurant(int(selected_id))
+
+    if not selected:
+        st.warning(f"Restaurant with ID {selected_id} not found")
+        return
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.write(f"**Name:** {selected['name']}")
+        st.write(f"**Site:** {selected['site_name'] or 'N/A'}")
+        st.write(f"**Distinction:** {selected['distinction'] or 'N/A'}")
+        st.write(f"**Address:** {selected['address'] or 'N/A'}")
+        st.write(f"**City:** {selected['city'] or 'N/A'}")
+        st.write(f"**State:** {selected['state'] or 'N/A'}")
+        st.write(f"**ZIP:** {selected['zip_code'] or 'N/A'}")
+        st.write(f"**Country:** {selected['country']}")
+        st.write(f"**Cuisine:** {selected['cuisine'] or 'N/A'}")
+        st.write(f"**Price Range:** {selected['price_range'] or 'N/A'}")
+
+    with col2:
+        st.write(f"**Status:** {selected['crawl_status']}")
+        website_url = selected["website_url"]
+        if website_url:
+            st.write(f"**Website:** [{website_url}]({website_url})")
+        else:
+            st.write("**Website:** N/A")
+        wine_list_url = selected["wine_list_url"]
+        if wine_list_url:
+            st.write(f"**Wine List URL:** [{wine_list_url}]({wine_list_url})")
+        else:
+            st.write("**Wine List URL:** Not found")
+        st.write(f"**Michelin URL:** {selected['michelin_url'] or 'N/A'}")
+        st.write(f"**Last Crawled:** {selected['last_crawled_at'] or 'Never'}")
+
+    with col3:
+        st.write("**Crawl Statistics**")
+        if selected["crawl_duration_seconds"]:
+            secs = float(selected["crawl_duration_seconds"])
+            st.write(f"Duration: {secs:.1f}s")
+        else:
+            st.write("Duration: \u2014")
+        st.write(f"LLM Tokens: {selected['llm_tokens_used'] or 0}")
+        st.write(f"Pages Visited: {selected['pages_visited'] or 0}")
+
+    if selected["comment"]:
+        st.write(f"**Comment:** {selected['comment']}")
+
+    if selected["wine_lists"]:
+        st.markdown("---")
+        st.subheader("Wine Lists")
+        for list_name, wine_count, downloaded_at in selected["wine_lists"]:
             st.write(
-                f"**Distinction:** {selected.michelin_distinction.value if selected.michelin_distinction else 'N/A'}"
+                f"- {list_name or 'Unnamed'} ({wine_count} wines) \u2014 "
+                f"Downloaded: {downloaded_at.strftime('%Y-%m-%d')}"
             )
-            st.write(f"**Address:** {selected.address or 'N/A'}")
-            st.write(f"**City:** {selected.city or 'N/A'}")
-            st.write(f"**State:** {selected.state or 'N/A'}")
-            st.write(f"**ZIP:** {selected.zip_code or 'N/A'}")
-            st.write(f"**Country:** {selected.country}")
-            st.write(f"**Cuisine:** {selected.cuisine or 'N/A'}")
-            st.write(f"**Price Range:** {selected.price_range or 'N/A'}")
-
-        with col2:
-            st.write(f"**Status:** {selected.crawl_status.value}")
-            if selected.website_url:
-                st.write(f"**Website:** [{selected.website_url}]({selected.website_url})")
-            else:
-                st.write("**Website:** N/A")
-            if selected.wine_list_url:
-                st.write(f"**Wine List URL:** [{selected.wine_list_url}]({selected.wine_list_url})")
-            else:
-                st.write("**Wine List URL:** Not found")
-            st.write(f"**Michelin URL:** {selected.michelin_url or 'N/A'}")
-            st.write(f"**Last Crawled:** {selected.last_crawled_at or 'Never'}")
-
-        with col3:
-            st.write("**Crawl Statistics**")
-            if selected.crawl_duration_seconds:
-                secs = float(selected.crawl_duration_seconds)
-                st.write(f"Duration: {secs:.1f}s")
-            else:
-                st.write("Duration: \u2014")
-            st.write(f"LLM Tokens: {selected.llm_tokens_used or 0}")
-            st.write(f"Pages Visited: {selected.pages_visited or 0}")
-
-        if selected.comment:
-            st.write(f"**Comment:** {selected.comment}")
-
-        if selected.wine_lists:
-            st.markdown("---")
-            st.subheader("Wine Lists")
-            for wl in selected.wine_lists:
-                st.write(
-                    f"- {wl.list_name or 'Unnamed'} ({wl.wine_count} wines) \u2014 "
-                    f"Downloaded: {wl.downloaded_at.strftime('%Y-%m-%d')}"
-                )
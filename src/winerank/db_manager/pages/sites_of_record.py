@@ -1,8 +1,28 @@
 """Sites of Record page - manage starting points for crawling."""
 import streamlit as st
+from sqlalchemy import func, select
 
 from winerank.common.db import get_session
-from winerank.common.models import SiteOfRecord
+from winerank.common.models import Job, Restaurant, SiteOfRecord
+
+
+# One row per site with its restaurant / job counts as correlated subqueries,
+# instead of lazy-loading both collections just to take len()
+_SITES = select(
+    SiteOfRecord.site_name,
+    SiteOfRecord.site_url,
+    SiteOfRecord.navigational_notes,
+    SiteOfRecord.created_at,
+    SiteOfRecord.last_visited_at,
+    select(func.count())
+    .where(Restaurant.site_of_record_id == SiteOfRecord.id)
+    .scalar_subquery()
+    .label("restaurant_count"),
+    select(func.count())
+    .where(Job.site_of_record_id == SiteOfRecord.id)
+    .scalar_subquery()
+    .label("job_count"),
+).order_by(SiteOfRecord.created_at)
 
 
 def render():
@@ -14,7 +34,7 @@ def render():
     st.markdown("---")
 
     with get_session() as session:
-        sites = session.query(SiteOfRecord).order_by(SiteOfRecord.created_at).all()
+        sites = session.execute(_SITES).all()
 
         if not sites:
             st.info("No sites of record configured. Run `winerank db init` to seed the Michelin Guide site.")
@@ -41,5 +61,5 @@ def render():
                     else:
                         st.write("**Last Visited:** Never")
 
-                    st.metric("Restaurants", len(site.restaurants))
-                    st.metric("Jobs", len(site.jobs))
+                    st.metric("Restaurants", site.restaurant_count)
+                    st.metric("Jobs", site.job_count)
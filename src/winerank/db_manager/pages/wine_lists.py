@@ -1,67 +1,150 @@
 """Wine Lists page - view downloaded wine lists."""
+import codecs
+import os
+from itertools import groupby
+from operator import itemgetter
+
 import streamlit as st
-from pathlib import Path
+from sqlalchemy import select
 
 from winerank.common.db import get_session
 from winerank.common.models import WineList, Restaurant
 
 
+_WINE_LISTS = (
+    select(
+        WineList.id,
+        WineList.restaurant_id,
+        Restaurant.name.label("restaurant_name"),
+        WineList.list_name,
+        WineList.source_url,
+        WineList.local_file_path,
+        WineList.text_file_path,
+        WineList.wine_count,
+        WineList.downloaded_at,
+        WineList.file_hash,
+        WineList.comment,
+    )
+    .join(Restaurant, WineList.restaurant_id == Restaurant.id)
+    .order_by(Restaurant.name, Restaurant.id, WineList.downloaded_at.desc())
+)
+
+
+# "View Text" shows this much of the extracted text unless the full file is requested
+_TEXT_PREVIEW_BYTES = 64 * 1024
+
+
+def _read_text(path: str, limit: int | None = None) -> str:
+    """Decode the first ``limit`` bytes of ``path`` (all of it when None).
+
+    A multi-byte character cut by the limit is dropped rather than replaced.
+    """
+    with open(path, "rb") as f:
+        data = f.read() if limit is None else f.read(limit)
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    return decoder.decode(data, final=limit is None)
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _read_preview(path: str, mtime: float) -> str:
+    """The bounded head of ``path`` shown by "View Text" (cached per file).
+
+    ``mtime`` only keys the cache, so an edited file is re-read.  Full-file
+    reads go through ``_read_text`` uncached and are never pinned here.
+    """
+    return _read_text(path, _TEXT_PREVIEW_BYTES)
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _existing_files(directories: frozenset[str]) -> frozenset[str]:
+    """Normalized paths of everything in ``directories`` (one scandir each)."""
+    existing = set()
+    for directory in directories:
+        try:
+            with os.scandir(directory) as entries:
+                existing.update(os.path.normpath(entry.path) for entry in entries)
+        except OSError:
+            continue
+    return frozenset(existing)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_wine_lists() -> list[tuple[str, list[dict]]]:
+    """(restaurant name, wine lists) pairs (cached across reruns for 60s).
+
+    Rows arrive sorted by restaurant, so consecutive runs form the groups.
+    """
+    with get_session() as session:
+        rows = session.execute(_WINE_LISTS).mappings().all()
+    return [
+        (group[0]["restaurant_name"], group)
+        for group in (
+            [dict(row) for row in run]
+            for _, run in groupby(rows, key=itemgetter("restaurant_id"))
+        )
+    ]
+
+
 def render():
     """Render the Wine Lists page."""
     st.title("Wine Lists")
 
-    with get_session() as session:
-        wine_lists = (
-            session.query(WineList)
-            .join(Restaurant)
-            .order_by(Restaurant.name, WineList.downloaded_at.desc())
-            .all()
-        )
+    grouped = _load_wine_lists()
+    if not grouped:
+        st.info("No wine lists downloaded yet. Run the crawler to find and download wine lists.")
+        return
+
+    total = sum(len(lists) for _, lists in grouped)
+    text_paths = [
+        wl["text_file_path"] for _, lists in grouped for wl in lists if wl["text_file_path"]
+    ]
+    existing = _existing_files(
+        frozenset(os.path.dirname(path) or "." for path in text_paths)
+    )
+    st.write(f"**Total: {total} wine lists**")
+
+    for rest_name, lists in grouped:
+        suffix = "s" if len(lists) > 1 else ""
+        with st.expander(f"{rest_name} ({len(lists)} list{suffix})", expanded=False):
+            for wl in lists:
+                col1, col2 = st.columns([3, 1])
+
+                with col1:
+                    st.write(f"**List:** {wl['list_name'] or 'Unnamed'}")
+                    st.write(f"**Source:** {wl['source_url']}")
+                    st.write(f"**File:** `{wl['local_file_path']}`")
+                    if wl["text_file_path"]:
+                        st.write(f"**Text:** `{wl['text_file_path']}`")
+
+                with col2:
+                    st.metric("Wines", wl["wine_count"])
+                    st.write(f"Downloaded: {wl['downloaded_at'].strftime('%Y-%m-%d')}")
+                    st.write(f"Hash: `{wl['file_hash'][:8]}...`")
+
+                if wl["text_file_path"] and os.path.normpath(wl["text_file_path"]) in existing:
+                    if st.toggle("View Text", key=f"view_text_{wl['id']}"):
+                        try:
+                            path = wl["text_file_path"]
+                            stat = os.stat(path)
+                            full = stat.st_size <= _TEXT_PREVIEW_BYTES or st.checkbox(
+                                f"Load full file ({stat.st_size // 1024:,} KB)",
+                                key=f"full_text_{wl['id']}",
+                            )
+                            text = (
+                                _read_text(path)
+                                if full and stat.st_size > _TEXT_PREVIEW_BYTES
+                                else _read_preview(path, stat.st_mtime)
+                            )
+                            st.text_area(
+                                "Extracted Text",
+                                text,
+                                height=400,
+                                key=f"text_area_{wl['id']}_{'full' if full else 'head'}",
+                            )
+                        except Exception as e:
+                            st.error(f"Error reading text file: {e}")
+
+                if wl["comment"]:
+                    st.info(f"Comment: {wl['comment']}")
 
-        if not wine_lists:
-            st.info("No wine lists downloaded yet. Run the crawler to find and download wine lists.")
-            return
-
-        st.write(f"**Total: {len(wine_lists)} wine lists**")
-
-        # Group by restaurant
-        restaurants_dict: dict[str, list[WineList]] = {}
-        for wl in wine_lists:
-            rest_name = wl.restaurant.name
-            restaurants_dict.setdefault(rest_name, []).append(wl)
-
-        for rest_name, lists in restaurants_dict.items():
-            suffix = "s" if len(lists) > 1 else ""
-            with st.expander(f"{rest_name} ({len(lists)} list{suffix})", expanded=False):
-                for wl in lists:
-                    col1, col2 = st.columns([3, 1])
-
-                    with col1:
-                        st.write(f"**List:** {wl.list_name or 'Unnamed'}")
-                        st.write(f"**Source:** {wl.source_url}")
-                        st.write(f"**File:** `{wl.local_file_path}`")
-                        if wl.text_file_path:
-                            st.write(f"**Text:** `{wl.text_file_path}`")
-
-                    with col2:
-                        st.metric("Wines", wl.wine_count)
-                        st.write(f"Downloaded: {wl.downloaded_at.strftime('%Y-%m-%d')}")
-                        st.write(f"Hash: `{wl.file_hash[:8]}...`")
-
-                    if wl.text_file_path and Path(wl.text_file_path).exists():
-                        if st.button("View Text", key=f"view_text_{wl.id}"):
-                            try:
-                                text_content = Path(wl.text_file_path).read_text(encoding="utf-8")
-                                st.text_area(
-                                    "Extracted Text",
-                                    text_content,
-                                    height=400,
-                                    key=f"text_area_{wl.id}",
-                                )
-                            except Exception as e:
-                                st.error(f"Error reading text file: {e}")
-
-                    if wl.comment:
-                        st.info(f"Comment: {wl.comment}")
-
-                    st.markdown("---")
+                st.markdown("---")
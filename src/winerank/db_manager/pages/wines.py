@@ -1,11 +1,59 @@
 """Wines page - browse and search wines."""
 import streamlit as st
 import pandas as pd
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import joinedload
 
 from winerank.common.db import get_session
 from winerank.common.models import Wine, WineList, Restaurant
 
 
+PAGE_SIZE = 100
+
+# Table columns (plus the detail-only fields), with the owning restaurant's name
+_WINE_ROWS = (
+    select(
+        Wine.id,
+        Wine.name,
+        Wine.winery,
+        Wine.varietal,
+        Wine.wine_type,
+        Wine.vintage,
+        Wine.country,
+        Wine.region,
+        Wine.price,
+        Wine.vineyard,
+        Wine.format,
+        Wine.note,
+        Restaurant.name.label("restaurant_name"),
+    )
+    .join(WineList, Wine.wine_list_id == WineList.id)
+    .join(Restaurant, WineList.restaurant_id == Restaurant.id)
+)
+
+_DETAIL_FIELDS = (
+    "name", "winery", "varietal", "wine_type", "vintage",
+    "country", "region", "vineyard", "format", "price", "note",
+)
+
+
+def _wine_detail_from_rows(wines: pd.DataFrame, wine_id: int) -> dict | None:
+    """Detail fields for ``wine_id`` if it is among the fetched rows, else None."""
+    match = wines[wines["id"] == wine_id]
+    if match.empty:
+        return None
+    row = match.iloc[0]
+    return {
+        field: None if pd.isna(row[field]) else row[field]
+        for field in (*_DETAIL_FIELDS, "restaurant_name")
+    }
+
+
+def _set_cursor(cursor: tuple[str, int] | None) -> None:
+    """Move the keyset cursor: the (name, id) of the last row on the previous page."""
+    st.session_state["wines_cursor"] = cursor
+
+
 def render():
     """Render the Wines page."""
     st.title("Wines")
@@ -24,46 +72,81 @@ def render():
 
     st.markdown("---")
 
+    # Keyset pagination: remember where the last page ended; new filters start over
+    filters = (search_name, filter_varietal, filter_type, filter_country)
+    if st.session_state.get("wines_filters") != filters:
+        st.session_state["wines_filters"] = filters
+        st.session_state["wines_cursor"] = None
+    cursor = st.session_state["wines_cursor"]
+
     with get_session() as session:
-        query = session.query(Wine).join(WineList).join(Restaurant)
+        query = _WINE_ROWS
 
+        # Substring filters; on PostgreSQL the ix_wines_*_trgm GIN indexes serve ILIKE
         if search_name:
-            query = query.filter(
+            query = query.where(
                 (Wine.name.ilike(f"%{search_name}%")) | (Wine.winery.ilike(f"%{search_name}%"))
             )
         if filter_varietal:
-            query = query.filter(Wine.varietal.ilike(f"%{filter_varietal}%"))
+            query = query.where(Wine.varietal.ilike(f"%{filter_varietal}%"))
         if filter_type:
-            query = query.filter(Wine.wine_type.ilike(f"%{filter_type}%"))
+            query = query.where(Wine.wine_type.ilike(f"%{filter_type}%"))
         if filter_country:
-            query = query.filter(Wine.country.ilike(f"%{filter_country}%"))
+            query = query.where(Wine.country.ilike(f"%{filter_country}%"))
+
+        if cursor is not None:
+            # Seeks via ix_wines_name_id instead of scanning past earlier pages
+            query = query.where(tuple_(Wine.name, Wine.id) > cursor)
+
+        # Columnar read straight from the cursor; no ORM objects for the table
+        # (coerce_float=False keeps prices as Decimal, so "$12.50" not "$12.5")
+        # One extra row tells whether a next page exists without a COUNT
+        wines = pd.read_sql_query(
+            query.order_by(Wine.name, Wine.id).limit(PAGE_SIZE + 1),
+            session.connection(),
+            coerce_float=False,
+        )
+        has_next = len(wines) > PAGE_SIZE
+        wines = wines.iloc[:PAGE_SIZE]
 
-        wines = query.order_by(Wine.name).limit(100).all()
+        st.write(f"**Showing {len(wines)} wines** (up to {PAGE_SIZE} per page)")
 
-        st.write(f"**Showing {len(wines)} wines** (limited to 100 results)")
+        col1, col2 = st.columns([1, 5])
+        with col1:
+            st.button(
+                "First page", on_click=_set_cursor, args=(None,), disabled=cursor is None
+            )
+        with col2:
+            last = (str(wines["name"].iloc[-1]), int(wines["id"].iloc[-1])) if len(wines) else None
+            st.button(
+                "Next page",
+                on_click=_set_cursor,
+                args=(last,),
+                disabled=not has_next,
+            )
 
-        if not wines:
-            st.info("No wines match the search criteria. Wines will appear here after running the Parser.")
+        if wines.empty:
+            if cursor is not None:
+                st.info("End of results.")
+            else:
+                st.info("No wines match the search criteria. Wines will appear here after running the Parser.")
             return
 
-        data = []
-        for w in wines:
-            data.append(
-                {
-                    "ID": w.id,
-                    "Name": w.name,
-                    "Winery": w.winery or "",
-                    "Varietal": w.varietal or "",
-                    "Type": w.wine_type or "",
-                    "Vintage": w.vintage or "",
-                    "Country": w.country or "",
-                    "Region": w.region or "",
-                    "Price": f"${w.price}" if w.price else "",
-                    "Restaurant": w.wine_list.restaurant.name,
-                }
-            )
-
-        df = pd.DataFrame(data)
+        price = wines["price"]
+        df = pd.DataFrame(
+            {
+                "ID": wines["id"],
+                "Name": wines["name"],
+                "Winery": wines["winery"].fillna(""),
+                "Varietal": wines["varietal"].fillna(""),
+                "Type": wines["wine_type"].fillna(""),
+                "Vintage": wines["vintage"].fillna(""),
+                "Country": wines["country"].fillna(""),
+                "Region": wines["region"].fillna(""),
+                "Price": ("$" + price.astype(str)).where(price.notna() & (price != 0), ""),
+                "Restaurant": wines["restaurant_name"],
+            }
+        )
         st.dataframe(df, use_container_width=True, hide_index=True)
 
         # Detail view
@@ -73,11 +156,25 @@ def render():
         selected_id = st.number_input(
             "Select Wine ID to view details",
             min_value=1,
-            value=wines[0].id,
+            value=int(wines["id"].iloc[0]),
             step=1,
         )
 
-        selected = session.query(Wine).filter_by(id=selected_id).first()
+        # The detail fields ride along with the table rows; only IDs outside
+        # the current result go back to the database.
+        selected = _wine_detail_from_rows(wines, selected_id)
+        if selected is None:
+            wine = (
+                session.query(Wine)
+                .options(joinedload(Wine.wine_list).joinedload(WineList.restaurant))
+                .filter_by(id=selected_id)
+                .first()
+            )
+            if wine:
+                selected = {
+                    field: getattr(wine, field) for field in _DETAIL_FIELDS
+                }
+                selected["restaurant_name"] = wine.wine_list.restaurant.name
 
         if not selected:
             st.warning(f"Wine with ID {selected_id} not found")
@@ -86,20 +183,20 @@ def render():
         col1, col2 = st.columns(2)
 
         with col1:
-            st.write(f"**Name:** {selected.name}")
-            st.write(f"**Winery:** {selected.winery or 'N/A'}")
-            st.write(f"**Varietal:** {selected.varietal or 'N/A'}")
-            st.write(f"**Type:** {selected.wine_type or 'N/A'}")
-            st.write(f"**Vintage:** {selected.vintage or 'N/A'}")
+            st.write(f"**Name:** {selected['name']}")
+            st.write(f"**Winery:** {selected['winery'] or 'N/A'}")
+            st.write(f"**Varietal:** {selected['varietal'] or 'N/A'}")
+            st.write(f"**Type:** {selected['wine_type'] or 'N/A'}")
+            st.write(f"**Vintage:** {selected['vintage'] or 'N/A'}")
 
         with col2:
-            st.write(f"**Country:** {selected.country or 'N/A'}")
-            st.write(f"**Region:** {selected.region or 'N/A'}")
-            st.write(f"**Vineyard:** {selected.vineyard or 'N/A'}")
-            st.write(f"**Format:** {selected.format or 'N/A'}")
-            st.write(f"**Price:** ${selected.price}" if selected.price else "**Price:** N/A")
+            st.write(f"**Country:** {selected['country'] or 'N/A'}")
+            st.write(f"**Region:** {selected['region'] or 'N/A'}")
+            st.write(f"**Vineyard:** {selected['vineyard'] or 'N/A'}")
+            st.write(f"**Format:** {selected['format'] or 'N/A'}")
+            st.write(f"**Price:** ${selected['price']}" if selected["price"] else "**Price:** N/A")
 
-        st.write(f"**Restaurant:** {selected.wine_list.restaurant.name}")
+        st.write(f"**Restaurant:** {selected['restaurant_name']}")
 
-        if selected.note:
-            st.write(f"**Note:** {selected.note}")
+        if selected["note"]:
+            st.write(f"**Note:** {selected['note']}")
@@ -1,24 +1,50 @@
 """Shared test fixtures for pytest."""
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 from winerank.common.models import Base
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_db_engine():
-    """Create an in-memory SQLite database for testing."""
-    engine = create_engine("sqlite:///:memory:")
+    """Create an in-memory SQLite database once for the whole test run.
+
+    StaticPool keeps a single connection, so the schema is visible to every
+    checkout regardless of thread (e.g. graph nodes run in worker threads).
+    """
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    # Let SQLAlchemy, not pysqlite, emit BEGIN so SAVEPOINTs nest correctly
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     Base.metadata.create_all(engine)
     yield engine
-    Base.metadata.drop_all(engine)
+    engine.dispose()
 
 
 @pytest.fixture
 def test_session(test_db_engine):
-    """Create a test database session."""
-    SessionLocal = sessionmaker(bind=test_db_engine)
-    session = SessionLocal()
+    """Create a test database session whose work is rolled back afterwards.
+
+    The session runs inside an outer transaction; its commits only release
+    SAVEPOINTs, so every test starts from an empty schema without DDL.
+    """
+    connection = test_db_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
     yield session
     session.close()
+    transaction.rollback()
+    connection.close()
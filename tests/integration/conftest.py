@@ -0,0 +1,40 @@
+"""Shared fixtures for the live integration tests.
+
+Set ``WINERANK_CDP_ENDPOINT`` to reuse an already running Chromium instead of
+launching one per run, e.g.::
+
+    chromium --headless=new --remote-debugging-port=9222 &
+    WINERANK_CDP_ENDPOINT=http://localhost:9222 uv run pytest tests/integration/ -m integration
+
+Under pytest-xdist (``-n 4``) each worker gets its own session browser.
+"""
+import pytest
+from playwright.sync_api import sync_playwright
+
+from winerank.config import get_settings
+
+
+@pytest.fixture(scope="session")
+def browser():
+    """One Playwright Chromium for the whole integration run.
+
+    Connects over CDP when ``WINERANK_CDP_ENDPOINT`` is set (and leaves that
+    browser running afterwards); otherwise launches a fresh one.
+    """
+    settings = get_settings()
+    with sync_playwright() as pw:
+        if settings.cdp_endpoint:
+            yield pw.chromium.connect_over_cdp(settings.cdp_endpoint)
+            return
+        browser = pw.chromium.launch(headless=settings.headless)
+        yield browser
+        browser.close()
+
+
+@pytest.fixture()
+def browser_page(browser):
+    """Provide a page in a fresh browser context (cookies/storage isolated per test)."""
+    context = browser.new_context()
+    page = context.new_page()
+    yield page
+    context.close()
@@ -11,9 +11,7 @@ from pathlib import Path
 
 import httpx
 import pytest
-from playwright.sync_api import sync_playwright
 
-from winerank.config import get_settings
 from winerank.crawler.downloader import WineListDownloader
 
 pytestmark = pytest.mark.integration
@@ -30,17 +28,6 @@ STARWINELIST_URL = "https://starwinelist.com/wine-place/5182/download/6202"
 # Fixtures
 # ------------------------------------------------------------------
 
-@pytest.fixture(scope="module")
-def browser_page():
-    """Provide a shared Playwright browser page for the test module."""
-    settings = get_settings()
-    with sync_playwright() as pw:
-        browser = pw.chromium.launch(headless=settings.headless)
-        page = browser.new_page()
-        yield page
-        browser.close()
-
-
 @pytest.fixture()
 def downloader(browser_page):
     """Return a WineListDownloader with a Playwright page."""
@@ -53,6 +40,12 @@ def downloader_no_page():
     return WineListDownloader()
 
 
+@pytest.fixture(scope="module")
+def public_pdf():
+    """``(raw_bytes, content_type)`` of PUBLIC_PDF_URL, fetched once per module."""
+    return WineListDownloader()._download_content(PUBLIC_PDF_URL)
+
+
 # ------------------------------------------------------------------
 # _download_content – httpx happy path
 # ------------------------------------------------------------------
@@ -60,8 +53,8 @@ def downloader_no_page():
 class TestDownloadContentHttpx:
     """Verify that public URLs are fetched directly via httpx."""
 
-    def test_public_pdf_via_httpx(self, downloader):
-        raw, content_type = downloader._download_content(PUBLIC_PDF_URL)
+    def test_public_pdf_via_httpx(self, public_pdf):
+        raw, content_type = public_pdf
         assert len(raw) > 100, "Expected non-empty PDF content"
         assert "pdf" in content_type, f"Expected PDF content-type, got: {content_type}"
 
@@ -95,17 +88,19 @@ class TestDownloadContentFallback:
 # ------------------------------------------------------------------
 
 class TestDownloadWineListSync:
-    """End-to-end download that saves to disk."""
+    """Download of the public PDF saved to disk (replays the module's fetch)."""
 
-    def test_public_pdf_download(self, downloader, tmp_path, monkeypatch):
-        """Full download of a public PDF end-to-end."""
+    def test_public_pdf_download(self, downloader_no_page, public_pdf, tmp_path, monkeypatch):
+        """Save / hash / path handling for the real PDF bytes."""
+        downloader = downloader_no_page
         monkeypatch.setattr(downloader, "download_dir", tmp_path)
+        monkeypatch.setattr(downloader, "_download_content", lambda url: public_pdf)
 
         result = downloader.download_wine_list_sync(PUBLIC_PDF_URL, "test-restaurant")
 
         assert "local_file_path" in result
-        assert "file_hash" in result
-        assert result["file_size"] > 0
+        assert result["file_hash"] == downloader._compute_hash(public_pdf[0])
+        assert result["file_size"] == len(public_pdf[0])
 
         local = Path(result["local_file_path"])
         assert local.exists(), f"Downloaded file not found at {local}"
@@ -10,9 +10,7 @@ Run them explicitly:
 """
 
 import pytest
-from playwright.sync_api import sync_playwright
 
-from winerank.config import get_settings
 from winerank.crawler.restaurant_finder import RestaurantWineListFinder
 
 # All tests in this module require the ``integration`` marker.
@@ -23,17 +21,6 @@ pytestmark = pytest.mark.integration
 # Fixtures
 # ------------------------------------------------------------------
 
-@pytest.fixture(scope="module")
-def browser_page():
-    """Provide a shared Playwright browser page for the test module."""
-    settings = get_settings()
-    with sync_playwright() as pw:
-        browser = pw.chromium.launch(headless=settings.headless)
-        page = browser.new_page()
-        yield page
-        browser.close()
-
-
 @pytest.fixture()
 def finder(browser_page):
     """Return a fresh RestaurantWineListFinder for each test."""
@@ -56,9 +43,6 @@ class TestSmyth:
         assert "starwinelist.com" in result.lower(), (
             f"Expected starwinelist.com URL, got: {result}"
         )
-
-    def test_metrics_populated(self, finder):
-        finder.find_wine_list(self.URL)
         assert finder.pages_loaded >= 2, (
             "Should visit homepage and beverage-program page at minimum"
         )
@@ -125,9 +109,6 @@ class TestSingleThread:
         assert result is not None, "Expected to find wine list URL for SingleThread"
         # Should find the Binwise-hosted PDF
         assert ".pdf" in result.lower(), f"Expected PDF URL, got: {result}"
-
-    def test_metrics_populated(self, finder):
-        finder.find_wine_list(self.URL)
         assert finder.pages_loaded >= 2, "Should visit homepage and wine page at minimum"
 
 
@@ -155,9 +136,6 @@ class TestBlueHillAtStoneBarns:
         result = finder.find_wine_list(self.URL)
         assert result is not None, "Expected to find wine list URL for Blue Hill"
         assert ".pdf" in result.lower(), f"Expected PDF URL, got: {result}"
-
-    def test_metrics_populated(self, finder):
-        finder.find_wine_list(self.URL)
         assert finder.pages_loaded >= 2, (
             "Should visit homepage and FAQ page at minimum"
         )
@@ -176,9 +154,6 @@ class TestAtomix:
         result = finder.find_wine_list(self.URL)
         assert result is not None, "Expected to find wine list URL for Atomix"
         assert ".pdf" in result.lower(), f"Expected PDF URL, got: {result}"
-
-    def test_metrics_populated(self, finder):
-        finder.find_wine_list(self.URL)
         assert finder.pages_loaded >= 2, (
             "Should visit homepage and Chef's Counter page at minimum"
         )
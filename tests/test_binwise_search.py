@@ -1,89 +1,76 @@
 """Unit tests for BinWise fallback search and result validation."""
+import httpx
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 from winerank.crawler.binwise_search import (
     search_binwise,
     _validate_binwise_result,
 )
 
+# BinWise pages served to _validate_binwise_result
+HTML_TITLE_QUINCE = "<html><head><title>Quince - Wine List</title></head><body></body></html>"
+HTML_TITLE_OTHER = (
+    "<html><head><title>Other Restaurant - Wine List</title></head><body></body></html>"
+)
+HTML_H1_QUINCE = (
+    "<html><head><title>Binwise Menu</title></head>"
+    "<body><h1>Quince Wine List</h1></body></html>"
+)
+HTML_TITLE_PER_SE = (
+    "<html><head><title>Per Se - Wine &amp; Beverage</title></head><body></body></html>"
+)
+HTML_TITLE_PER_ONLY = "<html><head><title>Per - Something</title></head><body></body></html>"
+
 
 # ------------------------------------------------------------------
 # _validate_binwise_result
 # ------------------------------------------------------------------
 
+@pytest.fixture
+def binwise_page(request):
+    """Patch httpx.Client for binwise_search to serve ``request.param``.
+
+    The param (set with ``indirect=True``) is the page HTML, or an exception
+    the request fails with.  Only the client is mocked, so the real httpx
+    exception classes are still caught.
+    """
+    with patch("winerank.crawler.binwise_search.httpx.Client") as mock_client:
+        get = mock_client.return_value.__enter__.return_value.get
+        if isinstance(request.param, Exception):
+            get.side_effect = request.param
+        else:
+            get.return_value.text = request.param
+        yield
+
+
 class TestValidateBinwiseResult:
 
     def test_empty_url_returns_false(self):
         assert _validate_binwise_result("", "Quince") is False
         assert _validate_binwise_result("https://other.com", "Quince") is False
 
-    def test_page_title_contains_restaurant_name(self):
-        html = "<html><head><title>Quince - Wine List</title></head><body></body></html>"
-        with patch("winerank.crawler.binwise_search.httpx") as mock_httpx:
-            mock_resp = MagicMock()
-            mock_resp.text = html
-            mock_resp.raise_for_status = MagicMock()
-            mock_httpx.Client.return_value.__enter__.return_value.get.return_value = mock_resp
-            assert _validate_binwise_result(
-                "https://hub.binwise.com/list/quince", "Quince"
-            ) is True
-
-    def test_page_title_contains_different_restaurant_returns_false(self):
-        html = "<html><head><title>Other Restaurant - Wine List</title></head><body></body></html>"
-        with patch("winerank.crawler.binwise_search.httpx") as mock_httpx:
-            mock_resp = MagicMock()
-            mock_resp.text = html
-            mock_resp.raise_for_status = MagicMock()
-            mock_httpx.Client.return_value.__enter__.return_value.get.return_value = mock_resp
-            assert _validate_binwise_result(
-                "https://hub.binwise.com/list/other", "Quince"
-            ) is False
-
-    def test_restaurant_name_in_h1_returns_true(self):
-        html = (
-            "<html><head><title>Binwise Menu</title></head>"
-            "<body><h1>Quince Wine List</h1></body></html>"
-        )
-        with patch("winerank.crawler.binwise_search.httpx") as mock_httpx:
-            mock_resp = MagicMock()
-            mock_resp.text = html
-            mock_resp.raise_for_status = MagicMock()
-            mock_httpx.Client.return_value.__enter__.return_value.get.return_value = mock_resp
-            assert _validate_binwise_result(
-                "https://hub.binwise.com/list/quince", "Quince"
-            ) is True
-
-    def test_short_name_exact_match_per_se(self):
-        html = "<html><head><title>Per Se - Wine &amp; Beverage</title></head><body></body></html>"
-        with patch("winerank.crawler.binwise_search.httpx") as mock_httpx:
-            mock_resp = MagicMock()
-            mock_resp.text = html
-            mock_resp.raise_for_status = MagicMock()
-            mock_httpx.Client.return_value.__enter__.return_value.get.return_value = mock_resp
-            assert _validate_binwise_result(
-                "https://hub.binwise.com/list/perse", "Per Se"
-            ) is True
-
-    def test_short_name_per_alone_does_not_match_per_se(self):
-        html = "<html><head><title>Per - Something</title></head><body></body></html>"
-        with patch("winerank.crawler.binwise_search.httpx") as mock_httpx:
-            mock_resp = MagicMock()
-            mock_resp.text = html
-            mock_resp.raise_for_status = MagicMock()
-            mock_httpx.Client.return_value.__enter__.return_value.get.return_value = mock_resp
-            assert _validate_binwise_result(
-                "https://hub.binwise.com/list/per", "Per Se"
-            ) is False
-
-    def test_network_error_returns_false(self):
-        with patch("winerank.crawler.binwise_search.httpx") as mock_httpx:
-            mock_httpx.Client.return_value.__enter__.return_value.get.side_effect = Exception(
-                "Connection error"
-            )
-            assert _validate_binwise_result(
-                "https://hub.binwise.com/list/xyz", "Quince"
-            ) is False
+    @pytest.mark.parametrize("binwise_page, url, name, expected", [
+        (HTML_TITLE_QUINCE, "https://hub.binwise.com/list/quince", "Quince", True),
+        (HTML_TITLE_OTHER, "https://hub.binwise.com/list/other", "Quince", False),
+        (HTML_H1_QUINCE, "https://hub.binwise.com/list/quince", "Quince", True),
+        (HTML_TITLE_PER_SE, "https://hub.binwise.com/list/perse", "Per Se", True),
+        # "Per" alone must not match "Per Se"
+        (HTML_TITLE_PER_ONLY, "https://hub.binwise.com/list/per", "Per Se", False),
+        (
+            httpx.ConnectError("Connection error"),
+            "https://hub.binwise.com/list/xyz", "Quince", False,
+        ),
+    ], ids=[
+        "title-matches",
+        "title-other-restaurant",
+        "h1-matches",
+        "short-name-exact",
+        "short-name-prefix-only",
+        "network-error",
+    ], indirect=["binwise_page"])
+    def test_validates_fetched_page(self, binwise_page, url, name, expected):
+        assert _validate_binwise_result(url, name) is expected
 
 
 # ------------------------------------------------------------------
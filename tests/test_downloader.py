@@ -1,12 +1,17 @@
 """Unit tests for WineListDownloader."""
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
 import pytest
 
-from winerank.crawler.downloader import WineListDownloader
+from winerank.crawler import downloader as downloader_module
+from winerank.crawler.downloader import WineListDownloader, close_http_client
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def downloader():
-    """Create a WineListDownloader without a Playwright page."""
+    """One WineListDownloader without a Playwright page (tests don't mutate it)."""
     return WineListDownloader()
 
 
@@ -60,6 +65,11 @@ class TestComputeHash:
         assert isinstance(h, str)
         assert len(h) == 64  # SHA-256 hex = 64 chars
 
+    def test_hash_file_matches_content_hash(self, downloader, tmp_path):
+        path = tmp_path / "wine_list.pdf"
+        path.write_bytes(b"%PDF-1.4 wine list")
+        assert downloader._hash_file(path) == downloader._compute_hash(b"%PDF-1.4 wine list")
+
 
 # ------------------------------------------------------------------
 # _is_spa_shell  (complements test_spa_shell_detection in test_text_extractor)
@@ -100,17 +110,117 @@ class TestIsSpaShell:
 
 class TestWineListTabSelectors:
 
-    def test_english_selectors_present(self, downloader):
-        selectors = downloader._WINE_LIST_TAB_SELECTORS
-        assert 'text="Wine List"' in selectors
-        assert 'text="WINE LIST"' in selectors
+    # English, French and Spanish tab labels the SPA renderer must try
+    REQUIRED = frozenset({
+        'text="Wine List"',
+        'text="WINE LIST"',
+        'text="Carte des vins"',
+        'text="Vins"',
+        'text="Carta de vinos"',
+        'text="Vinos"',
+    })
+
+    def test_required_selectors_present(self, downloader):
+        missing = self.REQUIRED - set(downloader._WINE_LIST_TAB_SELECTORS)
+        assert not missing, f"missing selectors: {sorted(missing)}"
+
+
+# ------------------------------------------------------------------
+# Shared httpx client
+# ------------------------------------------------------------------
+
+class TestSharedHttpClient:
+
+    def test_downloaders_share_one_client(self):
+        try:
+            first = downloader_module._get_http_client()
+            assert downloader_module._get_http_client() is first
+            close_http_client()
+            assert first.is_closed
+            assert downloader_module._get_http_client() is not first
+        finally:
+            close_http_client()
+
+    def test_download_content_uses_shared_client(self):
+        seen = []
 
-    def test_french_selectors_present(self, downloader):
-        selectors = downloader._WINE_LIST_TAB_SELECTORS
-        assert 'text="Carte des vins"' in selectors
-        assert 'text="Vins"' in selectors
+        def handler(request):
+            seen.append(str(request.url))
+            return httpx.Response(200, content=b"%PDF", headers={"content-type": "application/PDF"})
 
-    def test_spanish_selectors_present(self, downloader):
-        selectors = downloader._WINE_LIST_TAB_SELECTORS
-        assert 'text="Carta de vinos"' in selectors
-        assert 'text="Vinos"' in selectors
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        with patch.object(downloader_module, "_http_client", client):
+            results = [
+                WineListDownloader()._download_content("https://example.com/list.pdf")
+                for _ in range(2)
+            ]
+        client.close()
+
+        assert results == [(b"%PDF", "application/pdf")] * 2
+        assert seen == ["https://example.com/list.pdf"] * 2
+
+
+# ------------------------------------------------------------------
+# download_wine_list_sync – mocked HTTP (live versions in tests/integration)
+# ------------------------------------------------------------------
+
+PDF_BYTES = b"%PDF-1.4\n" + b"0" * 200 + b"\n%%EOF\n"
+
+
+HTML_LIST = "<html><body>" + "<p>Chablis 2019 ... $95</p>" * 20 + "</body></html>"
+
+
+@pytest.fixture
+def served(request):
+    """Route the shared httpx client to a mock transport.
+
+    Serves ``request.param`` as ``(status, content, content_type)`` when the
+    test parametrizes it with ``indirect=True``, else a 200 PDF response.
+    """
+    status, content, content_type = getattr(
+        request, "param", (200, PDF_BYTES, "application/pdf")
+    )
+
+    def handler(_request):
+        return httpx.Response(status, content=content, headers={"content-type": content_type})
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    with patch.object(downloader_module, "_http_client", client):
+        yield
+    client.close()
+
+
+class TestDownloadWineListSyncMocked:
+
+    @pytest.fixture
+    def local_downloader(self, tmp_path):
+        downloader = WineListDownloader()
+        downloader.download_dir = tmp_path
+        return downloader
+
+    def test_pdf_saved_with_hash(self, local_downloader, served, tmp_path):
+        result = local_downloader.download_wine_list_sync(
+            "https://example.com/menus/wine%20list.pdf", "test-restaurant"
+        )
+
+        local = Path(result["local_file_path"])
+        assert local == tmp_path / "test-restaurant" / "wine list.pdf"
+        assert local.read_bytes() == PDF_BYTES
+        assert result["file_size"] == len(PDF_BYTES)
+        assert result["file_hash"] == local_downloader._compute_hash(PDF_BYTES)
+
+    @pytest.mark.parametrize(
+        "served", [(200, HTML_LIST.encode(), "text/html; charset=utf-8")], indirect=True
+    )
+    def test_html_content_type_overrides_pdf_extension(self, local_downloader, served):
+        result = local_downloader.download_wine_list_sync(
+            "https://example.com/wine", "test-restaurant"
+        )
+        assert Path(result["local_file_path"]).name == "wine_list.html"
+
+    @pytest.mark.parametrize("served", [(403, b"Forbidden", "text/plain")], indirect=True)
+    def test_403_without_page_raises(self, local_downloader, served):
+        with pytest.raises(httpx.HTTPStatusError):
+            local_downloader.download_wine_list_sync(
+                "https://example.com/list.pdf", "test-restaurant"
+            )
@@ -23,9 +23,8 @@ def test_init_job_node_uses_site_of_record_id_from_state():
     mock_site = MagicMock()
     mock_site.id = 10
     mock_session = MagicMock()
-    mock_session.query.return_value.filter_by.return_value.first.side_effect = [
-        mock_site,  # SiteOfRecord lookup by id
-    ]
+    # SiteOfRecord lookup by id
+    mock_session.query.return_value.filter_by.return_value.first.return_value = mock_site
     mock_session.add = MagicMock()
     mock_session.commit = MagicMock()
     mock_session.flush = MagicMock()
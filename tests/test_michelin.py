@@ -3,8 +3,11 @@
 Tests the static/class methods that parse HTML or URLs without needing
 a live browser or network access.
 """
+from unittest.mock import MagicMock
+
 import pytest
 from bs4 import BeautifulSoup
+from playwright.sync_api import TimeoutError as PlaywrightTimeout
 
 from winerank.crawler.michelin import MichelinScraper
 
@@ -27,8 +30,11 @@ class TestExtractDistinction:
         ("Just a regular restaurant page", "selected"),
     ])
     def test_distinction_detection(self, text, expected):
-        soup = BeautifulSoup(f"<html><body><p>{text}</p></body></html>", "html.parser")
-        assert MichelinScraper._extract_distinction(soup) == expected
+        assert MichelinScraper._distinction_from_text(text) == expected
+
+    def test_reads_page_text(self):
+        soup = BeautifulSoup("<html><body><p>Two Michelin Stars</p></body></html>", "lxml")
+        assert MichelinScraper._extract_distinction(soup) == "2-stars"
 
 
 # ------------------------------------------------------------------
@@ -37,35 +43,25 @@ class TestExtractDistinction:
 
 class TestExtractLocation:
 
-    def test_standard_url(self):
-        url = "https://guide.michelin.com/us/en/new-york/new-york/restaurant/per-se"
-        city, state = MichelinScraper._extract_location_fallback(url)
-        assert city == "New York"
-        assert state == "New York"
-
-    def test_california_url(self):
-        url = "https://guide.michelin.com/us/en/california/yountville/restaurant/the-french-laundry"
-        city, state = MichelinScraper._extract_location_fallback(url)
-        assert city == "Yountville"
-        assert state == "California"
-
-    def test_dc_url(self):
-        url = "https://guide.michelin.com/us/en/district-of-columbia/washington/restaurant/minibar"
-        city, state = MichelinScraper._extract_location_fallback(url)
-        assert city == "Washington"
-        assert state == "DC"
-
-    def test_no_restaurant_in_url(self):
-        url = "https://guide.michelin.com/us/en/selection"
-        city, state = MichelinScraper._extract_location_fallback(url)
-        assert city is None
-        assert state is None
-
-    def test_trailing_slash(self):
-        url = "https://guide.michelin.com/us/en/illinois/chicago/restaurant/smyth/"
-        city, state = MichelinScraper._extract_location_fallback(url)
-        assert city == "Chicago"
-        assert state == "Illinois"
+    @pytest.mark.parametrize("url, city, state", [
+        ("https://guide.michelin.com/us/en/new-york/new-york/restaurant/per-se",
+         "New York", "New York"),
+        ("https://guide.michelin.com/us/en/california/yountville/restaurant/the-french-laundry",
+         "Yountville", "California"),
+        ("https://guide.michelin.com/us/en/district-of-columbia/washington/restaurant/minibar",
+         "Washington", "DC"),
+        ("https://guide.michelin.com/us/en/selection", None, None),
+        ("https://guide.michelin.com/us/en/illinois/chicago/restaurant/smyth/",
+         "Chicago", "Illinois"),
+        ("https://guide.michelin.com/us/en/illinois/chicago/restaurant",
+         "Chicago", "Illinois"),
+        ("https://guide.michelin.com/us/en/selection/united-states/restaurants", None, None),
+    ], ids=[
+        "standard", "california", "dc", "no-restaurant", "trailing-slash",
+        "ends-at-restaurant", "restaurants-listing",
+    ])
+    def test_location_from_url(self, url, city, state):
+        assert MichelinScraper._extract_location_fallback(url) == (city, state)
 
 
 # ------------------------------------------------------------------
@@ -74,21 +70,14 @@ class TestExtractLocation:
 
 class TestExtractPrice:
 
-    def test_four_dollar_signs(self):
-        soup = BeautifulSoup("<html><body><p>Price: $$$$</p></body></html>", "html.parser")
-        assert MichelinScraper._extract_price(soup) == "$$$$"
-
-    def test_two_dollar_signs(self):
-        soup = BeautifulSoup("<html><body><span>$$</span></body></html>", "html.parser")
-        assert MichelinScraper._extract_price(soup) == "$$"
-
-    def test_no_price(self):
-        soup = BeautifulSoup("<html><body><p>No price here</p></body></html>", "html.parser")
-        assert MichelinScraper._extract_price(soup) is None
-
-    def test_picks_longest(self):
-        soup = BeautifulSoup("<html><body><p>$ to $$$$</p></body></html>", "html.parser")
-        assert MichelinScraper._extract_price(soup) == "$$$$"
+    @pytest.mark.parametrize("text, expected", [
+        ("Price: $$$$", "$$$$"),
+        ("$$", "$$"),
+        ("No price here", None),
+        ("$ to $$$$", "$$$$"),  # picks the longest
+    ], ids=["four", "two", "none", "longest"])
+    def test_price_from_text(self, text, expected):
+        assert MichelinScraper._extract_price(text) == expected
 
 
 # ------------------------------------------------------------------
@@ -99,7 +88,7 @@ class TestExtractWebsiteUrl:
 
     def test_visit_website_link(self):
         html = '<html><body><a href="https://restaurant.com">Visit Website</a></body></html>'
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         assert MichelinScraper._extract_website_url(soup) == "https://restaurant.com"
 
     def test_ignores_michelin_links(self):
@@ -107,13 +96,13 @@ class TestExtractWebsiteUrl:
         <a href="https://guide.michelin.com/other">Visit Website</a>
         <a href="https://restaurant.com">Visit Website</a>
         </body></html>"""
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         result = MichelinScraper._extract_website_url(soup)
         assert result == "https://restaurant.com"
 
     def test_no_website_link(self):
         html = '<html><body><a href="https://guide.michelin.com/x">More Info</a></body></html>'
-        soup = BeautifulSoup(html, "html.parser")
+        soup = BeautifulSoup(html, "lxml")
         assert MichelinScraper._extract_website_url(soup) is None
 
 
@@ -151,11 +140,12 @@ class TestGetListingUrl:
 
 class TestScrapeListingPageErrors:
 
-    def test_scrape_listing_page_reraises_with_url_in_message(self):
-        """When page.goto fails, scrape_listing_page re-raises with URL in the message."""
-        from unittest.mock import MagicMock
+    @pytest.fixture
+    def mock_page(self):
+        return MagicMock()
 
-        mock_page = MagicMock()
+    def test_scrape_listing_page_reraises_with_url_in_message(self, mock_page):
+        """When page.goto fails, scrape_listing_page re-raises with URL in the message."""
         mock_page.goto.side_effect = Exception("Page.goto: Page crashed")
         mock_page.is_closed.return_value = True
 
@@ -170,12 +160,8 @@ class TestScrapeListingPageErrors:
         assert url in str(exc_info.value)
         assert "Error scraping listing page" in str(exc_info.value)
 
-    def test_scrape_listing_page_timeout_reraises_with_url(self):
+    def test_scrape_listing_page_timeout_reraises_with_url(self, mock_page):
         """PlaywrightTimeout is re-raised as Exception with URL in message."""
-        from unittest.mock import MagicMock
-        from playwright.sync_api import TimeoutError as PlaywrightTimeout
-
-        mock_page = MagicMock()
         mock_page.goto.side_effect = PlaywrightTimeout("Timeout 30000ms exceeded")
         mock_page.is_closed.return_value = False
 
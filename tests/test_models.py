@@ -14,6 +14,34 @@ from winerank.common.models import (
 )
 
 
+@pytest.fixture
+def site(test_session):
+    """A pending SiteOfRecord; tests flush or commit the whole graph once."""
+    site = SiteOfRecord(site_name="Test", site_url="https://example.com")
+    test_session.add(site)
+    return site
+
+
+@pytest.fixture
+def restaurant(site):
+    """A Restaurant under ``site``, wired through the relationship."""
+    restaurant = Restaurant(name="Test")
+    site.restaurants.append(restaurant)
+    return restaurant
+
+
+@pytest.fixture
+def wine_list(restaurant):
+    """A WineList for ``restaurant``."""
+    wine_list = WineList(
+        source_url="https://test.com/wines.pdf",
+        local_file_path="/tmp/wines.pdf",
+        file_hash="abc123",
+    )
+    restaurant.wine_lists.append(wine_list)
+    return wine_list
+
+
 def test_create_site_of_record(test_session):
     """Test creating a SiteOfRecord."""
     site = SiteOfRecord(
@@ -31,14 +59,11 @@ def test_create_site_of_record(test_session):
 
 def test_create_restaurant(test_session):
     """Test creating a Restaurant."""
-    # Create site of record first
     site = SiteOfRecord(
         site_name="Test Site",
         site_url="https://example.com",
     )
-    test_session.add(site)
-    test_session.flush()
-    
+
     restaurant = Restaurant(
         name="Test Restaurant",
         michelin_url="https://guide.michelin.com/test",
@@ -50,7 +75,7 @@ def test_create_restaurant(test_session):
         cuisine="French",
         price_range="$$$$",
         crawl_status=CrawlStatus.PENDING,
-        site_of_record_id=site.id,
+        site_of_record=site,
     )
     test_session.add(restaurant)
     test_session.commit()
@@ -61,58 +86,17 @@ def test_create_restaurant(test_session):
     assert restaurant.crawl_status == CrawlStatus.PENDING
 
 
-def test_restaurant_wine_list_relationship(test_session):
+def test_restaurant_wine_list_relationship(test_session, restaurant, wine_list):
     """Test Restaurant -> WineList relationship."""
-    # Create site and restaurant
-    site = SiteOfRecord(site_name="Test", site_url="https://example.com")
-    test_session.add(site)
-    test_session.flush()
-    
-    restaurant = Restaurant(
-        name="Test Restaurant",
-        site_of_record_id=site.id,
-    )
-    test_session.add(restaurant)
-    test_session.flush()
-    
-    # Create wine list
-    wine_list = WineList(
-        restaurant_id=restaurant.id,
-        source_url="https://restaurant.com/wines.pdf",
-        local_file_path="/tmp/wines.pdf",
-        file_hash="abc123",
-    )
-    test_session.add(wine_list)
     test_session.commit()
-    
-    # Test relationship
+
     assert len(restaurant.wine_lists) == 1
     assert restaurant.wine_lists[0].id == wine_list.id
 
 
-def test_wine_list_wines_relationship(test_session):
+def test_wine_list_wines_relationship(test_session, wine_list):
     """Test WineList -> Wine relationship."""
-    # Create necessary parent records
-    site = SiteOfRecord(site_name="Test", site_url="https://example.com")
-    test_session.add(site)
-    test_session.flush()
-    
-    restaurant = Restaurant(name="Test", site_of_record_id=site.id)
-    test_session.add(restaurant)
-    test_session.flush()
-    
-    wine_list = WineList(
-        restaurant_id=restaurant.id,
-        source_url="https://test.com/wines.pdf",
-        local_file_path="/tmp/wines.pdf",
-        file_hash="abc123",
-    )
-    test_session.add(wine_list)
-    test_session.flush()
-    
-    # Create wines
     wine1 = Wine(
-        wine_list_id=wine_list.id,
         name="Château Margaux",
         winery="Château Margaux",
         varietal="Bordeaux Blend",
@@ -123,7 +107,6 @@ def test_wine_list_wines_relationship(test_session):
         price=500.00,
     )
     wine2 = Wine(
-        wine_list_id=wine_list.id,
         name="Dom Pérignon",
         winery="Moët & Chandon",
         varietal="Champagne",
@@ -132,7 +115,7 @@ def test_wine_list_wines_relationship(test_session):
         vintage="2010",
         price=300.00,
     )
-    test_session.add_all([wine1, wine2])
+    wine_list.wines.extend([wine1, wine2])
     test_session.commit()
     
     # Test relationship
@@ -145,17 +128,13 @@ def test_wine_list_wines_relationship(test_session):
     assert wine_list.wine_count == 2
 
 
-def test_job_creation(test_session):
+def test_job_creation(test_session, site):
     """Test Job creation."""
-    site = SiteOfRecord(site_name="Test", site_url="https://example.com")
-    test_session.add(site)
-    test_session.flush()
-    
     job = Job(
         job_type="crawler",
         michelin_level="3",
         status=JobStatus.RUNNING,
-        site_of_record_id=site.id,
+        site_of_record=site,
     )
     test_session.add(job)
     test_session.commit()
@@ -165,28 +144,10 @@ def test_job_creation(test_session):
     assert job.started_at is not None
 
 
-def test_cascade_delete(test_session):
+def test_cascade_delete(test_session, restaurant, wine_list):
     """Test cascade delete behavior."""
-    # Create full hierarchy
-    site = SiteOfRecord(site_name="Test", site_url="https://example.com")
-    test_session.add(site)
-    test_session.flush()
-    
-    restaurant = Restaurant(name="Test", site_of_record_id=site.id)
-    test_session.add(restaurant)
-    test_session.flush()
-    
-    wine_list = WineList(
-        restaurant_id=restaurant.id,
-        source_url="https://test.com/wines.pdf",
-        local_file_path="/tmp/wines.pdf",
-        file_hash="abc123",
-    )
-    test_session.add(wine_list)
-    test_session.flush()
-    
-    wine = Wine(wine_list_id=wine_list.id, name="Test Wine")
-    test_session.add(wine)
+    wine = Wine(name="Test Wine")
+    wine_list.wines.append(wine)
     test_session.commit()
     
     # Delete restaurant should cascade to wine_list and wine
@@ -194,5 +155,5 @@ def test_cascade_delete(test_session):
     test_session.commit()
     
     # Verify cascade
-    assert test_session.query(WineList).filter_by(id=wine_list.id).first() is None
-    assert test_session.query(Wine).filter_by(id=wine.id).first() is None
+    assert test_session.get(WineList, wine_list.id) is None
+    assert test_session.get(Wine, wine.id) is None
@@ -13,6 +13,14 @@ from winerank.common.models import CrawlStatus, Restaurant, SiteOfRecord, WineLi
 runner = CliRunner()
 
 
+@pytest.fixture(scope="module")
+def pdf_path(tmp_path_factory):
+    """Minimal PDF so path.read_bytes() and is_file() succeed; written once."""
+    path = tmp_path_factory.mktemp("pdf") / "wine_list.pdf"
+    path.write_bytes(b"%PDF-1.4 minimal\n%%EOF")
+    return path
+
+
 @pytest.fixture
 def seeded_session(test_session):
     """Create SiteOfRecord and Restaurant with PENDING status."""
@@ -21,27 +29,21 @@ def seeded_session(test_session):
         site_url="https://guide.michelin.com/us/en/",
         navigational_notes="",
     )
-    test_session.add(site)
-    test_session.commit()
 
     rest = Restaurant(
         name="Test Restaurant",
         website_url="https://example.com",
         crawl_status=CrawlStatus.PENDING,
         country="USA",
-        site_of_record_id=site.id,
+        site_of_record=site,
     )
     test_session.add(rest)
     test_session.commit()
     return test_session
 
 
-def test_register_wine_list_updates_restaurant_status(seeded_session, tmp_path):
+def test_register_wine_list_updates_restaurant_status(seeded_session, pdf_path):
     """register-wine-list sets restaurant crawl_status to WINE_LIST_FOUND."""
-    # Minimal file so path.read_bytes() and is_file() succeed
-    pdf_path = tmp_path / "wine_list.pdf"
-    pdf_path.write_bytes(b"%PDF-1.4 minimal\n%%EOF")
-
     @contextmanager
     def fake_get_session():
         yield seeded_session
@@ -60,8 +62,29 @@ def test_register_wine_list_updates_restaurant_status(seeded_session, tmp_path):
 
     assert result.exit_code == 0, result.output
 
-    seeded_session.expire_all()  # refresh from DB
-    rest = seeded_session.query(Restaurant).filter_by(name="Test Restaurant").first()
-    assert rest is not None
+    rest = seeded_session.query(Restaurant).filter_by(name="Test Restaurant").one()
+    seeded_session.refresh(rest, attribute_names=["crawl_status"])  # re-read from DB
     assert rest.crawl_status == CrawlStatus.WINE_LIST_FOUND
     assert seeded_session.query(WineList).filter_by(restaurant_id=rest.id).first() is not None
+
+
+@pytest.mark.parametrize("args, message", [
+    (["--restaurant", "Nowhere Bistro", "--file", "{pdf}"], "Restaurant not found"),
+    (["--restaurant", "Test Restaurant", "--site", "Atlantis", "--file", "{pdf}"], "Site not found"),
+    (["--restaurant", "Test Restaurant", "--file", "{missing}"], "File not found"),
+], ids=["unknown-restaurant", "unknown-site", "missing-file"])
+def test_register_wine_list_rejects_bad_input(seeded_session, pdf_path, args, message):
+    """Bad restaurant, site or file exits 1 without touching the restaurant."""
+    args = [a.format(pdf=pdf_path, missing=pdf_path.with_name("missing.pdf")) for a in args]
+
+    @contextmanager
+    def fake_get_session():
+        yield seeded_session
+
+    with patch("winerank.common.db.get_session", side_effect=fake_get_session):
+        result = runner.invoke(app, ["register-wine-list", *args])
+
+    assert result.exit_code == 1
+    assert message in " ".join(result.output.split())
+    rest = seeded_session.query(Restaurant).filter_by(name="Test Restaurant").one()
+    assert rest.crawl_status == CrawlStatus.PENDING
@@ -2,21 +2,48 @@
 
 These tests exercise the pure-logic methods that don't need a browser.
 """
+import re
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import cast
+
 import pytest
-from unittest.mock import MagicMock
+from bs4 import BeautifulSoup
+from playwright.sync_api import Page
 
+from winerank.crawler import restaurant_finder
 from winerank.crawler.restaurant_finder import (
     RestaurantWineListFinder,
     _SKIP_RE,
     _WINE_PLATFORM_RE,
+    _weighted_terms,
 )
 
 
+class _FakePage:
+    """Just enough of a Playwright Page for _smart_search: an empty document."""
+
+    def goto(self, *args, **kwargs):
+        return SimpleNamespace(ok=True)
+
+    def wait_for_timeout(self, timeout):
+        pass
+
+    def content(self):
+        return "<html><body></body></html>"
+
+
+@pytest.fixture(scope="module")
+def _base_finder():
+    """One finder on a fake page (no real browser) per module."""
+    return RestaurantWineListFinder(cast(Page, _FakePage()))
+
+
 @pytest.fixture
-def finder():
-    """Create a finder with a mock Playwright Page (no real browser)."""
-    mock_page = MagicMock()
-    return RestaurantWineListFinder(mock_page)
+def finder(_base_finder):
+    """The shared finder, switched back to English after each test."""
+    yield _base_finder
+    _base_finder._use_language("en")
 
 
 # ------------------------------------------------------------------
@@ -131,55 +158,56 @@ class TestSkipRegex:
         assert not _SKIP_RE.search(url), f"Expected SKIP_RE to NOT match: {url}"
 
 
+@pytest.mark.parametrize("pattern", [_SKIP_RE, _WINE_PLATFORM_RE], ids=["skip", "platform"])
+def test_url_patterns_precompiled_case_insensitive(pattern):
+    """URL filters are compiled once at import, not rebuilt per helper call."""
+    assert isinstance(pattern, re.Pattern)
+    assert pattern.flags & re.IGNORECASE
+
+
 # ------------------------------------------------------------------
 # _score_link
 # ------------------------------------------------------------------
 
 class TestScoreLink:
 
-    def test_exact_wine_keyword_high_score(self, finder):
-        score = finder._score_link("wine list", "/wine-list", "")
-        assert score > 100
+    @pytest.mark.parametrize("text, href, floor", [
+        ("wine list", "/wine-list", 100),
+        ("faq", "/faq", 0),
+        ("chef's counter", "/chefs-counter", 0),
+        ("tasting menu", "/tasting-menu", 0),
+        ("about", "/about", 0),
+        ("selections", "/wine-selections", 0),  # href slug match
+        ("beverage program", "/beverage-program", 0),
+    ], ids=["exact-wine", "faq", "chefs-counter", "tasting-menu", "about",
+            "href-slug", "beverage-program"])
+    def test_scores_above_floor(self, finder, text, href, floor):
+        assert finder._score_link(text, href, "") > floor
+
+    def test_no_match_returns_zero(self, finder):
+        assert finder._score_link("reservations now", "/reserve", "") == 0
 
-    def test_menu_keyword_lower_than_wine(self, finder):
-        wine_score = finder._score_link("wine", "/wine", "")
-        menu_score = finder._score_link("menus", "/menus", "")
-        assert wine_score > menu_score
+    @pytest.mark.parametrize("text, href", [
+        ("menus", "/menus"),
+        ("faq", "/faq"),
+    ], ids=["menu", "faq"])
+    def test_wine_outranks_lower_tiers(self, finder, text, href):
+        assert finder._score_link("wine", "/wine", "") > finder._score_link(text, href, "")
 
     def test_context_boosts_score(self, finder):
         base = finder._score_link("click here", "/link", "")
         boosted = finder._score_link("click here", "/link", "view our wine list here")
         assert boosted > base
 
-    def test_faq_scores_at_menu_tier(self, finder):
-        faq_score = finder._score_link("faq", "/faq", "")
-        wine_score = finder._score_link("wine", "/wine", "")
-        assert faq_score > 0, "FAQ should score > 0"
-        assert wine_score > faq_score, "Wine should score higher than FAQ"
+    def test_scoring_reuses_cached_terms(self, finder):
+        """Scoring runs per link; its weighted terms are built once per language."""
+        before = _weighted_terms.cache_info()
+        finder._score_link("Wine List", "/wine-list", "view our wine list")
+        finder._score_wine_keywords_only("Carte des Vins", "/carte-des-vins")
+        assert _weighted_terms.cache_info() == before
 
-    def test_chefs_counter_scores(self, finder):
-        score = finder._score_link("chef's counter", "/chefs-counter", "")
-        assert score > 0, "Chef's Counter should score > 0"
-
-    def test_tasting_menu_scores(self, finder):
-        score = finder._score_link("tasting menu", "/tasting-menu", "")
-        assert score > 0, "Tasting Menu should score > 0"
-
-    def test_about_scores_low(self, finder):
-        about_score = finder._score_link("about", "/about", "")
-        assert about_score > 0, "About should score > 0"
-
-    def test_no_match_returns_zero(self, finder):
-        score = finder._score_link("reservations now", "/reserve", "")
-        assert score == 0
-
-    def test_href_slug_match(self, finder):
-        score = finder._score_link("selections", "/wine-selections", "")
-        assert score > 0
-
-    def test_beverage_program_scores(self, finder):
-        score = finder._score_link("beverage program", "/beverage-program", "")
-        assert score > 0
+        finder._use_language("fr")
+        assert finder._wine_terms is _weighted_terms(finder._norm_wine_keywords)
 
 
 # ------------------------------------------------------------------
@@ -188,17 +216,15 @@ class TestScoreLink:
 
 class TestScoreWineKeywordsOnly:
 
-    def test_wine_keyword_scores(self, finder):
-        score = finder._score_wine_keywords_only("wine list", "/wine-list")
-        assert score > 50
+    @pytest.mark.parametrize("text, href, floor", [
+        ("wine list", "/wine-list", 50),
+        ("beverage menu", "/beverage", 0),
+    ], ids=["wine", "beverage"])
+    def test_scores_above_floor(self, finder, text, href, floor):
+        assert finder._score_wine_keywords_only(text, href) > floor
 
     def test_menu_keyword_does_not_score(self, finder):
-        score = finder._score_wine_keywords_only("menus", "/menus")
-        assert score == 0
-
-    def test_beverage_keyword_scores(self, finder):
-        score = finder._score_wine_keywords_only("beverage menu", "/beverage")
-        assert score > 0
+        assert finder._score_wine_keywords_only("menus", "/menus") == 0
 
 
 # ------------------------------------------------------------------
@@ -226,19 +252,13 @@ class TestNormalizeText:
 class TestFrenchKeywordScoring:
 
     def test_french_wine_link_scores_when_effective_lists_include_fr(self, finder):
-        finder._effective_wine_keywords = finder.WINE_KEYWORDS + finder.WINE_KEYWORDS_FR
-        finder._effective_menu_keywords = finder.MENU_KEYWORDS + finder.MENU_KEYWORDS_FR
-        finder._effective_informational_keywords = finder.INFORMATIONAL_KEYWORDS + finder.INFORMATIONAL_KEYWORDS_FR
-        finder._effective_context_phrases = finder._CONTEXT_PHRASES + finder._CONTEXT_PHRASES_FR
-        finder._effective_pdf_wine_terms = finder._PDF_WINE_TERMS + finder._PDF_WINE_TERMS_FR
-        finder._build_norm_lists()
+        finder._use_language("fr")
 
         score = finder._score_link("carte des vins", "/carte-des-vins", "")
         assert score > 50, "French 'carte des vins' link should score when FR keywords are active"
 
     def test_french_context_phrase_boosts_generic_link(self, finder):
-        finder._effective_context_phrases = finder._CONTEXT_PHRASES + finder._CONTEXT_PHRASES_FR
-        finder._build_norm_lists()
+        finder._use_language("fr")
         # Generic link "ici" with French context mentioning wine list
         base = finder._score_link("ici", "/here", "")
         boosted = finder._score_link(
@@ -248,8 +268,7 @@ class TestFrenchKeywordScoring:
         assert boosted > base, "French context phrase should boost score for generic link"
 
     def test_french_wine_keywords_only_scores(self, finder):
-        finder._effective_wine_keywords = finder.WINE_KEYWORDS + finder.WINE_KEYWORDS_FR
-        finder._build_norm_lists()
+        finder._use_language("fr")
         score = finder._score_wine_keywords_only("carte des vins", "/carte-des-vins")
         assert score > 0
 
@@ -261,28 +280,22 @@ class TestFrenchKeywordScoring:
 class TestSpanishKeywordScoring:
 
     def test_spanish_wine_link_scores_when_effective_lists_include_es(self, finder):
-        finder._effective_wine_keywords = finder.WINE_KEYWORDS + finder.WINE_KEYWORDS_ES
-        finder._effective_menu_keywords = finder.MENU_KEYWORDS + finder.MENU_KEYWORDS_ES
-        finder._effective_informational_keywords = finder.INFORMATIONAL_KEYWORDS + finder.INFORMATIONAL_KEYWORDS_ES
-        finder._effective_context_phrases = finder._CONTEXT_PHRASES + finder._CONTEXT_PHRASES_ES
-        finder._effective_pdf_wine_terms = finder._PDF_WINE_TERMS + finder._PDF_WINE_TERMS_ES
-        finder._build_norm_lists()
+        finder._use_language("es")
 
         score = finder._score_link("carta de vinos", "/carta-de-vinos", "")
         assert score > 50, "Spanish 'carta de vinos' link should score when ES keywords are active"
 
     def test_spanish_lista_vinos_scores(self, finder):
-        finder._effective_wine_keywords = finder.WINE_KEYWORDS + finder.WINE_KEYWORDS_ES
-        finder._build_norm_lists()
+        finder._use_language("es")
         score = finder._score_wine_keywords_only("lista de vinos", "/lista-de-vinos")
         assert score > 0
 
 
 # ------------------------------------------------------------------
-# _build_norm_lists – output correctness
+# _norm_lists_for – output correctness and caching
 # ------------------------------------------------------------------
 
-class TestBuildNormLists:
+class TestNormLists:
 
     def test_norm_lists_populated_on_init(self, finder):
         """A freshly created finder must have _norm_wine_keywords ready."""
@@ -290,22 +303,26 @@ class TestBuildNormLists:
         # All entries must be lowercase and accent-free
         assert all(kw == kw.lower() for kw in finder._norm_wine_keywords)
 
-    def test_norm_lists_updated_after_build(self, finder):
+    def test_norm_lists_updated_after_language_switch(self, finder):
         """After switching to FR, _norm_wine_keywords reflects the merged list."""
-        finder._effective_wine_keywords = finder.WINE_KEYWORDS + finder.WINE_KEYWORDS_FR
-        finder._build_norm_lists()
+        finder._use_language("fr")
         assert len(finder._norm_wine_keywords) == len(finder.WINE_KEYWORDS) + len(finder.WINE_KEYWORDS_FR)
         # French keyword 'carte des vins' must appear in normalized form
         assert "carte des vins" in finder._norm_wine_keywords
 
     def test_accented_keywords_normalized_in_norm_lists(self, finder):
         """Accented FR/ES keywords are stored without accents in norm lists."""
-        finder._effective_wine_keywords = finder.WINE_KEYWORDS + finder.WINE_KEYWORDS_FR
-        finder._effective_menu_keywords = finder.MENU_KEYWORDS + finder.MENU_KEYWORDS_FR
-        finder._build_norm_lists()
+        finder._use_language("fr")
         # "dégustation" from MENU_KEYWORDS_FR must appear as "degustation"
         assert "degustation" in finder._norm_menu_keywords
 
+    def test_norm_lists_shared_per_language(self, finder):
+        """Normalization runs once per hint; unknown hints share the EN lists."""
+        fr = RestaurantWineListFinder._norm_lists_for("fr")
+        assert RestaurantWineListFinder._norm_lists_for("fr") is fr
+        finder._use_language("de")
+        assert finder._norm_wine_keywords is RestaurantWineListFinder._norm_lists_for("en").wine
+
 
 # ------------------------------------------------------------------
 # find_wine_list – effective-list setup via language_hint (no browser needed)
@@ -313,36 +330,29 @@ class TestBuildNormLists:
 
 class TestFindWineListEffectiveLists:
 
-    def test_fr_hint_merges_french_keywords(self):
+    @pytest.fixture
+    def page_finder(self, monkeypatch):
+        """A finder on an empty page; Tier 3 (LLM) is unavailable."""
+        monkeypatch.setattr(restaurant_finder, "_get_litellm_completion", lambda: None)
+        return RestaurantWineListFinder(cast(Page, _FakePage()))
+
+    def test_fr_hint_merges_french_keywords(self, page_finder):
         """find_wine_list(language_hint='fr') loads FR+EN keywords."""
-        mock_page = MagicMock()
-        # Make page.content() return empty HTML so _smart_search returns None quickly
-        mock_page.content.return_value = "<html><body></body></html>"
-        mock_page.goto.return_value = MagicMock(ok=True)
-        finder = RestaurantWineListFinder(mock_page)
-        finder.find_wine_list("https://example.com", language_hint="fr")
-        assert "carte des vins" in finder._effective_wine_keywords
-        assert "wine list" in finder._effective_wine_keywords  # English still present
-
-    def test_es_hint_merges_spanish_keywords(self):
+        page_finder.find_wine_list("https://example.com", language_hint="fr")
+        assert "carte des vins" in page_finder._effective_wine_keywords
+        assert "wine list" in page_finder._effective_wine_keywords  # English still present
+
+    def test_es_hint_merges_spanish_keywords(self, page_finder):
         """find_wine_list(language_hint='es') loads ES+EN keywords."""
-        mock_page = MagicMock()
-        mock_page.content.return_value = "<html><body></body></html>"
-        mock_page.goto.return_value = MagicMock(ok=True)
-        finder = RestaurantWineListFinder(mock_page)
-        finder.find_wine_list("https://example.com", language_hint="es")
-        assert "carta de vinos" in finder._effective_wine_keywords
-        assert "wine list" in finder._effective_wine_keywords
-
-    def test_no_hint_uses_english_only(self):
+        page_finder.find_wine_list("https://example.com", language_hint="es")
+        assert "carta de vinos" in page_finder._effective_wine_keywords
+        assert "wine list" in page_finder._effective_wine_keywords
+
+    def test_no_hint_uses_english_only(self, page_finder):
         """find_wine_list without language_hint uses only English keywords."""
-        mock_page = MagicMock()
-        mock_page.content.return_value = "<html><body></body></html>"
-        mock_page.goto.return_value = MagicMock(ok=True)
-        finder = RestaurantWineListFinder(mock_page)
-        finder.find_wine_list("https://example.com")
-        assert "carte des vins" not in finder._effective_wine_keywords
-        assert "carta de vinos" not in finder._effective_wine_keywords
+        page_finder.find_wine_list("https://example.com")
+        assert "carte des vins" not in page_finder._effective_wine_keywords
+        assert "carta de vinos" not in page_finder._effective_wine_keywords
 
 
 # ------------------------------------------------------------------
@@ -351,22 +361,22 @@ class TestFindWineListEffectiveLists:
 
 class TestScorePdfMultilingual:
 
-    def _tag_with_text(self, text: str):
-        """Return a minimal BeautifulSoup <a> tag with the given text."""
-        from bs4 import BeautifulSoup
-        html = f"<a href='/doc'>{text}</a>"
-        return BeautifulSoup(html, "html.parser").find("a")
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _tag_with_text(text: str):
+        """Return a minimal <a> tag with the given text, built without parsing."""
+        tag = BeautifulSoup("", "html.parser").new_tag("a", href="/doc")
+        tag.string = text
+        return tag
 
     def test_french_pdf_term_in_url_scores(self, finder):
-        finder._effective_pdf_wine_terms = finder._PDF_WINE_TERMS + finder._PDF_WINE_TERMS_FR
-        finder._build_norm_lists()
+        finder._use_language("fr")
         tag = self._tag_with_text("Download")
         score = finder._score_pdf("https://restaurant.fr/carte-des-vins.pdf", tag)
         assert score > 0, "PDF URL containing 'carte' should score with FR terms active"
 
     def test_spanish_pdf_term_in_url_scores(self, finder):
-        finder._effective_pdf_wine_terms = finder._PDF_WINE_TERMS + finder._PDF_WINE_TERMS_ES
-        finder._build_norm_lists()
+        finder._use_language("es")
         tag = self._tag_with_text("Download")
         score = finder._score_pdf("https://restaurant.es/bodega-vinos.pdf", tag)
         assert score > 0, "PDF URL containing 'bodega' should score with ES terms active"
@@ -380,15 +390,13 @@ class TestAccentNormalizationInScoring:
 
     def test_accented_link_text_matches_fr_keyword(self, finder):
         """Link text 'Dégustation' should match the French keyword 'degustation'."""
-        finder._effective_menu_keywords = finder.MENU_KEYWORDS + finder.MENU_KEYWORDS_FR
-        finder._build_norm_lists()
+        finder._use_language("fr")
         score = finder._score_link("Dégustation", "/degustation", "")
         assert score > 0, "Accented link text should match normalized French keyword"
 
     def test_accented_href_matches_fr_keyword(self, finder):
         """Href slug 'carte-des-vins' derived from an accented keyword should match."""
-        finder._effective_wine_keywords = finder.WINE_KEYWORDS + finder.WINE_KEYWORDS_FR
-        finder._build_norm_lists()
+        finder._use_language("fr")
         score = finder._score_link("Voir la carte", "/carte-des-vins", "")
         assert score > 0, "Href 'carte-des-vins' should match normalized French wine keyword"
 
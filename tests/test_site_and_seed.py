@@ -1,8 +1,12 @@
 """Tests for site resolution and seed data."""
+from contextlib import contextmanager
+from unittest.mock import patch
+
 import pytest
+from sqlalchemy.orm import Session
 
-from winerank.common.db import resolve_site_by_name
-from winerank.common.models import SiteOfRecord
+from winerank.common.db import resolve_restaurant_by_id_or_name, resolve_site_by_name
+from winerank.common.models import Restaurant, SiteOfRecord
 from winerank.cli import SITES_OF_RECORD
 
 
@@ -25,57 +29,99 @@ def test_sites_of_record_includes_usa_and_short_names():
 # resolve_site_by_name
 # ------------------------------------------------------------------
 
+@pytest.fixture(scope="class")
+def _seeded_connection(test_db_engine):
+    """USA and Canada sites inserted once for the class, rolled back after it."""
+    connection = test_db_engine.connect()
+    outer = connection.begin()
+    with Session(bind=connection, join_transaction_mode="create_savepoint") as session:
+        session.add_all([
+            SiteOfRecord(
+                site_name="Michelin Guide USA",
+                site_url="https://guide.michelin.com/us/en/selection/united-states/restaurants",
+            ),
+            SiteOfRecord(
+                site_name="Michelin Guide Canada",
+                site_url="https://guide.michelin.com/us/en/selection/canada/restaurants",
+            ),
+        ])
+        session.commit()
+    yield connection
+    outer.rollback()
+    connection.close()
+
+
 class TestResolveSiteByName:
 
-    def test_exact_match_case_insensitive(self, test_session):
-        site = SiteOfRecord(
-            site_name="Michelin Guide USA",
-            site_url="https://guide.michelin.com/us/en/selection/united-states/restaurants",
-        )
-        test_session.add(site)
-        test_session.commit()
-        found = resolve_site_by_name(test_session, "Michelin Guide USA")
+    @pytest.fixture
+    def seeded_session(self, _seeded_connection):
+        """A session over the seeded sites; anything a test writes is rolled back."""
+        nested = _seeded_connection.begin_nested()
+        session = Session(bind=_seeded_connection, join_transaction_mode="create_savepoint")
+        yield session
+        session.close()
+        nested.rollback()
+
+    def test_exact_match_case_insensitive(self, seeded_session):
+        found = resolve_site_by_name(seeded_session, "Michelin Guide USA")
         assert found is not None
         assert found.site_name == "Michelin Guide USA"
-        found2 = resolve_site_by_name(test_session, "michelin guide usa")
+        found2 = resolve_site_by_name(seeded_session, "michelin guide usa")
         assert found2 is not None
         assert found2.id == found.id
 
-    def test_short_name_usa(self, test_session):
-        site = SiteOfRecord(
-            site_name="Michelin Guide USA",
-            site_url="https://guide.michelin.com/us/en/selection/united-states/restaurants",
-        )
-        test_session.add(site)
-        test_session.commit()
-        found = resolve_site_by_name(test_session, "USA")
+    def test_short_name_usa(self, seeded_session):
+        found = resolve_site_by_name(seeded_session, "USA")
         assert found is not None
         assert found.site_name == "Michelin Guide USA"
-        found2 = resolve_site_by_name(test_session, "usa")
+        found2 = resolve_site_by_name(seeded_session, "usa")
         assert found2 is not None
         assert found2.id == found.id
 
-    def test_short_name_canada(self, test_session):
-        site = SiteOfRecord(
-            site_name="Michelin Guide Canada",
-            site_url="https://guide.michelin.com/us/en/selection/canada/restaurants",
-        )
-        test_session.add(site)
-        test_session.commit()
-        found = resolve_site_by_name(test_session, "Canada")
+    def test_short_name_canada(self, seeded_session):
+        found = resolve_site_by_name(seeded_session, "Canada")
         assert found is not None
         assert found.site_name == "Michelin Guide Canada"
 
-    def test_empty_or_whitespace_returns_none(self, test_session):
-        site = SiteOfRecord(
-            site_name="Michelin Guide USA",
-            site_url="https://guide.michelin.com/us/en/selection/united-states/restaurants",
-        )
+    def test_empty_or_whitespace_returns_none(self, seeded_session):
+        assert resolve_site_by_name(seeded_session, "") is None
+        assert resolve_site_by_name(seeded_session, "   ") is None
+
+    def test_no_match_returns_none(self, seeded_session):
+        assert resolve_site_by_name(seeded_session, "NoSuchSite") is None
+        assert resolve_site_by_name(seeded_session, "garbage") is None
+
+
+# ------------------------------------------------------------------
+# resolve_restaurant_by_id_or_name
+# ------------------------------------------------------------------
+
+class TestResolveRestaurantByIdOrName:
+
+    @pytest.fixture
+    def restaurants(self, test_session):
+        site = SiteOfRecord(site_name="Michelin Guide USA", site_url="https://example.com")
         test_session.add(site)
+        test_session.flush()
+        recs = [
+            Restaurant(name="The French Laundry", site_of_record_id=site.id),
+            Restaurant(name="French Laundry Annex", site_of_record_id=site.id),
+        ]
+        test_session.add_all(recs)
         test_session.commit()
-        assert resolve_site_by_name(test_session, "") is None
-        assert resolve_site_by_name(test_session, "   ") is None
 
-    def test_no_match_returns_none(self, test_session):
-        assert resolve_site_by_name(test_session, "NoSuchSite") is None
-        assert resolve_site_by_name(test_session, "garbage") is None
+        @contextmanager
+        def _get_session():
+            yield test_session
+
+        with patch("winerank.common.db.get_session", _get_session):
+            yield recs
+
+    def test_numeric_identifier_looks_up_by_id(self, restaurants):
+        assert resolve_restaurant_by_id_or_name(str(restaurants[1].id)) is restaurants[1]
+
+    def test_exact_name_match_is_case_insensitive(self, restaurants):
+        assert resolve_restaurant_by_id_or_name("  the french LAUNDRY ") is restaurants[0]
+
+    def test_falls_back_to_partial_match(self, restaurants):
+        assert resolve_restaurant_by_id_or_name("annex") is restaurants[1]
@@ -3,27 +3,76 @@
 Tests fetch_listing_page_node error handling and _recover_browser without
 a real browser or database.
 """
+from types import SimpleNamespace
 from typing import cast
 
 import pytest
 from unittest.mock import MagicMock, patch
+from playwright.sync_api import Page
+from sqlalchemy.orm import Session
 
+from winerank.crawler import workflow
 from winerank.crawler.workflow import (
     CrawlerState,
     fetch_listing_page_node,
+    _block_heavy_resources,
+    _get_listing_page,
+    _is_transient_error,
+    _note_restaurant_done,
     _recover_browser,
 )
 
 
+# fetch_listing_page_node input shared by the tests below; each test overrides
+# only the keys it cares about.  The node returns new lists rather than
+# mutating the state, so sharing "errors" is safe.
+_BASE_STATE = {
+    "job_id": 1,
+    "site_of_record_id": 1,
+    "michelin_level": "1-star",
+    "current_page": 1,
+    "restaurants_found": 0,
+    "consecutive_fetch_failures": 0,
+    "max_consecutive_failures": 3,
+    "errors": [],
+}
+
+
+# Built once; _mock_site clears what the previous test configured on them
+_SITE = SimpleNamespace(
+    site_url="https://guide.michelin.com/us/en/selection/united-states/restaurants",
+)
+_SESSION = MagicMock(spec=Session)
+
+
 def _mock_site(mock_get_session):
     """Configure get_session mock so SiteOfRecord lookup returns a site with site_url."""
-    mock_session = MagicMock()
-    mock_get_session.return_value.__enter__.return_value = mock_session
-    mock_site = MagicMock()
-    mock_site.site_url = "https://guide.michelin.com/us/en/selection/united-states/restaurants"
-    q = mock_session.query.return_value.filter_by.return_value
-    q.first.return_value = mock_site
-    return mock_session
+    _SESSION.reset_mock(side_effect=True)
+    _SESSION.query.return_value.filter_by.return_value.first.return_value = _SITE
+    mock_get_session.return_value.__enter__.return_value = _SESSION
+    return _SESSION
+
+
+@pytest.fixture(scope="class")
+def _listing_fetch_patches():
+    """Patch the listing page, scraper and get_session once per test class."""
+    with (
+        patch(
+            "winerank.crawler.workflow._get_listing_page",
+            return_value=MagicMock(spec=Page),
+        ) as mock_get_page,
+        patch("winerank.crawler.workflow.MichelinScraper", autospec=True) as mock_scraper_cls,
+        patch("winerank.crawler.workflow.get_session") as mock_get_session,
+    ):
+        yield mock_get_page.return_value, mock_scraper_cls.return_value, mock_get_session
+
+
+@pytest.fixture
+def listing_fetch_patches(_listing_fetch_patches):
+    """The class-wide patches with stubs and call records cleared for this test."""
+    for mock in _listing_fetch_patches:
+        mock.reset_mock(return_value=True, side_effect=True)
+    return _listing_fetch_patches
 
 
 # ------------------------------------------------------------------
@@ -32,148 +81,116 @@ def _mock_site(mock_get_session):
 
 class TestFetchListingPageNodeCircuitBreaker:
 
-    @pytest.fixture(autouse=True)
-    def mock_get_page_and_scraper(self):
-        """Provide a mock page and scraper that raises on scrape_listing_page."""
-        mock_page = MagicMock()
-        with (
-            patch("winerank.crawler.workflow._get_page", return_value=mock_page),
-            patch("winerank.crawler.workflow.MichelinScraper") as mock_scraper_cls,
-        ):
-            mock_scraper = mock_scraper_cls.return_value
-            yield mock_page, mock_scraper
+    @pytest.fixture
+    def mock_get_page_and_scraper(self, listing_fetch_patches):
+        """Provide a mock page, scraper and DB session shared by every test."""
+        mock_page, mock_scraper, mock_get_session = listing_fetch_patches
+        return mock_page, mock_scraper, _mock_site(mock_get_session)
 
     def test_first_failure_increments_counter_and_does_not_advance_page(self, mock_get_page_and_scraper):
-        _, mock_scraper = mock_get_page_and_scraper
+        _, mock_scraper, _ = mock_get_page_and_scraper
         mock_scraper.get_listing_url.return_value = "https://guide.michelin.com/..."
         mock_scraper.scrape_listing_page.side_effect = Exception("Network error")
 
-        state = {
-            "job_id": 1,
-            "site_of_record_id": 1,
-            "michelin_level": "1-star",
-            "current_page": 1,
-            "restaurants_found": 0,
-            "consecutive_fetch_failures": 0,
-            "max_consecutive_failures": 3,
-            "errors": [],
-        }
+        state = dict(_BASE_STATE)
 
-        with patch("winerank.crawler.workflow.get_session") as mock_get_session:
-            _mock_site(mock_get_session)
-            result = fetch_listing_page_node(cast(CrawlerState, state))
+        result = fetch_listing_page_node(cast(CrawlerState, state))
 
         assert result["consecutive_fetch_failures"] == 1
         assert len(result["errors"]) == 1
         assert "Page 1 attempt 1" in result["errors"][0]
         assert "current_page" not in result or result.get("current_page") == 1
 
-    def test_third_failure_trips_circuit_breaker_and_advances_page(self, mock_get_page_and_scraper):
-        _, mock_scraper = mock_get_page_and_scraper
-        mock_scraper.get_listing_url.return_value = "https://guide.michelin.com/..."
-        mock_scraper.scrape_listing_page.side_effect = Exception("Page crashed")
-
-        state = {
-            "job_id": 1,
-            "site_of_record_id": 1,
-            "michelin_level": "1-star",
-            "current_page": 1,
-            "restaurants_found": 0,
-            "consecutive_fetch_failures": 2,
-            "max_consecutive_failures": 3,
-            "errors": [],
-        }
-
-        with (
-            patch("winerank.crawler.workflow.get_session") as mock_get_session,
-            patch("winerank.crawler.workflow._recover_browser") as mock_recover,
-        ):
-            _mock_site(mock_get_session)
-            result = fetch_listing_page_node(cast(CrawlerState, state))
-
-        assert result["consecutive_fetch_failures"] == 3
-        assert result["restaurant_urls"] == []
-        assert result["current_restaurant_idx"] == 0
-        assert result["current_page"] == 2
-        assert len(result["errors"]) == 1
-        mock_recover.assert_called_once()
-
     def test_after_breaker_new_page_failure_count_starts_at_one(self, mock_get_page_and_scraper):
         """When base >= max_failures (e.g. after a skip), next failure is counted as 1."""
-        _, mock_scraper = mock_get_page_and_scraper
+        _, mock_scraper, _ = mock_get_page_and_scraper
         mock_scraper.get_listing_url.return_value = "https://guide.michelin.com/..."
         mock_scraper.scrape_listing_page.side_effect = Exception("Timeout")
 
-        state = {
-            "job_id": 1,
-            "site_of_record_id": 1,
-            "michelin_level": "1-star",
+        state = _BASE_STATE | {
             "current_page": 2,
-            "restaurants_found": 0,
             "consecutive_fetch_failures": 3,
-            "max_consecutive_failures": 3,
-            "errors": [],
         }
 
-        with patch("winerank.crawler.workflow.get_session") as mock_get_session:
-            _mock_site(mock_get_session)
-            result = fetch_listing_page_node(cast(CrawlerState, state))
+        result = fetch_listing_page_node(cast(CrawlerState, state))
 
         assert result["consecutive_fetch_failures"] == 1
         assert "Page 2 attempt 1" in result["errors"][0]
 
-    def test_page_crashed_calls_recover_browser(self, mock_get_page_and_scraper):
-        _, mock_scraper = mock_get_page_and_scraper
+    def test_failure_returns_only_new_error(self, mock_get_page_and_scraper):
+        """Errors are accumulated by the state reducer; the node returns just the new entry."""
+        _, mock_scraper, _ = mock_get_page_and_scraper
         mock_scraper.get_listing_url.return_value = "https://guide.michelin.com/..."
-        mock_scraper.scrape_listing_page.side_effect = Exception("Page.goto: Page crashed")
-
-        state = {
-            "job_id": 1,
-            "site_of_record_id": 1,
-            "michelin_level": "1-star",
-            "current_page": 1,
-            "restaurants_found": 0,
-            "consecutive_fetch_failures": 0,
-            "max_consecutive_failures": 3,
-            "errors": [],
-        }
+        mock_scraper.scrape_listing_page.side_effect = Exception("Network error")
 
-        with (
-            patch("winerank.crawler.workflow.get_session") as mock_get_session,
-            patch("winerank.crawler.workflow._recover_browser") as mock_recover,
-        ):
-            _mock_site(mock_get_session)
-            fetch_listing_page_node(cast(CrawlerState, state))
+        state = _BASE_STATE | {"errors": ["earlier error"]}
 
-        mock_recover.assert_called_once()
+        result = fetch_listing_page_node(cast(CrawlerState, state))
+
+        assert result["errors"] == ["Page 1 attempt 1: Network error"]
 
-    def test_page_closed_calls_recover_browser(self, mock_get_page_and_scraper):
-        _, mock_scraper = mock_get_page_and_scraper
+    def test_transient_error_retried_with_backoff(self, mock_get_page_and_scraper):
+        """A 429 is retried inline and does not count toward the circuit breaker."""
+        _, mock_scraper, _ = mock_get_page_and_scraper
         mock_scraper.get_listing_url.return_value = "https://guide.michelin.com/..."
-        mock_scraper.scrape_listing_page.side_effect = Exception("Page closed")
-
-        state = {
-            "job_id": 1,
-            "site_of_record_id": 1,
-            "michelin_level": "1-star",
-            "current_page": 1,
-            "restaurants_found": 0,
-            "consecutive_fetch_failures": 0,
-            "max_consecutive_failures": 3,
-            "errors": [],
-        }
+        mock_scraper.scrape_listing_page.side_effect = [
+            Exception("Response status 429"),
+            {"restaurant_urls": ["url1"], "total_restaurants": 1, "total_pages": 1},
+        ]
 
-        with (
-            patch("winerank.crawler.workflow.get_session") as mock_get_session,
-            patch("winerank.crawler.workflow._recover_browser") as mock_recover,
-        ):
-            _mock_site(mock_get_session)
-            fetch_listing_page_node(cast(CrawlerState, state))
+        state = dict(_BASE_STATE)
+
+        with patch("winerank.crawler.workflow.time.sleep") as mock_sleep:
+            result = fetch_listing_page_node(cast(CrawlerState, state))
+
+        mock_sleep.assert_called_once()
+        assert result["consecutive_fetch_failures"] == 0
+        assert result["restaurant_urls"] == ["url1"]
+
+    def test_transient_error_counts_after_retries_exhausted(self, mock_get_page_and_scraper):
+        _, mock_scraper, _ = mock_get_page_and_scraper
+        mock_scraper.get_listing_url.return_value = "https://guide.michelin.com/..."
+        mock_scraper.scrape_listing_page.side_effect = Exception("503 Service Unavailable")
+
+        state = dict(_BASE_STATE)
+
+        with patch("winerank.crawler.workflow.time.sleep") as mock_sleep:
+            result = fetch_listing_page_node(cast(CrawlerState, state))
+
+        assert mock_sleep.call_count == 2
+        assert mock_scraper.scrape_listing_page.call_count == 3
+        assert result["consecutive_fetch_failures"] == 1
+
+    @pytest.mark.parametrize("message, failures, trips_breaker", [
+        ("Page crashed", 2, True),
+        ("Page.goto: Page crashed", 0, False),
+        ("Page closed", 0, False),
+    ], ids=["third-failure-trips-breaker", "page-crashed", "page-closed"])
+    def test_browser_failure_calls_recover_browser(
+        self, mock_get_page_and_scraper, message, failures, trips_breaker
+    ):
+        _, mock_scraper, _ = mock_get_page_and_scraper
+        mock_scraper.get_listing_url.return_value = "https://guide.michelin.com/..."
+        mock_scraper.scrape_listing_page.side_effect = Exception(message)
+
+        state = _BASE_STATE | {"consecutive_fetch_failures": failures}
+
+        with patch("winerank.crawler.workflow._recover_browser") as mock_recover:
+            result = fetch_listing_page_node(cast(CrawlerState, state))
 
         mock_recover.assert_called_once()
+        assert result["consecutive_fetch_failures"] == failures + 1
+        assert len(result["errors"]) == 1
+        if trips_breaker:
+            # The failed page is skipped: no URLs and current_page advanced
+            assert result["restaurant_urls"] == []
+            assert result["current_restaurant_idx"] == 0
+            assert result["current_page"] == 2
+        else:
+            assert result.get("current_page", 1) == 1
 
     def test_success_resets_consecutive_fetch_failures(self, mock_get_page_and_scraper):
-        _, mock_scraper = mock_get_page_and_scraper
+        _, mock_scraper, mock_session = mock_get_page_and_scraper
         mock_scraper.get_listing_url.return_value = "https://guide.michelin.com/..."
         mock_scraper.scrape_listing_page.return_value = {
             "restaurant_urls": ["https://guide.michelin.com/us/en/ny/restaurant/one"],
@@ -181,28 +198,28 @@ class TestFetchListingPageNodeCircuitBreaker:
             "total_pages": 1,
         }
 
-        state = {
-            "job_id": 1,
-            "site_of_record_id": 1,
-            "michelin_level": "1-star",
-            "current_page": 1,
-            "restaurants_found": 0,
-            "consecutive_fetch_failures": 2,
-            "max_consecutive_failures": 3,
-            "errors": [],
-        }
+        state = _BASE_STATE | {"consecutive_fetch_failures": 2}
 
-        with patch("winerank.crawler.workflow.get_session") as mock_get_session:
-            mock_session = _mock_site(mock_get_session)
-            mock_job = MagicMock()
-            mock_session.query.return_value.filter_by.return_value.first.side_effect = [
-                mock_session.query.return_value.filter_by.return_value.first.return_value,  # site
-                mock_job,  # job for progress persist
-            ]
-            result = fetch_listing_page_node(cast(CrawlerState, state))
+        result = fetch_listing_page_node(cast(CrawlerState, state))
 
         assert result["consecutive_fetch_failures"] == 0
         assert len(result["restaurant_urls"]) == 1
+        # Progress is persisted with one UPDATE on the job row
+        stmt = mock_session.execute.call_args.args[0]
+        assert stmt.table.name == "jobs"
+        assert stmt.compile().params["restaurants_found"] == 1
+
+
+@pytest.mark.parametrize("message, transient", [
+    ("Response status 429", True),
+    ("503 Service Unavailable", True),
+    ("HTTP error (429): Too Many Requests", True),
+    ("net::ERR_CONNECTION_RESET: Connection reset by peer", True),
+    ("Error scraping restaurant page https://guide.michelin.com/us/en/ny/restaurant/bar-4290: boom", False),
+    ("Timeout 5030ms exceeded", False),
+], ids=["429", "503", "429-in-parens", "connection-reset", "digits-in-url", "digits-in-timeout"])
+def test_is_transient_error(message, transient):
+    assert _is_transient_error(Exception(message)) is transient
 
 
 # ------------------------------------------------------------------
@@ -211,183 +228,230 @@ class TestFetchListingPageNodeCircuitBreaker:
 
 class TestRecoverBrowser:
 
-    def test_no_playwright_instance_returns_without_raising(self):
+    def test_no_playwright_instance_returns_without_raising(self, monkeypatch):
         """When _playwright_instance is None, _recover_browser logs and returns."""
-        with patch("winerank.crawler.workflow._playwright_instance", None):
-            _recover_browser()
+        monkeypatch.setattr(workflow, "_playwright_instance", None)
+        _recover_browser()
         # No exception; may log error
 
+    def test_cdp_browser_is_kept_and_only_page_reopened(self):
+        """With a connected CDP browser, recovery reopens the page without closing the browser."""
+        old_page = MagicMock()
+        browser = MagicMock()
+        browser.is_connected.return_value = True
+        pw = MagicMock()
+        settings = MagicMock(cdp_endpoint="http://localhost:9222")
+        with (
+            patch("winerank.crawler.workflow.get_settings", return_value=settings),
+            patch("winerank.crawler.workflow._playwright_instance", pw),
+            patch("winerank.crawler.workflow._browser", browser),
+            patch("winerank.crawler.workflow._browser_page", old_page),
+        ):
+            _recover_browser()
+
+        old_page.close.assert_called_once()
+        browser.close.assert_not_called()
+        browser.new_context.return_value.new_page.assert_called_once()
+        pw.chromium.connect_over_cdp.assert_not_called()
+        pw.chromium.launch.assert_not_called()
+
+    def test_disconnected_cdp_browser_reconnects(self):
+        """When the CDP browser is gone, recovery reconnects to the endpoint."""
+        browser = MagicMock()
+        browser.is_connected.return_value = False
+        pw = MagicMock()
+        settings = MagicMock(cdp_endpoint="http://localhost:9222")
+        with (
+            patch("winerank.crawler.workflow.get_settings", return_value=settings),
+            patch("winerank.crawler.workflow._playwright_instance", pw),
+            patch("winerank.crawler.workflow._browser", browser),
+            patch("winerank.crawler.workflow._browser_page", MagicMock()),
+        ):
+            _recover_browser()
+
+        browser.close.assert_called_once()
+        pw.chromium.connect_over_cdp.assert_called_once_with("http://localhost:9222")
+        pw.chromium.launch.assert_not_called()
+
 
 # ------------------------------------------------------------------
-# fetch_listing_page_node – paging advancement
+# Browser context recycling
 # ------------------------------------------------------------------
 
-class TestFetchListingPagePagingAdvancement:
-    """Tests that fetch_listing_page_node correctly advances current_page
-    when called after finishing all restaurants on a page."""
+class TestContextRecycling:
 
-    @pytest.fixture(autouse=True)
-    def mock_get_page_and_scraper(self):
-        """Provide a mock page and scraper that returns success."""
-        mock_page = MagicMock()
+    def test_context_recycled_after_limit(self):
+        """Every N finished restaurants the context is closed and a fresh one opened."""
+        browser = MagicMock()
+        old_context = MagicMock()
+        settings = MagicMock(restaurants_per_context=2)
         with (
-            patch("winerank.crawler.workflow._get_page", return_value=mock_page),
-            patch("winerank.crawler.workflow.MichelinScraper") as mock_scraper_cls,
-            patch("winerank.crawler.workflow.get_session") as mock_get_session,
+            patch("winerank.crawler.workflow.get_settings", return_value=settings),
+            patch("winerank.crawler.workflow._browser", browser),
+            patch("winerank.crawler.workflow._browser_context", old_context),
+            patch("winerank.crawler.workflow._browser_page", MagicMock()),
+            patch("winerank.crawler.workflow._restaurants_on_context", 0),
         ):
-            mock_scraper = mock_scraper_cls.return_value
-            mock_session = MagicMock()
-            mock_get_session.return_value.__enter__.return_value = mock_session
-            mock_site = MagicMock()
-            mock_site.site_url = "https://guide.michelin.com/us/en/selection/united-states/restaurants"
-            mock_session.query.return_value.filter_by.return_value.first.side_effect = [
-                mock_site,  # SiteOfRecord lookup
-                None,      # Job lookup for progress
-            ]
-            yield mock_page, mock_scraper
-
-    def test_first_page_fetch_does_not_advance_page(self, mock_get_page_and_scraper):
-        """Initial fetch (empty urls_so_far) should use current_page as-is."""
-        _, mock_scraper = mock_get_page_and_scraper
-        mock_scraper.get_listing_url.return_value = "https://guide.michelin.com/.../page/1"
-        mock_scraper.scrape_listing_page.return_value = {
-            "restaurant_urls": ["url1", "url2", "url3"],
-            "total_restaurants": 100,
-            "total_pages": 3,
-        }
+            _note_restaurant_done()
+            old_context.close.assert_not_called()
+            _note_restaurant_done()
 
-        state = {
-            "job_id": 1,
-            "site_of_record_id": 1,
-            "michelin_level": "3",
-            "current_page": 1,
-            "restaurant_urls": [],  # Empty - first fetch
-            "current_restaurant_idx": 0,
-            "restaurants_found": 0,
-            "consecutive_fetch_failures": 0,
-            "errors": [],
-        }
+        old_context.close.assert_called_once()
+        browser.new_context.assert_called_once_with(
+            storage_state=old_context.storage_state.return_value
+        )
 
-        result = fetch_listing_page_node(cast(CrawlerState, state))
+    def test_no_browser_is_noop(self):
+        with patch("winerank.crawler.workflow._browser", None):
+            _note_restaurant_done()
 
-        # Should fetch page 1 and return current_page: 1
-        mock_scraper.get_listing_url.assert_called_once_with("3", 1)
-        assert result["current_page"] == 1
-        assert result["restaurant_urls"] == ["url1", "url2", "url3"]
-        assert result["total_pages"] == 3
 
-    def test_after_finishing_page_advances_to_next_page(self, mock_get_page_and_scraper):
-        """After processing all restaurants on page 1, should fetch page 2."""
-        _, mock_scraper = mock_get_page_and_scraper
-        mock_scraper.get_listing_url.return_value = "https://guide.michelin.com/.../page/2"
-        mock_scraper.scrape_listing_page.return_value = {
-            "restaurant_urls": ["url4", "url5", "url6"],
-            "total_restaurants": 100,
-            "total_pages": 3,
-        }
+class TestListingContext:
 
-        state = {
-            "job_id": 1,
-            "site_of_record_id": 1,
-            "michelin_level": "3",
-            "current_page": 1,
-            "restaurant_urls": ["url1", "url2", "url3"],  # Previous page's URLs
-            "current_restaurant_idx": 3,  # Finished all (idx >= len)
-            "restaurants_found": 3,
-            "consecutive_fetch_failures": 0,
-            "errors": [],
-        }
+    def test_listing_page_opened_once_in_own_context(self):
+        browser = MagicMock()
+        settings = MagicMock(block_images=False)
+        with (
+            patch("winerank.crawler.workflow.get_settings", return_value=settings),
+            patch("winerank.crawler.workflow._browser", browser),
+            patch("winerank.crawler.workflow._listing_context", None),
+            patch("winerank.crawler.workflow._listing_page", None),
+            patch("winerank.crawler.workflow._listing_storage_state", None),
+        ):
+            first = _get_listing_page()
+            second = _get_listing_page()
 
-        result = fetch_listing_page_node(cast(CrawlerState, state))
+        assert first is second is browser.new_context.return_value.new_page.return_value
+        browser.new_context.assert_called_once_with(storage_state=None)
 
-        # Should detect we finished page 1 and fetch page 2
-        mock_scraper.get_listing_url.assert_called_once_with("3", 2)
-        assert result["current_page"] == 2
-        assert result["restaurant_urls"] == ["url4", "url5", "url6"]
-        assert result["current_restaurant_idx"] == 0  # Reset for new page
+    def test_listing_context_rotates_with_restaurant_context(self):
+        """The listing context is closed too and reopened with its cookies."""
+        browser = MagicMock()
+        listing_context = MagicMock()
+        settings = MagicMock(restaurants_per_context=1, block_images=False)
+        with (
+            patch("winerank.crawler.workflow.get_settings", return_value=settings),
+            patch("winerank.crawler.workflow._browser", browser),
+            patch("winerank.crawler.workflow._browser_context", MagicMock()),
+            patch("winerank.crawler.workflow._browser_page", MagicMock()),
+            patch("winerank.crawler.workflow._listing_context", listing_context),
+            patch("winerank.crawler.workflow._listing_page", MagicMock()),
+            patch("winerank.crawler.workflow._listing_storage_state", None),
+            patch("winerank.crawler.workflow._restaurants_on_context", 0),
+        ):
+            _note_restaurant_done()
+            listing_context.close.assert_called_once()
+            assert workflow._listing_page is None
 
-    def test_middle_of_page_does_not_advance(self, mock_get_page_and_scraper):
-        """In the middle of processing a page, should not advance (shouldn't be called)."""
-        _, mock_scraper = mock_get_page_and_scraper
-        mock_scraper.get_listing_url.return_value = "https://guide.michelin.com/.../page/1"
-        mock_scraper.scrape_listing_page.return_value = {
-            "restaurant_urls": ["url1", "url2", "url3"],
-            "total_restaurants": 100,
-            "total_pages": 3,
-        }
+            browser.new_context.reset_mock()
+            _get_listing_page()
 
-        state = {
-            "job_id": 1,
-            "site_of_record_id": 1,
-            "michelin_level": "3",
-            "current_page": 1,
-            "restaurant_urls": ["url1", "url2", "url3"],
-            "current_restaurant_idx": 1,  # In the middle (idx < len)
-            "restaurants_found": 3,
-            "consecutive_fetch_failures": 0,
-            "errors": [],
-        }
+        browser.new_context.assert_called_once_with(
+            storage_state=listing_context.storage_state.return_value
+        )
 
-        result = fetch_listing_page_node(cast(CrawlerState, state))
+    def test_recovery_closes_listing_context(self):
+        listing_context = MagicMock()
+        with (
+            patch("winerank.crawler.workflow.get_settings", return_value=MagicMock(cdp_endpoint=None)),
+            patch("winerank.crawler.workflow._playwright_instance", MagicMock()),
+            patch("winerank.crawler.workflow._browser", MagicMock()),
+            patch("winerank.crawler.workflow._listing_context", listing_context),
+            patch("winerank.crawler.workflow._listing_page", MagicMock()),
+        ):
+            _recover_browser()
+            assert workflow._listing_page is None
 
-        # Should still use current_page (though normally we wouldn't call fetch_listing_page mid-page)
-        mock_scraper.get_listing_url.assert_called_once_with("3", 1)
-        assert result["current_page"] == 1
+        listing_context.close.assert_called_once()
 
-    def test_advances_through_multiple_pages(self, mock_get_page_and_scraper):
-        """Verify page 2 -> page 3 advancement works too."""
-        _, mock_scraper = mock_get_page_and_scraper
-        mock_scraper.get_listing_url.return_value = "https://guide.michelin.com/.../page/3"
-        mock_scraper.scrape_listing_page.return_value = {
-            "restaurant_urls": ["url7", "url8"],
-            "total_restaurants": 100,
-            "total_pages": 3,
-        }
 
-        state = {
-            "job_id": 1,
-            "site_of_record_id": 1,
-            "michelin_level": "2",
-            "current_page": 2,
-            "restaurant_urls": ["url4", "url5", "url6"],  # Page 2's URLs
-            "current_restaurant_idx": 3,  # Finished page 2
-            "restaurants_found": 6,
-            "consecutive_fetch_failures": 0,
-            "errors": [],
-        }
+class TestResourceBlocking:
 
-        result = fetch_listing_page_node(cast(CrawlerState, state))
+    @staticmethod
+    def _route(resource_type, url="https://restaurant.example.com/page"):
+        route = MagicMock()
+        route.request.resource_type = resource_type
+        route.request.url = url
+        return route
 
-        # Should advance from page 2 to page 3
-        mock_scraper.get_listing_url.assert_called_once_with("2", 3)
-        assert result["current_page"] == 3
-        assert result["restaurant_urls"] == ["url7", "url8"]
+    def test_images_are_aborted(self):
+        route = self._route("image")
+        _block_heavy_resources(route)
+        route.abort.assert_called_once()
+        route.continue_.assert_not_called()
 
-    def test_circuit_breaker_already_advanced_does_not_double_advance(self, mock_get_page_and_scraper):
-        """When circuit breaker already advanced current_page, don't advance again."""
-        _, mock_scraper = mock_get_page_and_scraper
-        mock_scraper.get_listing_url.return_value = "https://guide.michelin.com/.../page/2"
+    def test_tracker_script_is_aborted(self):
+        route = self._route("script", "https://www.googletagmanager.com/gtm.js")
+        _block_heavy_resources(route)
+        route.abort.assert_called_once()
+
+    def test_documents_and_scripts_continue(self):
+        for resource_type in ("document", "script", "stylesheet"):
+            route = self._route(resource_type)
+            _block_heavy_resources(route)
+            route.continue_.assert_called_once()
+            route.abort.assert_not_called()
+
+
+# ------------------------------------------------------------------
+# fetch_listing_page_node – paging advancement
+# ------------------------------------------------------------------
+
+class TestFetchListingPagePagingAdvancement:
+    """Tests that fetch_listing_page_node correctly advances current_page
+    when called after finishing all restaurants on a page."""
+
+    @pytest.fixture
+    def mock_get_page_and_scraper(self, listing_fetch_patches):
+        """Provide a mock page and scraper that returns success."""
+        mock_page, mock_scraper, mock_get_session = listing_fetch_patches
+        mock_session = _mock_site(mock_get_session)
+        return mock_page, mock_scraper, mock_session
+
+    @pytest.mark.parametrize("level, page, urls_so_far, idx, expected_page", [
+        # Initial fetch (empty urls_so_far) uses current_page as-is
+        ("3", 1, [], 0, 1),
+        # All restaurants on page 1 processed (idx >= len): fetch page 2
+        ("3", 1, ["url1", "url2", "url3"], 3, 2),
+        # Mid-page (idx < len) does not advance, though the graph never routes here
+        ("3", 1, ["url1", "url2", "url3"], 1, 1),
+        ("2", 2, ["url4", "url5", "url6"], 3, 3),
+        # The circuit breaker already advanced current_page and emptied the URLs
+        ("3", 2, [], 0, 2),
+    ], ids=[
+        "first-page",
+        "finished-page-advances",
+        "mid-page-stays",
+        "page-2-to-3",
+        "breaker-advanced-no-double-advance",
+    ])
+    def test_fetches_expected_page(
+        self, mock_get_page_and_scraper, level, page, urls_so_far, idx, expected_page
+    ):
+        _, mock_scraper, mock_session = mock_get_page_and_scraper
+        mock_scraper.get_listing_url.return_value = "https://guide.michelin.com/..."
         mock_scraper.scrape_listing_page.return_value = {
-            "restaurant_urls": ["url4", "url5"],
+            "restaurant_urls": ["next1", "next2"],
             "total_restaurants": 100,
             "total_pages": 3,
         }
 
-        state = {
-            "job_id": 1,
-            "site_of_record_id": 1,
-            "michelin_level": "3",
-            "current_page": 2,  # Circuit breaker already advanced this
-            "restaurant_urls": [],  # Empty from circuit breaker
-            "current_restaurant_idx": 0,
-            "restaurants_found": 3,
-            "consecutive_fetch_failures": 0,
-            "errors": [],
+        state = _BASE_STATE | {
+            "michelin_level": level,
+            "current_page": page,
+            "restaurant_urls": urls_so_far,
+            "current_restaurant_idx": idx,
         }
 
         result = fetch_listing_page_node(cast(CrawlerState, state))
 
-        # Should use page 2 as-is (not advance to 3)
-        # because urls_so_far is empty, condition fails
-        mock_scraper.get_listing_url.assert_called_once_with("3", 2)
-        assert result["current_page"] == 2
+        mock_scraper.get_listing_url.assert_called_once_with(level, expected_page)
+        assert result["current_page"] == expected_page
+        assert result["restaurant_urls"] == ["next1", "next2"]
+        assert result["current_restaurant_idx"] == 0
+        # The page count is only read from the first listing page
+        assert result.get("total_pages") == (3 if expected_page == 1 else None)
+        # The fetched page is persisted with one UPDATE on the job row
+        stmt = mock_session.execute.call_args.args[0]
+        assert stmt.table.name == "jobs"
+        assert stmt.compile().params["current_page"] == expected_page
@@ -22,109 +22,60 @@ from winerank.crawler.workflow import (
 
 class TestCountryToLanguageHint:
 
-    def test_france_returns_fr(self):
-        assert _country_to_language_hint("France") == "fr"
-        assert _country_to_language_hint("france") == "fr"
-
-    def test_spain_and_mexico_return_es(self):
-        assert _country_to_language_hint("Spain") == "es"
-        assert _country_to_language_hint("Mexico") == "es"
-        assert _country_to_language_hint("spain") == "es"
-        assert _country_to_language_hint("mexico") == "es"
-
-    def test_usa_and_others_return_en(self):
-        assert _country_to_language_hint("USA") == "en"
-        assert _country_to_language_hint("Canada") == "en"
-        assert _country_to_language_hint("Denmark") == "en"
-
-    def test_none_or_empty_returns_en(self):
-        assert _country_to_language_hint(None) == "en"
-        assert _country_to_language_hint("") == "en"
+    @pytest.mark.parametrize("country, expected", [
+        ("France", "fr"),
+        ("france", "fr"),
+        ("Spain", "es"),
+        ("Mexico", "es"),
+        ("spain", "es"),
+        ("mexico", "es"),
+        ("USA", "en"),
+        ("Canada", "en"),
+        ("Denmark", "en"),
+        (None, "en"),
+        ("", "en"),
+    ])
+    def test_language_hint(self, country, expected):
+        assert _country_to_language_hint(country) == expected
 
 
 # ------------------------------------------------------------------
 # _route_after_process
 # ------------------------------------------------------------------
 
-class TestRouteAfterProcess:
-
-    def test_no_restaurant_goes_to_save(self):
-        state = {"current_restaurant": None}
-        assert _route_after_process(state) == "save_result"
+def _restaurant(crawl_status, website_url: str | None = "https://example.com", force_recrawl=False):
+    return {
+        "current_restaurant": {"website_url": website_url, "crawl_status": crawl_status},
+        "force_recrawl": force_recrawl,
+    }
 
-    def test_has_website_goes_to_crawl(self):
-        state = {
-            "current_restaurant": {
-                "website_url": "https://example.com",
-                "crawl_status": CrawlStatus.HAS_WEBSITE,
-            },
-            "force_recrawl": False,
-        }
-        assert _route_after_process(state) == "crawl_site"
-
-    def test_no_website_goes_to_search_binwise(self):
-        """When no restaurant website found on Michelin page, trigger BinWise search."""
-        state = {
-            "current_restaurant": {
-                "website_url": None,
-                "crawl_status": CrawlStatus.NO_WEBSITE,
-            },
-            "force_recrawl": False,
-        }
-        assert _route_after_process(state) == "search_binwise"
-
-    def test_no_website_empty_string_goes_to_search_binwise(self):
-        """Empty string website_url (e.g. from Michelin scrape) also triggers BinWise."""
-        state = {
-            "current_restaurant": {
-                "name": "Some Restaurant",
-                "website_url": "",
-                "crawl_status": CrawlStatus.NO_WEBSITE,
-            },
-            "force_recrawl": False,
-        }
-        assert _route_after_process(state) == "search_binwise"
 
-    def test_wine_list_found_skips_crawl(self):
-        state = {
-            "current_restaurant": {
-                "website_url": "https://example.com",
-                "crawl_status": CrawlStatus.WINE_LIST_FOUND,
-            },
-            "force_recrawl": False,
-        }
-        assert _route_after_process(state) == "save_result"
-
-    def test_wine_list_found_with_force_crawls(self):
-        state = {
-            "current_restaurant": {
-                "website_url": "https://example.com",
-                "crawl_status": CrawlStatus.WINE_LIST_FOUND,
-            },
-            "force_recrawl": True,
-        }
-        assert _route_after_process(state) == "crawl_site"
-
-    def test_download_failed_does_not_skip(self):
-        """DOWNLOAD_LIST_FAILED restaurants should be re-crawled."""
-        state = {
-            "current_restaurant": {
-                "website_url": "https://example.com",
-                "crawl_status": CrawlStatus.DOWNLOAD_LIST_FAILED,
-            },
-            "force_recrawl": False,
-        }
-        assert _route_after_process(state) == "crawl_site"
+class TestRouteAfterProcess:
 
-    def test_no_wine_list_does_not_skip(self):
-        state = {
-            "current_restaurant": {
-                "website_url": "https://example.com",
-                "crawl_status": CrawlStatus.NO_WINE_LIST,
-            },
-            "force_recrawl": False,
-        }
-        assert _route_after_process(state) == "crawl_site"
+    @pytest.mark.parametrize("state, expected", [
+        ({"current_restaurant": None}, "save_result"),
+        (_restaurant(CrawlStatus.HAS_WEBSITE), "crawl_site"),
+        # No restaurant website found on the Michelin page: try BinWise
+        (_restaurant(CrawlStatus.NO_WEBSITE, website_url=None), "search_binwise"),
+        # An empty string website_url (e.g. from a Michelin scrape) counts as missing
+        (_restaurant(CrawlStatus.NO_WEBSITE, website_url=""), "search_binwise"),
+        (_restaurant(CrawlStatus.WINE_LIST_FOUND), "save_result"),
+        (_restaurant(CrawlStatus.WINE_LIST_FOUND, force_recrawl=True), "crawl_site"),
+        # DOWNLOAD_LIST_FAILED restaurants should be re-crawled
+        (_restaurant(CrawlStatus.DOWNLOAD_LIST_FAILED), "crawl_site"),
+        (_restaurant(CrawlStatus.NO_WINE_LIST), "crawl_site"),
+    ], ids=[
+        "no-restaurant",
+        "has-website",
+        "no-website",
+        "empty-website",
+        "wine-list-found-skips",
+        "wine-list-found-forced",
+        "download-failed",
+        "no-wine-list",
+    ])
+    def test_route(self, state, expected):
+        assert _route_after_process(state) == expected
 
 
 # ------------------------------------------------------------------
@@ -133,25 +84,13 @@ class TestRouteAfterProcess:
 
 class TestRouteAfterCrawl:
 
-    def test_wine_list_url_found(self):
-        state = {
-            "current_restaurant": {
-                "wine_list_url": "https://example.com/wine.pdf",
-            },
-        }
-        assert _route_after_crawl(state) == "download"
-
-    def test_no_wine_list_url(self):
-        state = {
-            "current_restaurant": {
-                "wine_list_url": None,
-            },
-        }
-        assert _route_after_crawl(state) == "search_binwise"
-
-    def test_no_restaurant(self):
-        state = {"current_restaurant": None}
-        assert _route_after_crawl(state) == "save_result"
+    @pytest.mark.parametrize("state, expected", [
+        ({"current_restaurant": {"wine_list_url": "https://example.com/wine.pdf"}}, "download"),
+        ({"current_restaurant": {"wine_list_url": None}}, "search_binwise"),
+        ({"current_restaurant": None}, "save_result"),
+    ], ids=["wine-list-url", "no-wine-list-url", "no-restaurant"])
+    def test_route(self, state, expected):
+        assert _route_after_crawl(state) == expected
 
 
 # ------------------------------------------------------------------
@@ -160,40 +99,37 @@ class TestRouteAfterCrawl:
 
 class TestRouteAfterDownload:
 
-    def test_success_goes_to_extract_text(self):
-        state = {
-            "current_restaurant": {
-                "local_file_path": "/path/to/file.pdf",
-                "download_failed": False,
+    @pytest.mark.parametrize("state, expected", [
+        (
+            {"current_restaurant": {"local_file_path": "/path/to/file.pdf", "download_failed": False}},
+            "extract_text",
+        ),
+        (
+            {
+                "current_restaurant": {
+                    "wine_list_url": "https://example.com/wine.pdf",
+                    "local_file_path": None,
+                    "download_failed": True,
+                },
+                "binwise_searched": False,
             },
-        }
-        assert _route_after_download(state) == "extract_text"
-
-    def test_download_failed_binwise_not_tried_goes_to_search_binwise(self):
-        state = {
-            "current_restaurant": {
-                "wine_list_url": "https://example.com/wine.pdf",
-                "local_file_path": None,
-                "download_failed": True,
-            },
-            "binwise_searched": False,
-        }
-        assert _route_after_download(state) == "search_binwise"
-
-    def test_download_failed_binwise_already_tried_goes_to_save_result(self):
-        state = {
-            "current_restaurant": {
-                "wine_list_url": "https://hub.binwise.com/list/abc",
-                "local_file_path": None,
-                "download_failed": True,
+            "search_binwise",
+        ),
+        (
+            {
+                "current_restaurant": {
+                    "wine_list_url": "https://hub.binwise.com/list/abc",
+                    "local_file_path": None,
+                    "download_failed": True,
+                },
+                "binwise_searched": True,
             },
-            "binwise_searched": True,
-        }
-        assert _route_after_download(state) == "save_result"
-
-    def test_no_restaurant_goes_to_save_result(self):
-        state = {"current_restaurant": None}
-        assert _route_after_download(state) == "save_result"
+            "save_result",
+        ),
+        ({"current_restaurant": None}, "save_result"),
+    ], ids=["success", "failed-binwise-not-tried", "failed-binwise-tried", "no-restaurant"])
+    def test_route(self, state, expected):
+        assert _route_after_download(state) == expected
 
 
 # ------------------------------------------------------------------
@@ -202,123 +138,58 @@ class TestRouteAfterDownload:
 
 class TestRouteAfterBinwise:
 
-    def test_url_found_goes_to_download(self):
-        state = {
-            "current_restaurant": {
-                "wine_list_url": "https://hub.binwise.com/list/xyz",
-            },
-        }
-        assert _route_after_binwise(state) == "download"
-
-    def test_no_url_goes_to_save_result(self):
-        state = {
-            "current_restaurant": {
-                "wine_list_url": None,
-            },
-        }
-        assert _route_after_binwise(state) == "save_result"
-
-    def test_no_restaurant_goes_to_save_result(self):
-        state = {"current_restaurant": None}
-        assert _route_after_binwise(state) == "save_result"
+    @pytest.mark.parametrize("state, expected", [
+        ({"current_restaurant": {"wine_list_url": "https://hub.binwise.com/list/xyz"}}, "download"),
+        ({"current_restaurant": {"wine_list_url": None}}, "save_result"),
+        ({"current_restaurant": None}, "save_result"),
+    ], ids=["url-found", "no-url", "no-restaurant"])
+    def test_route(self, state, expected):
+        assert _route_after_binwise(state) == expected
 
 
 # ------------------------------------------------------------------
 # _route_after_save
 # ------------------------------------------------------------------
 
-class TestRouteAfterSave:
-
-    def test_more_restaurants_on_page(self):
-        state = {
-            "current_restaurant_idx": 2,
-            "restaurant_urls": ["a", "b", "c", "d"],
-            "current_page": 1,
-            "total_pages": 1,
-        }
-        assert _route_after_save(state) == "next_restaurant"
-
-    def test_last_restaurant_single_page_done(self):
-        state = {
-            "current_restaurant_idx": 3,
-            "restaurant_urls": ["a", "b", "c"],
-            "current_page": 1,
-            "total_pages": 1,
-        }
-        assert _route_after_save(state) == "done"
-
-    def test_last_restaurant_more_pages(self):
-        state = {
-            "current_restaurant_idx": 3,
-            "restaurant_urls": ["a", "b", "c"],
-            "current_page": 1,
-            "total_pages": 3,
-        }
-        assert _route_after_save(state) == "next_page"
+def _progress(idx, urls, page, total_pages, failures=None):
+    state = {
+        "current_restaurant_idx": idx,
+        "restaurant_urls": urls,
+        "current_page": page,
+        "total_pages": total_pages,
+    }
+    if failures is not None:
+        state["consecutive_fetch_failures"] = failures
+        state["max_consecutive_failures"] = 3
+    return state
 
-    def test_last_restaurant_last_page_done(self):
-        state = {
-            "current_restaurant_idx": 3,
-            "restaurant_urls": ["a", "b", "c"],
-            "current_page": 3,
-            "total_pages": 3,
-        }
-        assert _route_after_save(state) == "done"
 
-    def test_circuit_breaker_skip_advances_to_next_page(self):
-        """When circuit breaker tripped, current_page already advanced; route to next_page."""
-        state = {
-            "current_restaurant_idx": 0,
-            "restaurant_urls": [],
-            "current_page": 2,  # already advanced past failed page 1
-            "total_pages": 5,
-            "consecutive_fetch_failures": 3,
-            "max_consecutive_failures": 3,
-        }
-        assert _route_after_save(state) == "next_page"
-
-    def test_circuit_breaker_skip_last_page_done(self):
-        """When circuit breaker tripped on last page, current_page past total_pages -> done."""
-        state = {
-            "current_restaurant_idx": 0,
-            "restaurant_urls": [],
-            "current_page": 6,  # advanced past failed page 5
-            "total_pages": 5,
-            "consecutive_fetch_failures": 3,
-            "max_consecutive_failures": 3,
-        }
-        assert _route_after_save(state) == "done"
-
-    def test_circuit_breaker_path_not_taken_when_failures_below_threshold(self):
-        """When total==0 but failures < max, use normal path (next_page = current_page + 1)."""
-        state = {
-            "current_restaurant_idx": 1,
-            "restaurant_urls": [],
-            "current_page": 1,
-            "total_pages": 3,
-            "consecutive_fetch_failures": 2,
-            "max_consecutive_failures": 3,
-        }
-        assert _route_after_save(state) == "next_page"
-
-    def test_circuit_breaker_zero_total_pages_returns_done(self):
-        """When circuit breaker tripped and total_pages is 0, return done."""
-        state = {
-            "current_restaurant_idx": 0,
-            "restaurant_urls": [],
-            "current_page": 1,
-            "total_pages": 0,
-            "consecutive_fetch_failures": 3,
-            "max_consecutive_failures": 3,
-        }
-        assert _route_after_save(state) == "done"
+class TestRouteAfterSave:
 
-    def test_route_after_save_uses_default_failure_counters(self):
-        """Missing consecutive_fetch_failures / max_consecutive_failures default to 0 and 3."""
-        state = {
-            "current_restaurant_idx": 3,
-            "restaurant_urls": ["a", "b", "c"],
-            "current_page": 1,
-            "total_pages": 2,
-        }
-        assert _route_after_save(state) == "next_page"
+    @pytest.mark.parametrize("state, expected", [
+        (_progress(2, ["a", "b", "c", "d"], 1, 1), "next_restaurant"),
+        (_progress(3, ["a", "b", "c"], 1, 1), "done"),
+        (_progress(3, ["a", "b", "c"], 1, 3), "next_page"),
+        (_progress(3, ["a", "b", "c"], 3, 3), "done"),
+        # Circuit breaker tripped: current_page already advanced past failed page 1
+        (_progress(0, [], 2, 5, failures=3), "next_page"),
+        # Circuit breaker tripped on the last page: current_page is past total_pages
+        (_progress(0, [], 6, 5, failures=3), "done"),
+        # No URLs but failures below the threshold: normal path (current_page + 1)
+        (_progress(1, [], 1, 3, failures=2), "next_page"),
+        (_progress(0, [], 1, 0, failures=3), "done"),
+        # Missing failure counters default to 0 and 3
+        (_progress(3, ["a", "b", "c"], 1, 2), "next_page"),
+    ], ids=[
+        "more-restaurants-on-page",
+        "last-restaurant-single-page",
+        "last-restaurant-more-pages",
+        "last-restaurant-last-page",
+        "breaker-skip-next-page",
+        "breaker-skip-last-page",
+        "below-breaker-threshold",
+        "breaker-zero-total-pages",
+        "default-failure-counters",
+    ])
+    def test_route(self, state, expected):
+        assert _route_after_save(state) == expected
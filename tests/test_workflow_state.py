@@ -0,0 +1,217 @@
+"""Unit tests for CrawlerState reducers and buffered result persistence.
+
+Nodes return only increments / new entries for the accumulating fields and
+LangGraph merges them.  Result flushing runs against the in-memory SQLite
+test database; no browser needed.
+"""
+from contextlib import contextmanager
+from typing import cast
+from unittest.mock import patch
+
+import pytest
+from langgraph.graph import StateGraph, START, END
+
+from winerank.common.models import CrawlStatus, Job, JobStatus, Restaurant, SiteOfRecord
+from winerank.crawler import workflow
+from winerank.crawler.workflow import (
+    CrawlerState,
+    _bounded_error_message,
+    complete_job_node,
+    fail_job,
+    save_result_node,
+)
+
+
+def test_save_result_node_returns_processed_increment():
+    state = {
+        "current_restaurant": None,
+        "current_restaurant_idx": 4,
+        "restaurants_processed": 4,
+    }
+    result = save_result_node(cast(CrawlerState, state))
+    assert result == {
+        "current_restaurant_idx": 5,
+        "restaurants_processed": 1,
+        "pending_results": [],
+    }
+
+
+def test_reducers_accumulate_counters_and_logs():
+    """Two nodes reporting increments are summed / concatenated by the graph."""
+
+    def first(state):
+        return {
+            "restaurants_processed": 1,
+            "wine_lists_downloaded": 1,
+            "wine_list_restaurant_names": ["A"],
+            "errors": ["e1"],
+        }
+
+    def second(state):
+        return {
+            "restaurants_processed": 1,
+            "wine_lists_downloaded": 0,
+            "wine_list_restaurant_names": ["B"],
+            "errors": ["e2"],
+        }
+
+    graph = StateGraph(CrawlerState)
+    graph.add_node("first", first)
+    graph.add_node("second", second)
+    graph.add_edge(START, "first")
+    graph.add_edge("first", "second")
+    graph.add_edge("second", END)
+
+    final = graph.compile().invoke(
+        cast(CrawlerState, {"restaurants_processed": 2, "errors": ["e0"]})
+    )
+
+    assert final["restaurants_processed"] == 4
+    assert final["wine_lists_downloaded"] == 1
+    assert final["wine_list_restaurant_names"] == ["A", "B"]
+    assert final["errors"] == ["e0", "e1", "e2"]
+
+
+def test_bounded_error_message_caps_length():
+    assert _bounded_error_message(["a", "bb"]) == "a\nbb"
+    assert _bounded_error_message(["abc", "de"], limit=5) == "abc\nd"
+    assert _bounded_error_message(["abc", "de"], limit=4) == "abc"
+    assert len(_bounded_error_message(["x" * 1500, "y" * 1500])) == 2000
+
+
+# ------------------------------------------------------------------
+# Buffered restaurant results
+# ------------------------------------------------------------------
+
+@pytest.fixture
+def seeded(test_session):
+    """A site, a running job and three restaurants; get_session bound to the test DB."""
+    site = SiteOfRecord(site_name="Michelin Guide USA", site_url="https://example.com")
+    test_session.add(site)
+    test_session.flush()
+    restaurants = [
+        Restaurant(name=f"R{i}", site_of_record_id=site.id, crawl_status=CrawlStatus.HAS_WEBSITE)
+        for i in range(3)
+    ]
+    job = Job(job_type="crawler", status=JobStatus.RUNNING, site_of_record_id=site.id)
+    test_session.add_all(restaurants + [job])
+    test_session.commit()
+
+    @contextmanager
+    def _get_session():
+        yield test_session
+        test_session.commit()
+
+    with patch("winerank.crawler.workflow.get_session", _get_session):
+        yield test_session, job, restaurants
+
+
+def _state(job, restaurant, pending, processed=0) -> CrawlerState:
+    return cast(CrawlerState, {
+        "job_id": job.id,
+        "current_restaurant": restaurant,
+        "current_restaurant_idx": processed,
+        "restaurants_processed": processed,
+        "wine_lists_downloaded": 0,
+        "pending_results": pending,
+    })
+
+
+def test_save_result_buffers_until_batch_size(seeded):
+    session, job, restaurants = seeded
+    rest = {"id": restaurants[0].id, "website_url": "https://r0.example.com"}
+
+    result = save_result_node(_state(job, rest, []))
+
+    assert len(result["pending_results"]) == 1
+    session.expire_all()
+    assert session.get(Restaurant, restaurants[0].id).crawl_status == CrawlStatus.HAS_WEBSITE
+
+
+def test_save_result_flushes_full_batch(seeded):
+    session, job, restaurants = seeded
+    with patch.object(workflow, "_RESULT_BATCH_SIZE", 2):
+        first = save_result_node(_state(
+            job, {"id": restaurants[0].id, "website_url": "https://r0.example.com"}, [],
+        ))
+        second = save_result_node(_state(
+            job,
+            {
+                "id": restaurants[1].id,
+                "wine_list_url": "https://r1.example.com/wine.pdf",
+                "local_file_path": "/tmp/wine.pdf",
+                "crawl_duration_seconds": 1.5,
+            },
+            first["pending_results"],
+            processed=1,
+        ))
+
+    assert second["pending_results"] == []
+    session.expire_all()
+    assert session.get(Restaurant, restaurants[0].id).crawl_status == CrawlStatus.NO_WINE_LIST
+    r1 = session.get(Restaurant, restaurants[1].id)
+    assert r1.crawl_status == CrawlStatus.WINE_LIST_FOUND
+    assert r1.wine_list_url == "https://r1.example.com/wine.pdf"
+    assert r1.last_crawled_at is not None
+    assert session.get(Job, job.id).restaurants_processed == 2
+
+
+def test_save_result_keeps_batch_when_flush_fails(seeded):
+    """A failed flush keeps the buffered results for the next attempt."""
+    _, job, restaurants = seeded
+    with (
+        patch.object(workflow, "_RESULT_BATCH_SIZE", 1),
+        patch.object(workflow, "_flush_restaurant_results", side_effect=RuntimeError("db down")),
+    ):
+        result = save_result_node(_state(job, {"id": restaurants[0].id}, []))
+
+    assert [r["id"] for r in result["pending_results"]] == [restaurants[0].id]
+
+
+def test_complete_job_flushes_remaining_results(seeded):
+    session, job, restaurants = seeded
+    pending = save_result_node(_state(job, {"id": restaurants[2].id}, []))["pending_results"]
+
+    result = complete_job_node(cast(CrawlerState, {
+        "job_id": job.id,
+        "pending_results": pending,
+        "restaurants_processed": 1,
+        "wine_lists_downloaded": 0,
+    }))
+
+    assert result["restaurant_urls"] == [] and result["pending_results"] == []
+
+    session.expire_all()
+    assert session.get(Restaurant, restaurants[2].id).crawl_status == CrawlStatus.NO_WEBSITE
+    done = session.get(Job, job.id)
+    assert done.status == JobStatus.COMPLETED
+    assert done.restaurants_processed == 1
+
+
+def test_persistence_nodes_reuse_crawl_session(seeded):
+    """With a crawl-wide session open, flushing does not open a new one."""
+    session, job, restaurants = seeded
+    with (
+        patch.object(workflow, "_db_session", session),
+        patch.object(workflow, "_RESULT_BATCH_SIZE", 1),
+        patch("winerank.crawler.workflow.get_session") as mock_get_session,
+    ):
+        save_result_node(_state(job, {"id": restaurants[0].id}, []))
+
+    mock_get_session.assert_not_called()
+    session.expire_all()
+    assert session.get(Restaurant, restaurants[0].id).crawl_status == CrawlStatus.NO_WEBSITE
+
+
+def test_fail_job_only_touches_running_jobs(seeded):
+    session, job, _ = seeded
+    fail_job(job.id, "boom")
+    session.expire_all()
+    failed = session.get(Job, job.id)
+    assert failed.status == JobStatus.FAILED
+    assert failed.error_message == "boom"
+
+    # A second failure report must not overwrite the first
+    fail_job(job.id, "later")
+    session.expire_all()
+    assert session.get(Job, job.id).error_message == "boom"